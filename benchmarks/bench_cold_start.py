@@ -0,0 +1,69 @@
+"""
+ATS Resume Studio - Cold start benchmark
+Each sample is a fresh interpreter (what a replica scaled up from zero pays):
+import Streamlit, import the app's startup modules, then run the first script run
+of the Home page (server-side first paint, via AppTest). "eager" imports every
+page module up front, as app.py did before the lazy page registry; "lazy" is the
+current path, where other pages load on first visit.
+
+    python benchmarks/bench_cold_start.py [--runs 7]
+
+Reports medians in ms. For a per-module breakdown run `python -m src.utils.startup`
+or start the app with ATS_PROFILE_IMPORTS=1.
+"""
+from __future__ import annotations
+import argparse, json, os, statistics, subprocess, sys, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child(mode: str) -> None:
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+    t0 = time.perf_counter()
+    import streamlit  # noqa: F401
+    from streamlit.testing.v1 import AppTest
+    t1 = time.perf_counter()
+    import app  # noqa: F401
+    if mode == "eager":
+        from src.ui.pages import PAGES
+        for page in PAGES.values():
+            __import__(page.module)
+    t2 = time.perf_counter()
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60)
+    at.run()
+    t3 = time.perf_counter()
+    if at.exception:
+        raise SystemExit(at.exception[0].value)
+    print(json.dumps({"streamlit": t1 - t0, "app_imports": t2 - t1, "first_run": t3 - t2}))
+
+
+def sample(mode: str) -> dict:
+    t0 = time.perf_counter()
+    out = subprocess.run([sys.executable, __file__, "--child", mode], capture_output=True,
+                         text=True, check=True, cwd=ROOT).stdout
+    row = json.loads(out.strip().splitlines()[-1])
+    row["process"] = time.perf_counter() - t0
+    return row
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--runs", type=int, default=7)
+    ap.add_argument("--child", choices=["eager", "lazy"], help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(args.child)
+    cols = ("streamlit", "app_imports", "first_run", "process")
+    print(f"{'mode':6} " + " ".join(f"{c:>12}" for c in cols))
+    rows = {"eager": [], "lazy": []}
+    for _ in range(args.runs):                  # interleaved, so drift hits both modes alike
+        for mode in rows:
+            rows[mode].append(sample(mode))
+    for mode in rows:
+        med = {c: statistics.median(r[c] for r in rows[mode]) * 1000 for c in cols}
+        print(f"{mode:6} " + " ".join(f"{med[c]:9.0f} ms" for c in cols))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+ATS Resume Studio - DOCX extraction benchmark
+Compares the streaming extractor (src.utils.file_parser._extract_docx) with the
+previous python-docx object-model path on synthetic documents of growing size.
+
+    python benchmarks/bench_docx.py [--sizes 200 2000 20000]
+
+Reports wall time (best of 3) and peak traced memory for each path.
+"""
+from __future__ import annotations
+import argparse, io, os, sys, time, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.utils.file_parser import _extract_docx  # noqa: E402
+
+
+def python_docx_extract(file_bytes: bytes) -> str:
+    """The pre-streaming implementation, kept here as the baseline."""
+    import docx
+    doc = docx.Document(io.BytesIO(file_bytes))
+    paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if cell.text.strip():
+                    paragraphs.append(cell.text.strip())
+    return "\n".join(paragraphs).strip()
+
+
+def build_docx(n_paragraphs: int) -> bytes:
+    """Resume-like document: headings, bullets and a skills table with merged cells
+    every 50 paragraphs."""
+    import docx
+    doc = docx.Document()
+    for i in range(n_paragraphs):
+        if i % 50 == 0:
+            doc.add_heading(f"Experience block {i // 50}", level=2)
+            table = doc.add_table(rows=4, cols=4)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = f"Skill {r}-{c} Python Kubernetes"
+            table.cell(0, 0).merge(table.cell(0, 2))        # horizontal merge
+            table.cell(1, 3).merge(table.cell(3, 3))        # vertical merge
+        doc.add_paragraph(f"Led migration {i} of services to AWS, cutting latency 35% "
+                          f"and saving $120k per year across 12 teams.", style="List Bullet")
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def measure(fn, data: bytes) -> tuple[float, float, int]:
+    best = float("inf")
+    for _ in range(3):
+        t0 = time.perf_counter(); out = fn(data); best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    fn(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    text = out[0] if isinstance(out, tuple) else out
+    return best, peak / 1e6, len(text)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[200, 2000, 20000])
+    args = ap.parse_args()
+    print(f"{'paragraphs':>10} {'docx KB':>8} | {'path':<12} {'seconds':>8} {'peak MB':>8} {'chars':>9}")
+    for n in args.sizes:
+        data = build_docx(n)
+        for name, fn in (("python-docx", python_docx_extract), ("streaming", _extract_docx)):
+            secs, peak, chars = measure(fn, data)
+            print(f"{n:>10} {len(data) // 1024:>8} | {name:<12} {secs:>8.3f} {peak:>8.1f} {chars:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+ATS Resume Studio - Export throughput benchmark
+Documents/sec for PDF vs DOCX on synthetic resumes and cover letters:
+
+  serial        one document after another on this thread (what a download click costs)
+  per-doc setup PDF only: page set-up and fonts rebuilt for every document (the
+                prototype cache cleared each time) — the baseline the prototype replaces
+  batch         export_batch(), spread over the shared parsing process pool
+
+    python benchmarks/bench_export.py [--docs 100] [--font /path/to/Unicode.ttf]
+
+--font sets ATS_PDF_FONT (TTF fonts are where per-document set-up costs most).
+"""
+from __future__ import annotations
+import argparse, os, random, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+VERBS = ["Led", "Built", "Cut", "Shipped", "Migrated", "Designed", "Automated", "Mentored"]
+THINGS = ["the billing pipeline", "40 services to AWS", "a Kafka event bus", "CI from 40 to 9 minutes",
+          "the search ranking model", "on-call runbooks", "a Terraform module library"]
+
+
+def make_resume(rng: random.Random) -> str:
+    lines = [f"Candidate {rng.randint(1, 9999)}", "cand@example.com | +1 555 0100",
+             "PROFESSIONAL SUMMARY", "Backend engineer with 8 years building data platforms in Python.", ""]
+    for job in range(rng.randint(2, 4)):
+        lines += ["EXPERIENCE" if job == 0 else "", f"Senior Engineer — Company {job} (2018–2024)"]
+        lines += [f"- {rng.choice(VERBS)} {rng.choice(THINGS)}, saving ${rng.randint(10, 300)}k per year "
+                  f"across {rng.randint(2, 20)} teams while keeping error budgets intact."
+                  for _ in range(rng.randint(4, 8))]
+    lines += ["EDUCATION", "B.Sc. Computer Science", "Skills:", "Python, SQL, Kubernetes, Terraform, AWS"]
+    return "\n".join(lines)
+
+
+def make_letter(rng: random.Random) -> str:
+    para = ("I am excited to apply for the Senior Engineer role. In my current position I "
+            f"{rng.choice(VERBS).lower()} {rng.choice(THINGS)} and worked closely with product teams. ")
+    return "\n\n".join(["Dear Hiring Manager,"] + [para * rng.randint(2, 4) for _ in range(4)]
+                       + ["Sincerely,", "Candidate"])
+
+
+def rate(fn, docs) -> tuple[float, float]:
+    """(docs/sec, first-document ms)."""
+    t0 = time.perf_counter()
+    fn(docs[:1])
+    first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fn(docs)
+    return len(docs) / (time.perf_counter() - t0), first * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--docs", type=int, default=100)
+    ap.add_argument("--font", help="TTF for PDF text (sets ATS_PDF_FONT)")
+    args = ap.parse_args()
+    if args.font:
+        os.environ["ATS_PDF_FONT"] = args.font
+    from src.utils import exporters as ex
+    from src.utils.file_parser import PDF_WORKERS
+
+    rng = random.Random(7)
+    docs = [((make_resume if i % 3 else make_letter)(rng), "Resume") for i in range(args.docs)]
+    tpl = ex.DEFAULT_TEMPLATE
+
+    def serial(fmt):
+        return lambda batch: [ex.RENDERERS[fmt](c, t, tpl) for c, t in batch]
+
+    def per_doc_setup(batch):
+        out = []
+        for c, t in batch:
+            ex._pdf_prototype.cache_clear()
+            ex._font_bytes.cache_clear()
+            out.append(ex.text_to_pdf_bytes(c, t, tpl))
+        return out
+
+    def batch(fmt):
+        return lambda b: ex.export_batch(b, fmt, tpl)
+
+    cases = [("docx", "serial", serial("docx"))]
+    if ex.pdf_available():
+        cases += [("pdf", "per-doc setup", per_doc_setup), ("pdf", "serial", serial("pdf"))]
+    cases += [("docx", "batch", batch("docx"))]
+    if ex.pdf_available():
+        cases += [("pdf", "batch", batch("pdf"))]
+    else:
+        print("fpdf2 not installed — PDF rows skipped")
+
+    print(f"{args.docs} documents · font {args.font or 'Helvetica (core)'} · "
+          f"{PDF_WORKERS} pool workers on {os.cpu_count()} CPUs")
+    print(f"{'format':<6} {'mode':<14} {'docs/s':>8} {'first doc ms':>13}")
+    for fmt, mode, fn in cases:
+        per_sec, first = rate(fn, docs)
+        print(f"{fmt:<6} {mode:<14} {per_sec:>8.1f} {first:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
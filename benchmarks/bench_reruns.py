@@ -0,0 +1,86 @@
+"""
+ATS Resume Studio - Rerun cost benchmark
+Server time of one interaction on the chat, practice, custom-query and analyzer
+panels with a realistically long session: the full script run (what every Send /
+Submit / Ask cost with st.rerun() on the whole page) against the fragment run
+that replaces it. Uses Streamlit's AppTest, so no browser or API key is needed.
+
+    python benchmarks/bench_reruns.py [--runs 15] [--history 30]
+
+Timings come from src.utils.perf (p50 of --runs runs, warm caches).
+"""
+from __future__ import annotations
+import argparse, os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")     # no bare-mode warnings
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from src.utils.perf import RUN_TIMES  # noqa: E402
+
+RESUME = ("Jane Doe\nSenior Backend Engineer\n\nEXPERIENCE\n"
+          + "\n".join(f"- Built service {i} in Python, Kubernetes and PostgreSQL, cutting latency {i}%"
+                      for i in range(40))
+          + "\n\nSKILLS\nPython, Go, SQL, Kubernetes, Terraform, AWS, Kafka, Redis")
+JD = ("Senior Platform Engineer. Requirements: Python, Kubernetes, Terraform, observability, "
+      "incident response, mentoring. " * 8)
+ANSWER = ("Lead with a two-line story that ties your Kafka migration to the team's reliability goals, "
+          "then quantify the outcome and close with what you would do in the first 90 days. ") * 4
+GRADE = {"score": 72, "grade": "B", "verdict": "Solid structure, thin on results.",
+         "strengths": ["Clear situation", "Owned the action"], "improvements": ["Quantify the result"],
+         "model_answer": ANSWER, "star_breakdown": {"situation": 20, "task": 18, "action": 20, "result": 14}}
+ASSESSMENT = {"ats_score": 68, "score_breakdown": {"format_compatibility": 80, "skills_alignment": 70,
+              "experience_relevance": 65, "education_match": 60},
+              "matched_keywords": [{"keyword": k, "context": "resume"} for k in ("Python", "Kubernetes", "AWS")],
+              "missing_keywords": [{"keyword": k, "why": "JD"} for k in ("Terraform", "observability")],
+              "strengths": ["Backend depth"] * 4, "weaknesses": ["No on-call"] * 4,
+              "recommendations": ["Add metrics"] * 6, "overall_verdict": "Good fit.",
+              "section_feedback": {k: ANSWER for k in ("summary", "experience", "skills",
+                                                       "education", "formatting")}}
+
+SCENARIOS = {
+    # name: (page, fragment, session state builder)
+    "coach chat (Send)": ("🎯 Interview Prep", "interview_chat", lambda n: {
+        "interview_chat_history": [m for i in range(n) for m in
+                                   ({"role": "user", "content": f"Question {i}?"},
+                                    {"role": "assistant", "content": ANSWER})]}),
+    "practice (Submit Answer)": ("🎯 Interview Prep", "practice", lambda n: {
+        "practice_state": "graded", "practice_count": n, "practice_score_total": 72 * n,
+        "practice_history": [{"question": {"question": f"Q{i}", "category": "Behavioral"},
+                              "answer": ANSWER, "grade": GRADE} for i in range(n)]}),
+    "custom query (Ask)": ("🚀 Cool Features", "custom_query", lambda n: {
+        "custom_qa_history": [{"q": f"Question {i}?", "a": ANSWER} for i in range(n)]}),
+    "analyzer inputs (edit / upload)": ("🔍 ATS Analyzer", "analyzer_inputs", lambda n: {
+        "assessment_result": ASSESSMENT}),
+}
+
+
+def measure(page: str, fragment: str, state: dict, runs: int) -> tuple[float, float | None]:
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60)
+    for k, v in {"api_key_verified": True, "api_key": "x", "api_provider": "groq",
+                 "current_page": page, "resume_text": RESUME, "job_description": JD, **state}.items():
+        at.session_state[k] = v
+    at.run()                                     # warm caches
+    RUN_TIMES.clear()
+    for _ in range(runs):
+        at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return RUN_TIMES.percentile("app", 0.5), RUN_TIMES.percentile(f"fragment:{fragment}", 0.5)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--runs", type=int, default=15)
+    ap.add_argument("--history", type=int, default=30, help="chat turns / answers / Q&A items")
+    args = ap.parse_args()
+    print(f"{'interaction':34} {'full page run':>14} {'fragment run':>13} {'speed-up':>9}")
+    for name, (page, fragment, build) in SCENARIOS.items():
+        full, frag = measure(page, fragment, build(args.history), args.runs)
+        frag_s = f"{frag * 1000:10.1f} ms" if frag else f"{'—':>13}"
+        ratio = f"{full / frag:8.1f}x" if frag else f"{'—':>9}"
+        print(f"{name:34} {full * 1000:11.1f} ms {frag_s} {ratio}")
+
+
+if __name__ == "__main__":
+    main()
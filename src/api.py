@@ -0,0 +1,238 @@
+"""
+ATS Resume Studio - HTTP API Service
+The analysis engine as a standalone ASGI app (Starlette), so the compute tier can be
+load-tested, integrated and scaled independently of the Streamlit UI. It runs on
+the async core, so it shares the prompts, the response cache (SQLite tier on disk),
+the pooled clients, the concurrency limits and the retry/circuit-breaker policy.
+
+    uvicorn src.api:app --workers 4          # or: python -m src.api --workers 4
+
+POST /v1/<feature> with a JSON body returns {"result": ..., "seconds": ...}.
+POST /v1/<feature>/stream (optimize, cover-letter, chat, build) returns Server-Sent
+Events: `data: {"delta": "..."}` chunks, then `event: done` (or `event: error`).
+
+LLM credentials come from the body ("provider", "model", "api_key"), or from the
+ATS_PROVIDER / ATS_MODEL / ATS_API_KEY env vars (the provider's usual key variable
+works too). If ATS_SERVICE_TOKEN is set, callers must send
+`Authorization: Bearer <token>`.
+"""
+
+from __future__ import annotations
+import asyncio
+import hmac
+import json
+import math
+import os
+import time
+
+try:
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse, StreamingResponse
+    from starlette.routing import Route
+except ImportError as exc:                       # optional: only the service needs it
+    raise ImportError("The API service needs Starlette: pip install starlette uvicorn") from exc
+
+from src.core.async_llm import (
+    aanalyze_resume, aassess_resume, abuild_resume_from_info, agenerate_cover_letter,
+    agenerate_interview_questions, agenerate_practice_question, aget_interview_chatbot_response,
+    aget_shortlist_accelerator, agrade_interview_answer, aoptimize_resume, astream_llm,
+    match_view,
+)
+from src.core.cache import get_response_cache
+from src.core.clients import client_pool_stats, default_api_key
+from src.core.hedging import LATENCY
+from src.core.llm import _builder_spec, _chatbot_spec, _cover_letter_spec, _optimize_spec
+from src.core.resilience import CircuitOpenError
+
+REQUEST_TIMEOUT = float(os.getenv("ATS_API_TIMEOUT", "120"))
+_SERVICE_TOKEN  = os.getenv("ATS_SERVICE_TOKEN", "")
+
+
+class BadRequest(ValueError):
+    """The request body failed validation (422); raised only by _parse."""
+
+
+# ── Endpoints ────────────────────────────────────────────────────
+async def _amatch(api_key, provider, model, resume_text, job_description, **llm_opts) -> dict:
+    return match_view(await aassess_resume(api_key, provider, model, resume_text,
+                                           job_description, **llm_opts))
+
+# name -> (coroutine, required fields, optional fields with defaults)
+ENDPOINTS = {
+    "analyze":           (aanalyze_resume, ("resume_text", "job_description"), {}),
+    "assess":            (aassess_resume, ("resume_text", "job_description"), {}),
+    "match":             (_amatch, ("resume_text", "job_description"), {}),
+    "shortlist":         (aget_shortlist_accelerator, ("resume_text", "job_description"), {}),
+    "optimize":          (aoptimize_resume, ("resume_text", "job_description"), {}),
+    "cover-letter":      (agenerate_cover_letter, ("resume_text", "job_description"),
+                          {"tone": "Professional", "extra_notes": ""}),
+    "questions":         (agenerate_interview_questions, ("resume_text", "job_description"),
+                          {"num_questions": 8}),
+    "practice-question": (agenerate_practice_question, ("resume_text", "job_description"),
+                          {"asked_questions": [], "category": "Any"}),
+    "grade":             (agrade_interview_answer,
+                          ("question", "user_answer", "resume_text", "job_description"), {}),
+    "chat":              (aget_interview_chatbot_response,
+                          ("resume_text", "job_description", "chat_history"), {}),
+    "build":             (abuild_resume_from_info, ("user_info",), {}),
+}
+
+# Body fields that are not plain strings; every other feature field must be a string.
+FIELD_TYPES = {
+    "num_questions":   int,
+    "asked_questions": list,
+    "chat_history":    list,
+    "user_info":       dict,
+}
+
+# Long generators that can also stream: name -> prompt spec builder (same fields as above).
+STREAMS = {
+    "optimize":     _optimize_spec,
+    "cover-letter": _cover_letter_spec,
+    "chat":         _chatbot_spec,
+    "build":        _builder_spec,
+}
+
+
+# ── Request handling ─────────────────────────────────────────────
+def _check_field(name: str, value) -> None:
+    want = FIELD_TYPES.get(name, str)
+    if not isinstance(value, want) or isinstance(value, bool):
+        raise BadRequest(f"'{name}' must be {'an' if want is int else 'a'} {want.__name__}")
+    if name == "num_questions" and not 1 <= value <= 30:
+        raise BadRequest("'num_questions' must be between 1 and 30")
+    if name == "chat_history" and not (value and all(
+            isinstance(m, dict) and isinstance(m.get("content"), str) for m in value)):
+        raise BadRequest("'chat_history' must be a list of {\"role\", \"content\"} messages")
+
+def _timeout(value) -> float:
+    """Seconds from the body's "timeout", capped at REQUEST_TIMEOUT."""
+    if value is None:
+        return REQUEST_TIMEOUT
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise BadRequest("'timeout' must be a number of seconds")
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise BadRequest("'timeout' must be a number of seconds") from None
+    if not math.isfinite(seconds) or seconds <= 0:
+        raise BadRequest("'timeout' must be greater than 0")
+    return min(seconds, REQUEST_TIMEOUT)
+
+async def _parse(request: Request, name: str) -> tuple[tuple, list, float]:
+    """(connection, positional feature args, timeout) from the JSON body."""
+    if _SERVICE_TOKEN:
+        sent = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(sent, _SERVICE_TOKEN):
+            raise PermissionError("missing or invalid service token")
+    try:
+        body = await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        raise BadRequest("body must be JSON")
+    if not isinstance(body, dict):
+        raise BadRequest("body must be a JSON object")
+    _, required, optional = ENDPOINTS[name]
+    missing = [f for f in required if body.get(f) in (None, "")]
+    if missing:
+        raise BadRequest(f"missing field(s): {', '.join(missing)}")
+    for f in ("provider", "model", "api_key"):
+        if body.get(f) is not None:
+            _check_field(f, body[f])
+    provider = body.get("provider") or os.getenv("ATS_PROVIDER", "groq")
+    model = body.get("model") or os.getenv("ATS_MODEL", "llama-3.3-70b-versatile")
+    api_key = body.get("api_key") or default_api_key(provider)
+    if not api_key:
+        raise BadRequest(f"no API key for provider '{provider}'")
+    args = [body[f] for f in required] + [body.get(f, d) for f, d in optional.items()]
+    for f, value in zip((*required, *optional), args):
+        _check_field(f, value)
+    return (api_key, provider, model), args, _timeout(body.get("timeout"))
+
+def _error(exc: BaseException) -> JSONResponse:
+    if isinstance(exc, PermissionError):
+        return JSONResponse({"error": str(exc)}, status_code=401)
+    if isinstance(exc, BadRequest):
+        return JSONResponse({"error": str(exc)}, status_code=422)
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+        return JSONResponse({"error": "request timed out"}, status_code=504)
+    if isinstance(exc, CircuitOpenError):
+        return JSONResponse({"error": str(exc)}, status_code=503, headers={"Retry-After": "30"})
+    if isinstance(exc, ValueError):               # model reply wasn't the JSON we asked for
+        return JSONResponse({"error": str(exc)[:300]}, status_code=502)
+    status = getattr(exc, "status_code", None)
+    if status in (401, 403, 429):
+        return JSONResponse({"error": str(exc)[:300]}, status_code=status)
+    return JSONResponse({"error": f"upstream error: {str(exc)[:300]}"}, status_code=502)
+
+async def call_feature(request: Request):
+    name = request.path_params["feature"]
+    if name not in ENDPOINTS:
+        return JSONResponse({"error": f"unknown feature '{name}'"}, status_code=404)
+    t0 = time.perf_counter()
+    try:
+        conn, args, timeout = await _parse(request, name)
+        fn = ENDPOINTS[name][0]
+        result = await asyncio.wait_for(fn(*conn, *args, deadline=timeout), timeout)
+    except Exception as exc:
+        return _error(exc)
+    if isinstance(result, str):
+        result = {"text": result}
+    return JSONResponse({"result": result, "seconds": round(time.perf_counter() - t0, 3)})
+
+def _sse(event: str | None, data: dict) -> str:
+    head = f"event: {event}\n" if event else ""
+    return f"{head}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+async def stream_feature(request: Request):
+    name = request.path_params["feature"]
+    if name not in STREAMS:
+        return JSONResponse({"error": f"'{name}' has no stream endpoint"}, status_code=404)
+    try:
+        conn, args, timeout = await _parse(request, name)
+        spec = STREAMS[name](*args)
+    except Exception as exc:
+        return _error(exc)
+
+    async def events():
+        # A client disconnect cancels this generator, which closes the upstream stream
+        # and frees its concurrency slot.
+        t0 = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                async for chunk in astream_llm(*conn, deadline=timeout, **spec):
+                    yield _sse(None, {"delta": chunk})
+            yield _sse("done", {"seconds": round(time.perf_counter() - t0, 3)})
+        except Exception as exc:
+            yield _sse("error", json.loads(_error(exc).body))
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+async def health(request: Request):
+    cache = get_response_cache()
+    return JSONResponse({"ok": True, "features": sorted(ENDPOINTS), "streams": sorted(STREAMS),
+                         "cache": cache.stats() if cache else None,
+                         "clients": client_pool_stats(), "latency": LATENCY.stats()})
+
+
+app = Starlette(routes=[
+    Route("/health", health),
+    Route("/v1/{feature}", call_feature, methods=["POST"]),
+    Route("/v1/{feature}/stream", stream_feature, methods=["POST"]),
+])
+
+
+def main(argv=None) -> None:
+    import argparse
+    import uvicorn
+    p = argparse.ArgumentParser(prog="python -m src.api", description="ATS Resume Studio API")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8000)
+    p.add_argument("--workers", type=int, default=1, help="worker processes (each runs its own event loop)")
+    args = p.parse_args(argv)
+    uvicorn.run("src.api:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""
+ATS Resume Studio - Headless CLI
+Bulk analysis without a browser: same prompts, cache, client pool and retry policy
+as the app.
+
+    python -m src.cli analyze resumes/ --jd job.txt -o scores.jsonl --checkpoint scores.ckpt
+    python -m src.cli questions batch.jsonl --provider openai --model gpt-4o-mini -c 8
+    python -m src.cli export letters/ --format pdf -o letters.zip     # no API key needed
+
+Inputs are resume files (PDF/DOCX/TXT), directories of them, or JSONL with one
+record per line: {"id", "resume" | "resume_path", "jd" | "jd_path"} — a record's own
+JD overrides --jd. "-" reads JSONL from stdin. Results are streamed as JSONL in
+completion order; with --checkpoint, finished records are skipped on the next run
+and output is appended, so an interrupted nightly run just resumes.
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from src.core.async_llm import (
+    aanalyze_resume, aassess_resume, agenerate_interview_questions, aoptimize_resume,
+    match_view, shortlist_view,
+)
+from src.core.cache import get_response_cache
+from src.core.clients import KEY_ENV, default_api_key
+from src.utils.doc_store import parse_document
+
+RESUME_TYPES = {".pdf", ".docx", ".txt"}
+
+
+# ── Commands ─────────────────────────────────────────────────────
+async def _analyze(conn, resume, jd, opts, args):
+    return await aanalyze_resume(*conn, resume, jd, **opts)
+
+async def _optimize(conn, resume, jd, opts, args):
+    return {"text": await aoptimize_resume(*conn, resume, jd, **opts)}
+
+async def _match(conn, resume, jd, opts, args):
+    return match_view(await aassess_resume(*conn, resume, jd, **opts))
+
+async def _shortlist(conn, resume, jd, opts, args):
+    return shortlist_view(await aassess_resume(*conn, resume, jd, **opts))
+
+async def _questions(conn, resume, jd, opts, args):
+    return await agenerate_interview_questions(*conn, resume, jd, args.num_questions, **opts)
+
+COMMANDS = {
+    "analyze":   (_analyze,   "ATS score, keyword gaps and feedback"),
+    "optimize":  (_optimize,  "ATS-optimised rewrite of each resume"),
+    "match":     (_match,     "match %%, top matched/missing keywords, quick win"),
+    "shortlist": (_shortlist, "shortlist probability, gaps and accelerators"),
+    "questions": (_questions, "interview questions with model answers"),
+}
+
+
+# ── Inputs ───────────────────────────────────────────────────────
+def _read_text(path: Path) -> str:
+    doc = parse_document(path.read_bytes(), path.name)
+    if doc.error:
+        raise ValueError(doc.error)
+    return doc.text
+
+def _jd_arg(value: str | None) -> str:
+    """--jd is a file path or the JD text itself. Inline text can exceed the OS's
+    filename limit, where is_file() raises instead of returning False."""
+    if not value:
+        return ""
+    try:
+        is_file = Path(value).is_file()
+    except (OSError, ValueError):                 # name too long, embedded NUL
+        is_file = False
+    return _read_text(Path(value)) if is_file else value
+
+def _file_record(path: Path) -> dict:
+    try:
+        return {"id": str(path), "resume": _read_text(path)}
+    except (OSError, ValueError) as e:
+        return {"id": str(path), "error": str(e)}
+
+def _jsonl_records(lines, source: str):
+    for n, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            rec = json.loads(line)
+            rid = str(rec.get("id") or f"{source}:{n}")
+            resume = rec.get("resume") or rec.get("resume_text")
+            if resume is None and rec.get("resume_path"):
+                resume = _read_text(Path(rec["resume_path"]))
+            jd = rec.get("jd") or rec.get("job_description")
+            if jd is None and rec.get("jd_path"):
+                jd = _read_text(Path(rec["jd_path"]))
+            if not resume:
+                raise ValueError("record has no resume / resume_path")
+            yield {"id": rid, "resume": resume, "jd": jd, "title": rec.get("title")}
+        except (json.JSONDecodeError, AttributeError, OSError, ValueError) as e:
+            yield {"id": f"{source}:{n}", "error": f"bad record: {e}"}
+
+def iter_records(inputs: list[str]):
+    """Lazily yield {"id", "resume", "jd"?} or {"id", "error"} dicts."""
+    for spec in inputs:
+        path = Path(spec)
+        if spec == "-":
+            yield from _jsonl_records(sys.stdin, "stdin")
+        elif path.is_dir():
+            for f in sorted(path.rglob("*")):
+                if f.is_file() and f.suffix.lower() in RESUME_TYPES and not f.name.startswith((".", "~$")):
+                    yield _file_record(f)
+        elif path.suffix.lower() == ".jsonl":
+            with open(path, encoding="utf-8") as fh:
+                yield from _jsonl_records(fh, str(path))
+        else:
+            yield _file_record(path)
+
+
+# ── Runner ───────────────────────────────────────────────────────
+def _record_key(command: str, rec: dict, jd: str) -> str:
+    digest = hashlib.sha256(f"{rec.get('resume', '')}\0{jd}".encode("utf-8")).hexdigest()[:16]
+    return f"{command}:{rec['id']}:{digest}"
+
+def _load_checkpoint(path: Path | None) -> set:
+    if path is None or not path.exists():
+        return set()
+    with open(path, encoding="utf-8") as fh:
+        return {line.strip() for line in fh if line.strip()}
+
+async def run(args) -> dict:
+    handler = COMMANDS[args.command][0]
+    conn = (args.api_key, args.provider, args.model)
+    opts = {"use_cache": not args.no_cache, "deadline": args.timeout}
+    default_jd = _jd_arg(args.jd)
+    ckpt_path = Path(args.checkpoint) if args.checkpoint else None
+    done_keys = _load_checkpoint(ckpt_path)
+
+    out = open(args.output, "a" if ckpt_path else "w", encoding="utf-8") if args.output != "-" else sys.stdout
+    ckpt = open(ckpt_path, "a", encoding="utf-8") if ckpt_path else None
+    stats = {"ok": 0, "failed": 0, "skipped": 0, "latencies": []}
+    sem = asyncio.Semaphore(max(1, args.concurrency))
+    pending: set[asyncio.Task] = set()
+
+    def emit(row: dict, key: str | None) -> None:
+        out.write(json.dumps(row, ensure_ascii=False) + "\n"); out.flush()
+        if ckpt and key:
+            ckpt.write(key + "\n"); ckpt.flush()
+
+    async def process(rec: dict, jd: str, key: str) -> None:
+        t0 = time.perf_counter()
+        try:
+            result = await handler(conn, rec["resume"], jd, opts, args)
+            row = {"id": rec["id"], "command": args.command, "ok": True, "result": result}
+            stats["ok"] += 1
+        except Exception as e:
+            row, key = {"id": rec["id"], "command": args.command, "ok": False, "error": str(e)}, None
+            stats["failed"] += 1                  # failures stay out of the checkpoint: retried next run
+        finally:
+            sem.release()
+        row["seconds"] = round(time.perf_counter() - t0, 3)
+        stats["latencies"].append(row["seconds"])
+        emit(row, key)
+
+    records = iter_records(args.inputs)
+    try:
+        while True:
+            rec = await asyncio.to_thread(next, records, None)     # parsing stays off the loop
+            if rec is None:
+                break
+            if "error" in rec:
+                stats["failed"] += 1
+                emit({"id": rec["id"], "command": args.command, "ok": False, "error": rec["error"]}, None)
+                continue
+            jd = rec.get("jd") or default_jd
+            if not jd:
+                stats["failed"] += 1
+                emit({"id": rec["id"], "command": args.command, "ok": False,
+                      "error": "no job description (use --jd or a 'jd' field)"}, None)
+                continue
+            key = _record_key(args.command, rec, jd)
+            if key in done_keys:
+                stats["skipped"] += 1
+                continue
+            await sem.acquire()
+            task = asyncio.create_task(process(rec, jd, key))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if ckpt:
+            ckpt.close()
+    return stats
+
+def _summary(command: str, stats: dict, seconds: float) -> str:
+    lat = sorted(stats["latencies"])
+    pct = lambda q: lat[min(len(lat) - 1, int(q * len(lat)))] if lat else 0.0
+    done = stats["ok"] + stats["failed"]
+    lines = [f"{command}: {done} processed ({stats['ok']} ok, {stats['failed']} failed), "
+             f"{stats['skipped']} skipped via checkpoint in {seconds:.1f}s — "
+             f"{done / seconds if seconds else 0:.2f} records/s",
+             f"latency p50 {pct(0.5):.2f}s · p95 {pct(0.95):.2f}s · max {pct(1.0):.2f}s"]
+    cache = get_response_cache()
+    if cache is not None:
+        c = cache.stats()
+        lines.append(f"cache: {c['memory_hits'] + c['disk_hits']} hits · {c['misses']} misses "
+                     f"({c['hit_rate']:.0%})")
+    return "\n".join(lines)
+
+
+# ── Export (no LLM) ──────────────────────────────────────────────
+def _file_stem(record_id: str) -> str:
+    path = Path(record_id)
+    stem = path.stem if path.suffix.lower() in RESUME_TYPES else path.name
+    return re.sub(r"[^\w.-]+", "_", stem).strip("._") or "document"
+
+def export(args) -> int:
+    """Render every input to PDF/DOCX: into a zip when -o ends in .zip, else a directory."""
+    from src.utils.exporters import export_batch, export_zip, unique_filenames
+    records = list(iter_records(args.inputs))
+    bad = [r for r in records if "error" in r]
+    for rec in bad:
+        print(f"{rec['id']}: {rec['error']}", file=sys.stderr)
+    docs = [(_file_stem(r["id"]), r["resume"], r.get("title") or args.title)
+            for r in records if "error" not in r]
+    if not docs:
+        print("Nothing to export.", file=sys.stderr)
+        return 1
+    t0 = time.perf_counter()
+    out = Path(args.output)
+    if out.suffix.lower() == ".zip":
+        out.write_bytes(export_zip(docs, args.format, args.template))
+    else:
+        out.mkdir(parents=True, exist_ok=True)
+        files = export_batch([(content, title) for _, content, title in docs], args.format, args.template)
+        for name, data in zip(unique_filenames([stem for stem, _, _ in docs], args.format), files):
+            (out / name).write_bytes(data)
+    seconds = time.perf_counter() - t0
+    print(f"export: {len(docs)} {args.format.upper()} files → {out} ({len(bad)} unreadable) "
+          f"in {seconds:.1f}s — {len(docs) / seconds if seconds else 0:.1f} docs/s", file=sys.stderr)
+    return 1 if bad else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m src.cli", description="ATS Resume Studio — batch mode")
+    sub = p.add_subparsers(dest="command", required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        s = sub.add_parser(name, help=help_text)
+        s.add_argument("inputs", nargs="+", help="resume files, directories, .jsonl files, or - for stdin")
+        s.add_argument("--jd", help="job description file or text (records may carry their own)")
+        s.add_argument("-o", "--output", default="-", help="output JSONL (default: stdout)")
+        s.add_argument("--provider", default=os.getenv("ATS_PROVIDER", "groq"),
+                       choices=["groq", "openai", "anthropic", "openrouter", "together", "ollama"])
+        s.add_argument("--model", default=os.getenv("ATS_MODEL", "llama-3.3-70b-versatile"))
+        s.add_argument("--api-key", default=None,
+                       help="defaults to ATS_API_KEY or the provider's usual env var; "
+                            "for ollama, the server URL")
+        s.add_argument("-c", "--concurrency", type=int, default=4,
+                       help="records in flight (ATS_MAX_CONCURRENCY still caps requests)")
+        s.add_argument("--timeout", type=float, default=None,
+                       help="seconds per record across retries (default ATS_REQUEST_DEADLINE)")
+        s.add_argument("--no-cache", action="store_true", help="bypass the response cache")
+        s.add_argument("--checkpoint", help="progress file; finished records are skipped on rerun")
+        if name == "questions":
+            s.add_argument("--num-questions", type=int, default=8)
+    from src.utils.exporters import DEFAULT_TEMPLATE, TEMPLATES
+    s = sub.add_parser("export", help="render resumes / cover letters to PDF or DOCX (no LLM)")
+    s.add_argument("inputs", nargs="+", help="text/resume files, directories, .jsonl files, or - for stdin")
+    s.add_argument("-o", "--output", required=True, help="a .zip file, or a directory to write into")
+    s.add_argument("-f", "--format", default="pdf", choices=["pdf", "docx"])
+    s.add_argument("--template", default=DEFAULT_TEMPLATE, choices=list(TEMPLATES))
+    s.add_argument("--title", default="Resume", help="document title (JSONL records may carry 'title')")
+    return p
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "export":
+        return export(args)
+    args.api_key = args.api_key or default_api_key(args.provider)
+    if not args.api_key:
+        print(f"No API key: pass --api-key or set ATS_API_KEY / {KEY_ENV[args.provider]}.",
+              file=sys.stderr)
+        return 2
+    t0 = time.perf_counter()
+    try:
+        stats = asyncio.run(run(args))
+    except BrokenPipeError:                       # `| head` closed stdout: stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 141
+    except KeyboardInterrupt:
+        print("Interrupted." + (" Rerun with the same --checkpoint to resume." if args.checkpoint else ""),
+              file=sys.stderr)
+        return 130
+    print(_summary(args.command, stats, time.perf_counter() - t0), file=sys.stderr)
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -65,12 +65,17 @@ def init_session_state():
         "current_page": "🏠 Home",
         "resume_text": "",
         "job_description": "",
-        "analysis_result": None,
+        "assessment_result": None,
         "optimized_resume": "",
         "cover_letter": "",
         "interview_qa": [],
         "built_resume": {},
+        "built_resume_text": "",    # Builder draft; copied to resume_text when accepted
         "api_key_verified": False,
+        "hedge": None,              # HedgePolicy for the backup provider, set in the sidebar
+        "jobs": {},                 # background job id -> Job (see src/ui/jobs.py)
+        "job_errors": {},           # job kind -> error of its last failed run
+        "export_template": "classic",
         # Practice coach
         "practice_state": "idle",
         "practice_question": {},
@@ -79,11 +84,14 @@ def init_session_state():
         "practice_count": 0,
         "practice_asked": [],
         # Cool features
-        "match_result": None,
-        "shortlist_result": None,
         "custom_qa_history": [],
         "interview_chat_history": [],
         "temp_chat": "",
+        "jd_library_results": {},   # saved JD id -> AI score/verdict for this session
+        # Recruiter batch
+        "batch_candidates": [],
+        "batch_skipped": [],
+        "batch_timing": {},
     }
     for key, val in defaults.items():
         if key not in st.session_state:
@@ -0,0 +1,246 @@
+"""
+ATS Resume Studio v3 - Async LLM Core
+asyncio-native mirror of src.core.llm: same prompts, same cache, async SDK clients.
+
+Concurrency is bounded twice: a global semaphore caps in-flight requests for the
+process, and a per-provider semaphore keeps us inside each provider's rate limits.
+Sync callers (the Streamlit script thread) use run_async(), which executes on one
+long-lived background loop so pooled async connections survive across reruns.
+"""
+from __future__ import annotations
+import asyncio, concurrent.futures, os, threading, time, weakref
+
+from src.core.cache import cache_key, get_response_cache
+from src.core.clients import get_pooled_async_client
+from src.core.hedging import LATENCY, backup_feature, hedged, usable_hedge
+from src.core.resilience import acall_with_retries, astream_with_retries, policy_for
+from src.core.llm import (
+    _NO_JSON_MODE, _anthropic_text, _assess_spec, _builder_spec, _chatbot_spec,
+    _cover_letter_spec, _grade_spec, _json_mode_kwargs, _messages, _optimize_spec,
+    _practice_spec, _question_list, _questions_spec, _record_parse, _rejected_json_mode,
+    _safe_json_loads,
+    analysis_view, format_match_text, match_view, shortlist_view,
+)
+
+MAX_CONCURRENCY = int(os.getenv("ATS_MAX_CONCURRENCY", "8"))
+PROVIDER_CONCURRENCY = {
+    "groq": 4, "openai": 8, "anthropic": 4,
+    "openrouter": 4, "together": 4, "ollama": 2,
+}
+
+# Semaphores bind to the loop that first awaits them, so keep one set per loop.
+_LIMITS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+
+def _limits(provider: str) -> tuple[asyncio.Semaphore, asyncio.Semaphore]:
+    loop = asyncio.get_running_loop()
+    sems = _LIMITS.get(loop)
+    if sems is None:
+        sems = _LIMITS[loop] = {"*": asyncio.Semaphore(MAX_CONCURRENCY)}
+    if provider not in sems:
+        sems[provider] = asyncio.Semaphore(PROVIDER_CONCURRENCY.get(provider, 4))
+    return sems["*"], sems[provider]
+
+# ── Background loop for sync callers ─────────────────────────────
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_LOCK = threading.Lock()
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="llm-async-loop", daemon=True).start()
+        return _LOOP
+
+def submit_async(coro) -> concurrent.futures.Future:
+    """Schedule a coroutine on the shared background loop without waiting."""
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop())
+
+def run_async(coro, timeout: float | None = None):
+    """Run a coroutine from sync code on the shared background loop and wait for it."""
+    return submit_async(coro).result(timeout)
+
+# ── Universal async call ─────────────────────────────────────────
+async def _acomplete(c, provider, model, prompt, system_prompt, temperature, max_tokens,
+                     timeout=None, json_mode=False) -> str:
+    extra = _json_mode_kwargs(provider, model, json_mode)
+    try:
+        if provider == "anthropic":
+            r = await c.messages.create(model=model, max_tokens=max_tokens, temperature=temperature,
+                system=system_prompt or "You are a helpful assistant.",
+                messages=[{"role":"user","content":prompt}], timeout=timeout, **extra)
+            return _anthropic_text(r)
+        r = await c.chat.completions.create(model=model, messages=_messages(prompt, system_prompt),
+                                            temperature=temperature, max_tokens=max_tokens,
+                                            timeout=timeout, **extra)
+        return r.choices[0].message.content.strip()
+    except Exception as exc:
+        if not extra or not _rejected_json_mode(exc):
+            raise
+        _NO_JSON_MODE.add((provider, model))
+        return await _acomplete(c, provider, model, prompt, system_prompt, temperature,
+                                max_tokens, timeout)
+
+async def _astream_chunks(c, provider, model, prompt, system_prompt, temperature, max_tokens,
+                          timeout):
+    if provider == "anthropic":
+        async with c.messages.stream(model=model, max_tokens=max_tokens, temperature=temperature,
+                system=system_prompt or "You are a helpful assistant.",
+                messages=[{"role":"user","content":prompt}], timeout=timeout) as s:
+            async for text in s.text_stream:
+                yield text
+    else:
+        s = await c.chat.completions.create(model=model, messages=_messages(prompt, system_prompt),
+                                            temperature=temperature, max_tokens=max_tokens,
+                                            stream=True, timeout=timeout)
+        async with s:
+            async for chunk in s:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+async def acall_llm(api_key, provider, model, prompt, system_prompt="", temperature=0.3,
+                    max_tokens=1200, use_cache=True, deadline=None, feature="", hedge=None,
+                    validate=None, json_mode=False) -> str:
+    hedge = usable_hedge(hedge, provider, model)
+    if hedge is not None:
+        def leg(key, prov, mdl, label):
+            return lambda: acall_llm(key, prov, mdl, prompt, system_prompt, temperature,
+                                     max_tokens, use_cache, deadline, label,
+                                     json_mode=json_mode)
+        started = time.monotonic()
+        text, winner = await hedged(leg(api_key, provider, model, feature),
+                                    leg(hedge.api_key, hedge.provider, hedge.model, backup_feature(feature)),
+                                    LATENCY.threshold(feature, hedge), validate)
+        if winner == "secondary":
+            # The losing primary was cancelled before recording; its elapsed time is a lower
+            # bound, and leaving it out would let slow primaries drop out of the p90.
+            LATENCY.record(feature, time.monotonic() - started)
+        return text
+    cache = get_response_cache() if use_cache else None
+    key = cache_key(provider, model, system_prompt, prompt, temperature, max_tokens)
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+    global_sem, provider_sem = _limits(provider)
+    c, started = get_pooled_async_client(api_key, provider), time.monotonic()
+
+    async def attempt(timeout):
+        # Hold the slots per attempt only, so a request sleeping in backoff frees them.
+        async with global_sem, provider_sem:
+            return await _acomplete(c, provider, model, prompt, system_prompt,
+                                    temperature, max_tokens, timeout, json_mode)
+    text = await acall_with_retries(attempt, provider, policy_for(deadline))
+    LATENCY.record(feature, time.monotonic() - started)
+    if cache is not None:
+        cache.set(key, text)
+    return text
+
+async def astream_llm(api_key, provider, model, prompt, system_prompt="", temperature=0.3,
+                      max_tokens=1200, use_cache=True, deadline=None, feature="", hedge=None):
+    """Async generator of text chunks; holds a concurrency slot while a stream is open."""
+    cache = get_response_cache() if use_cache else None
+    key = cache_key(provider, model, system_prompt, prompt, temperature, max_tokens)
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            yield hit
+            return
+    global_sem, provider_sem = _limits(provider)
+    c, parts, started = get_pooled_async_client(api_key, provider), [], time.monotonic()
+
+    async def open_stream(timeout):
+        async with global_sem, provider_sem:
+            async for text in _astream_chunks(c, provider, model, prompt, system_prompt,
+                                              temperature, max_tokens, timeout):
+                yield text
+    try:
+        async for text in astream_with_retries(open_stream, provider, policy_for(deadline)):
+            parts.append(text)
+            yield text
+    except Exception:
+        hedge = usable_hedge(hedge, provider, model)
+        if hedge is None or parts:
+            raise
+        async for text in astream_llm(hedge.api_key, hedge.provider, hedge.model, prompt,
+                                      system_prompt, temperature, max_tokens, use_cache,
+                                      deadline, backup_feature(feature)):
+            yield text
+        return
+    LATENCY.record(feature, time.monotonic() - started)
+    if cache is not None:
+        cache.set(key, "".join(parts).strip())
+
+async def _acall_json(api_key, provider, model, spec: dict, llm_opts: dict):
+    raw = await acall_llm(api_key, provider, model, **llm_opts, **spec, validate=_safe_json_loads,
+                          json_mode=True)
+    try:
+        data = _safe_json_loads(raw)
+        _record_parse(provider, model, True)
+        return data
+    except ValueError:
+        _record_parse(provider, model, False)
+        cache = get_response_cache()
+        if cache is not None:
+            cache.invalidate(cache_key(provider, model, spec.get("system_prompt", ""), spec["prompt"],
+                                       spec["temperature"], spec["max_tokens"]))
+        raise
+
+# ── Feature coroutines (see src.core.llm for prompts and token caps) ─
+async def aassess_resume(api_key, provider, model, resume_text, job_description, **llm_opts) -> dict:
+    return await _acall_json(api_key, provider, model,
+                             _assess_spec(resume_text, job_description), llm_opts)
+
+async def aanalyze_resume(api_key, provider, model, resume_text, job_description, **llm_opts) -> dict:
+    return analysis_view(await aassess_resume(api_key, provider, model, resume_text,
+                                              job_description, **llm_opts))
+
+async def aoptimize_resume(api_key, provider, model, resume_text, job_description, **llm_opts) -> str:
+    return await acall_llm(api_key, provider, model, **llm_opts,
+                           **_optimize_spec(resume_text, job_description))
+
+def astream_optimize_resume(api_key, provider, model, resume_text, job_description, **llm_opts):
+    return astream_llm(api_key, provider, model, **llm_opts,
+                       **_optimize_spec(resume_text, job_description))
+
+async def agenerate_cover_letter(api_key, provider, model, resume_text, job_description,
+                                 tone="Professional", extra_notes="", **llm_opts) -> str:
+    return await acall_llm(api_key, provider, model, **llm_opts,
+                           **_cover_letter_spec(resume_text, job_description, tone, extra_notes))
+
+async def agenerate_interview_questions(api_key, provider, model, resume_text,
+                                        job_description, num_questions=8, **llm_opts) -> list:
+    return _question_list(await _acall_json(api_key, provider, model,
+                          _questions_spec(resume_text, job_description, num_questions), llm_opts))
+
+async def aget_interview_chatbot_response(api_key, provider, model, resume_text,
+                                          job_description, chat_history, **llm_opts) -> str:
+    return await acall_llm(api_key, provider, model, **llm_opts,
+                           **_chatbot_spec(resume_text, job_description, chat_history))
+
+async def agenerate_practice_question(api_key, provider, model, resume_text, job_description,
+                                      asked_questions: list, category: str = "Any",
+                                      **llm_opts) -> dict:
+    return await _acall_json(api_key, provider, model,
+        _practice_spec(resume_text, job_description, asked_questions, category), llm_opts)
+
+async def agrade_interview_answer(api_key, provider, model, question: str, user_answer: str,
+                                  resume_text: str, job_description: str, **llm_opts) -> dict:
+    return await _acall_json(api_key, provider, model,
+        _grade_spec(question, user_answer, resume_text, job_description), llm_opts)
+
+async def aget_shortlist_accelerator(api_key, provider, model, resume_text, job_description,
+                                     **llm_opts) -> dict:
+    return shortlist_view(await aassess_resume(api_key, provider, model, resume_text,
+                                               job_description, **llm_opts))
+
+async def aget_percentage_match(api_key, provider, model, resume_text, job_description,
+                                **llm_opts) -> str:
+    return format_match_text(match_view(await aassess_resume(api_key, provider, model, resume_text,
+                                                             job_description, **llm_opts)))
+
+async def abuild_resume_from_info(api_key, provider, model, user_info: dict, **llm_opts) -> str:
+    return await acall_llm(api_key, provider, model, **llm_opts, **_builder_spec(user_info))
+
+def astream_resume_from_info(api_key, provider, model, user_info: dict, **llm_opts):
+    return astream_llm(api_key, provider, model, **llm_opts, **_builder_spec(user_info))
@@ -0,0 +1,149 @@
+"""
+ATS Resume Studio v3 - Recruiter Batch Ranking
+Hundreds of resumes against one JD, cheapest work first:
+  1. uploads (files or zips of them) are parsed once — big batches in the shared
+     parsing process pool (src.utils.doc_store.parse_many);
+  2. everyone is pre-scored locally: hashed TF-IDF cosine against the JD (one sparse
+     mat-vec for the whole batch) blended with taxonomy skill coverage;
+  3. only the top K go to the LLM assessment, with bounded concurrency, and results
+     are yielded as each call completes.
+"""
+from __future__ import annotations
+import asyncio, concurrent.futures, csv, io, os, time, zipfile
+from dataclasses import dataclass, field
+
+from src.core.skills import skill_gap
+from src.core.vectors import fit_score, hashed_tf, idf_weights, normalise, stack
+
+MAX_FILES      = int(os.getenv("ATS_BATCH_MAX_FILES", "500"))
+_MAX_UNZIPPED  = 200 * 1024 * 1024          # total bytes read out of zips per batch
+RESUME_TYPES   = ("pdf", "docx", "txt")
+
+
+@dataclass
+class Candidate:
+    name: str
+    text: str = ""
+    error: str = ""
+    similarity: float = 0.0                 # cosine vs the JD, 0-1
+    skill_coverage: float = 0.0             # share of the JD's taxonomy skills present, 0-1
+    prescore: int = 0                       # 0-100, local
+    matched: list = field(default_factory=list)
+    missing: list = field(default_factory=list)
+    ats_score: int | None = None            # from the LLM, top K only
+    verdict: str = ""
+    llm_error: str = ""
+    seconds: float = 0.0
+
+    def row(self, rank: int) -> dict:
+        return {"Rank": rank, "Candidate": self.name, "Pre-score": self.prescore,
+                "Similarity %": round(100 * self.similarity, 1),
+                "Skills %": round(100 * self.skill_coverage),
+                "AI score": self.ats_score, "Verdict": self.verdict or self.llm_error or self.error,
+                "Top gaps": ", ".join(self.missing[:5])}
+
+
+# ── Uploads ──────────────────────────────────────────────────────
+def _resume_type(name: str) -> bool:
+    base = name.rsplit("/", 1)[-1]
+    return not base.startswith((".", "~$")) and base.rsplit(".", 1)[-1].lower() in RESUME_TYPES
+
+def expand_uploads(files) -> tuple[list[tuple[bytes, str]], list[str]]:
+    """[(name, bytes)] of uploads → ([(bytes, name)] resumes, [skipped notes]).
+    Zips are opened in memory; nested folders are flattened, junk entries skipped."""
+    items, skipped, unzipped = [], [], 0
+    for name, data in files:
+        if name.lower().endswith(".zip"):
+            try:
+                with zipfile.ZipFile(io.BytesIO(data)) as zf:
+                    for info in zf.infolist():
+                        if info.is_dir() or "__MACOSX" in info.filename or not _resume_type(info.filename):
+                            continue
+                        unzipped += info.file_size
+                        if unzipped > _MAX_UNZIPPED:
+                            skipped.append(f"{name}: stopped at {_MAX_UNZIPPED >> 20} MB uncompressed")
+                            break
+                        items.append((zf.read(info), info.filename.rsplit("/", 1)[-1]))
+            except zipfile.BadZipFile:
+                skipped.append(f"{name}: not a valid zip")
+        elif _resume_type(name):
+            items.append((data, name))
+        else:
+            skipped.append(f"{name}: unsupported type")
+    if len(items) > MAX_FILES:
+        skipped.append(f"{len(items) - MAX_FILES} files over the {MAX_FILES}-resume limit")
+        items = items[:MAX_FILES]
+    return items, skipped
+
+
+# ── Local pre-score ──────────────────────────────────────────────
+def hashed_tfidf(texts: list[str]):
+    """L2-normalised TF-IDF rows (scipy CSR) over hashed unigrams + bigrams, idf from
+    this batch. Hashing keeps memory flat however large the vocabulary gets."""
+    X = stack([hashed_tf(t) for t in texts])
+    return normalise(X, idf_weights(X))
+
+def prescore(docs, job_description: str) -> list[Candidate]:
+    """Candidates for ParsedDocuments, best first. Unparseable files sink to the bottom."""
+    good = [d for d in docs if d.ok and d.text]
+    out = [Candidate(d.name, error=d.error or "No text extracted") for d in docs
+           if not (d.ok and d.text)]
+    if not good:
+        return out
+    X = hashed_tfidf([job_description] + [d.text for d in good])
+    sims = (X[1:] @ X[0].T).toarray().ravel()
+    top = float(sims.max()) or 1.0
+    ranked = []
+    for d, sim in zip(good, sims):
+        gap = skill_gap(d.text, job_description)
+        cov = len(gap.matched) / gap.jd_skills if gap.jd_skills else None
+        ranked.append(Candidate(d.name, d.text, similarity=float(sim), skill_coverage=cov or 0.0,
+                                prescore=fit_score(float(sim), top, cov), matched=gap.matched,
+                                missing=gap.missing))
+    ranked.sort(key=lambda c: (-c.prescore, -c.similarity, c.name))
+    return ranked + out
+
+
+# ── LLM pass over the shortlist ──────────────────────────────────
+def iter_ai_scores(api_key, provider, model, candidates: list[Candidate], job_description: str,
+                   concurrency: int = 4, **llm_opts):
+    """Run the assessment for each candidate, at most `concurrency` at once (the async
+    core's per-provider limits still apply). Yields each Candidate, updated, in
+    completion order. Failures land in llm_error rather than raising."""
+    from src.core.async_llm import aanalyze_resume, submit_async
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(c: Candidate) -> Candidate:
+        async with sem:
+            t0 = time.perf_counter()
+            try:
+                r = await aanalyze_resume(api_key, provider, model, c.text, job_description,
+                                          **llm_opts)
+                c.ats_score, c.verdict, c.llm_error = r.get("ats_score"), r.get("overall_verdict", ""), ""
+            except Exception as e:
+                c.llm_error = f"AI scoring failed: {e}"
+            c.seconds = time.perf_counter() - t0
+            return c
+
+    futures = [submit_async(one(c)) for c in candidates if c.text]
+    try:
+        for fut in concurrent.futures.as_completed(futures):
+            yield fut.result()
+    finally:
+        for fut in futures:                   # page left mid-run: stop queued calls
+            fut.cancel()
+
+
+def final_order(candidates: list[Candidate]) -> list[Candidate]:
+    """AI-scored candidates first (by AI score, then pre-score), then the rest by pre-score."""
+    return sorted(candidates, key=lambda c: (c.ats_score is None, -(c.ats_score or 0),
+                                             -c.prescore, c.name))
+
+
+def to_csv(candidates: list[Candidate]) -> str:
+    buf = io.StringIO()
+    rows = [c.row(i) for i, c in enumerate(candidates, 1)]
+    writer = csv.DictWriter(buf, fieldnames=list(Candidate("").row(0)))
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue()
@@ -0,0 +1,152 @@
+"""
+ATS Resume Studio v3 - Context Budgeting
+Measures text in tokens (tiktoken when available, a fast estimate otherwise) and
+packs the most valuable parts of the resume and JD into a per-feature token budget,
+instead of cutting at a fixed character offset.
+
+Resume: segmented once (src.core.sections); each feature sends only the sections it
+needs, filled by priority and emitted in original order. Experience is packed role by
+role, so recent roles survive whole and older ones shrink to their header line.
+JD: requirement/qualification lines outrank company blurb, benefits and EEO text.
+"""
+from __future__ import annotations
+import math, re
+from functools import lru_cache
+
+from src.core.sections import ALL_SECTIONS, FEATURE_SECTIONS, ResumeSections, segment_resume
+
+# ── Token counting ────────────────────────────────────────────────
+_ENCODER = None
+_ENCODER_LOADED = False
+
+def _encoder():
+    global _ENCODER, _ENCODER_LOADED
+    if not _ENCODER_LOADED:
+        _ENCODER_LOADED = True
+        try:
+            import tiktoken
+            _ENCODER = tiktoken.get_encoding("cl100k_base")
+        except Exception:          # not installed, or BPE file unavailable offline
+            _ENCODER = None
+    return _ENCODER
+
+_PIECE = re.compile(r"[A-Za-z0-9]+|[^\sA-Za-z0-9]")
+
+def _estimate_tokens(text: str) -> int:
+    # BPE vocabularies split long words into ~4-char pieces; punctuation is its own token.
+    return sum(math.ceil(len(p) / 4) if p[0].isalnum() else 1 for p in _PIECE.findall(text))
+
+def count_tokens(text: str) -> int:
+    enc = _encoder()
+    if enc is not None:
+        return len(enc.encode(text, disallowed_special=()))
+    return _estimate_tokens(text)
+
+def truncate_tokens(text: str, budget: int) -> str:
+    """Longest prefix of whole lines that fits the budget (falls back to a word cut)."""
+    if budget <= 0:
+        return ""
+    if count_tokens(text) <= budget:
+        return text
+    kept, used = [], 0
+    for line in text.splitlines():
+        n = count_tokens(line) + 1
+        if used + n > budget:
+            if not kept:                              # one huge line — cut by words
+                words, out = line.split(), []
+                for w in words:
+                    used += count_tokens(w) + 1
+                    if used > budget:
+                        break
+                    out.append(w)
+                kept.append(" ".join(out))
+            break
+        kept.append(line); used += n
+    return "\n".join(kept)
+
+# ── Feature budgets (input tokens for resume, JD) ─────────────────
+FEATURE_BUDGETS = {
+    "assess":       (750, 450),
+    "optimize":     (750, 450),
+    "cover_letter": (500, 370),
+    "questions":    (500, 370),
+    "custom":       (620, 370),
+    "chat":         (300, 200),
+    "practice":     (300, 200),
+    "grade":        (200, 120),
+}
+
+# ── Resume packing ────────────────────────────────────────────────
+def _pack_experience(seg: ResumeSections, budget: int) -> str:
+    """Whole roles in resume order (most recent first) while they fit; the remaining
+    roles are reduced to their header line so the timeline stays intact."""
+    heading = seg.get("experience").splitlines()[0]
+    out, left = [heading], budget - count_tokens(heading)
+    for i, role in enumerate(seg.roles):
+        n = count_tokens(role.body)
+        if n <= left:
+            out.append(role.body); left -= n
+        elif i == 0 and left >= 40:                          # never drop the latest role outright
+            out.append(truncate_tokens(role.body, left - 4) + "\n[...]"); left = 0
+        elif role.header and count_tokens(role.header) + 1 <= left:
+            out.append(role.header); left -= count_tokens(role.header) + 1
+    return "\n\n".join(out)
+
+def pack_sections(seg: ResumeSections, wanted: tuple, budget: int) -> str:
+    """Pack the wanted sections by priority into `budget` tokens, emitted in resume order."""
+    rank = {n: i for i, n in enumerate(wanted)}
+    idx = [i for i, (n, _) in enumerate(seg.sections) if n in rank]
+    kept, left = {}, budget
+    for i in sorted(idx, key=lambda i: (rank[seg.sections[i][0]], i)):
+        name, body = seg.sections[i]
+        n = count_tokens(body)
+        if n <= left:
+            kept[i] = body; left -= n
+        elif name == "experience" and seg.roles and left >= 40:
+            kept[i] = _pack_experience(seg, left); left = 0
+        elif left >= 40:                                    # partial: keep the top of the section
+            kept[i] = truncate_tokens(body, left - 4) + "\n[...]"; left = 0
+    out = "\n\n".join(kept[i] for i in sorted(kept))
+    return out if len(kept) == len(idx) else out + "\n[...truncated]"
+
+@lru_cache(maxsize=256)
+def fit_resume(text: str, feature: str) -> str:
+    """Only the sections `feature` needs (see src.core.sections.FEATURE_SECTIONS),
+    packed into its token budget. Unsegmentable text is truncated as one block."""
+    budget = FEATURE_BUDGETS[feature][0]
+    seg = segment_resume(text)
+    if not seg.recognised:
+        return text if count_tokens(text) <= budget else truncate_tokens(text, budget) + "\n[...truncated]"
+    wanted = FEATURE_SECTIONS.get(feature, ALL_SECTIONS)
+    if set(wanted) >= seg.names and count_tokens(text) <= budget:
+        return text
+    return pack_sections(seg, wanted, budget)
+
+# ── Job description ───────────────────────────────────────────────
+# Heading/line patterns for requirement vs boilerplate text; lexical.py shares them.
+JD_KEEP = re.compile(r"requir|qualif|must|skill|experience|responsib|what you|you will|you'll|"
+                     r"nice to have|preferred|bonus|knowledge|proficien|degree", re.I)
+JD_DROP = re.compile(r"about us|about the company|who we are|benefit|perks|we offer|salary|"
+                     r"equal opportunit|eeo|diversity|accommodation|how to apply|privacy", re.I)
+
+@lru_cache(maxsize=256)
+def fit_jd(text: str, feature: str) -> str:
+    budget = FEATURE_BUDGETS[feature][1]
+    if count_tokens(text) <= budget:
+        return text
+    lines, scores, mode = text.splitlines(), [], 0
+    for line in lines:
+        s = line.strip()
+        if len(s) < 60 and (JD_KEEP.search(s) or JD_DROP.search(s)):
+            mode = -2 if JD_DROP.search(s) else 2                  # heading switches context
+        score = mode + (1 if JD_KEEP.search(s) else 0) + (1 if s[:1] in "-•*" else 0)
+        scores.append(score if s else -99)
+    order = sorted(range(len(lines)), key=lambda i: (-scores[i], i))
+    kept, left = set(), budget
+    for i in order:
+        if scores[i] == -99:
+            continue
+        n = count_tokens(lines[i]) + 1
+        if n <= left:
+            kept.add(i); left -= n
+    return "\n".join(lines[i] for i in sorted(kept)) + "\n[...truncated]"
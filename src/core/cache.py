@@ -0,0 +1,201 @@
+"""
+ATS Resume Studio v3 - LLM Response Cache
+Content-addressed, two tiers:
+  1. in-process LRU bounded by total bytes (shared by all sessions)
+  2. on-disk SQLite with TTL (survives restarts, shared across processes)
+
+Keys hash everything that changes the completion: provider, model, system
+prompt, prompt, temperature and max_tokens.
+"""
+from __future__ import annotations
+import hashlib, json, os, sqlite3, threading, time
+from collections import OrderedDict
+from pathlib import Path
+
+CACHE_DIR     = Path(os.getenv("ATS_CACHE_DIR", Path.home() / ".cache" / "ats_resume_studio"))
+_MEMORY_BYTES = int(float(os.getenv("ATS_CACHE_MEMORY_MB", "32")) * 1024 * 1024)
+_TTL_SECONDS  = float(os.getenv("ATS_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+_ENABLED      = os.getenv("ATS_CACHE_DISABLED", "") not in ("1", "true", "yes")
+_PURGE_EVERY  = 500              # disk writes between sweeps of expired rows
+
+
+def cache_key(provider, model, system_prompt, prompt, temperature, max_tokens) -> str:
+    payload = json.dumps([provider, model, system_prompt, prompt, temperature, max_tokens],
+                         ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MemoryLRU:
+    """LRU of str values evicted by total UTF-8 size rather than entry count."""
+
+    def __init__(self, max_bytes: int = _MEMORY_BYTES):
+        self.max_bytes, self.bytes = max_bytes, 0
+        self._data: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            self._data.move_to_end(key)
+            return item[0]
+
+    def set(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old:
+                self.bytes -= old[1]
+            self._data[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self._data.popitem(last=False)
+                self.bytes -= evicted
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old:
+                self.bytes -= old[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear(); self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteTier:
+    """Persistent key/value table with per-entry expiry. WAL mode so several processes can share it.
+    Expired rows are deleted when the table is opened and every `purge_every` writes, so
+    the file shared by the app, CLI and API workers doesn't grow for ever."""
+
+    def __init__(self, path: Path, ttl_seconds: float = _TTL_SECONDS, purge_every: int = _PURGE_EVERY):
+        self.path, self.ttl, self.purge_every = Path(path), ttl_seconds, purge_every
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._writes = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS llm_cache ("
+                         "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)")
+            self._purge(conn)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _purge(db: sqlite3.Connection) -> int:
+        n = db.execute("DELETE FROM llm_cache WHERE expires<?", (time.time(),)).rowcount
+        db.commit()
+        return n
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._db().execute("SELECT value, expires FROM llm_cache WHERE key=?",
+                                     (key,)).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute("INSERT OR REPLACE INTO llm_cache (key, value, expires) VALUES (?,?,?)",
+                       (key, value, time.time() + self.ttl))
+            db.commit()
+            self._writes += 1
+            if self._writes % self.purge_every == 0:
+                self._purge(db)
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM llm_cache WHERE key=?", (key,)); db.commit()
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self._purge(self._db())
+
+    def clear(self) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM llm_cache"); db.commit()
+
+
+class ResponseCache:
+    """Memory tier in front of the SQLite tier; disk hits are promoted to memory.
+    Disk errors only skip the disk tier. If it cannot be opened at all (unwritable
+    cache dir, read-only volume) it is switched off for the rest of the process."""
+
+    def __init__(self, memory: MemoryLRU, disk: SQLiteTier | None):
+        self.memory, self.disk = memory, disk
+        self.memory_hits = self.disk_hits = self.misses = 0
+        self._lock = threading.Lock()       # counters: the async loop and script threads share them
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _disk(self, op: str, *args):
+        disk = self.disk
+        if disk is None:
+            return None
+        try:
+            return getattr(disk, op)(*args)
+        except (sqlite3.Error, OSError) as e:
+            if isinstance(e, OSError) or not disk.is_open:
+                self.disk = None
+            return None
+
+    def get(self, key: str) -> str | None:
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("memory_hits")
+            return value
+        value = self._disk("get", key)
+        if value is not None:
+            self._count("disk_hits")
+            self.memory.set(key, value)
+            return value
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        self.memory.set(key, value)
+        self._disk("set", key, value)
+
+    def invalidate(self, key: str) -> None:
+        self.memory.pop(key)
+        self._disk("pop", key)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self._disk("clear")
+
+    def stats(self) -> dict:
+        with self._lock:
+            memory_hits, disk_hits, misses = self.memory_hits, self.disk_hits, self.misses
+        hits = memory_hits + disk_hits
+        total = hits + misses
+        return {"memory_hits": memory_hits, "disk_hits": disk_hits,
+                "misses": misses, "hit_rate": hits / total if total else 0.0,
+                "memory_entries": len(self.memory), "memory_bytes": self.memory.bytes,
+                "disk": self.disk is not None}
+
+
+_CACHE = ResponseCache(MemoryLRU(), SQLiteTier(CACHE_DIR / "llm_cache.sqlite3"))
+
+def get_response_cache() -> ResponseCache | None:
+    return _CACHE if _ENABLED else None
@@ -0,0 +1,150 @@
+"""
+ATS Resume Studio v3 - Pooled LLM Clients
+One long-lived SDK client per (provider, API key, base URL), shared by every
+session in the process so keep-alive connections survive Streamlit reruns.
+
+Bounded LRU with idle eviction; all clients are closed at interpreter exit.
+Async clients are pooled per event loop, since their connections are bound to it.
+"""
+from __future__ import annotations
+import asyncio, atexit, hashlib, os, threading, time, weakref
+from collections import OrderedDict
+
+_POOL_SIZE    = int(os.getenv("ATS_CLIENT_POOL_SIZE", "32"))
+_IDLE_SECONDS = float(os.getenv("ATS_CLIENT_IDLE_SECONDS", "900"))
+
+BASE_URLS = {
+    "groq": "https://api.groq.com/openai/v1",
+    "openrouter": "https://openrouter.ai/api/v1",
+    "together": "https://api.together.xyz/v1",
+}
+
+# Where headless entry points (CLI, API service) look for a key when none is given.
+KEY_ENV = {"groq": "GROQ_API_KEY", "openai": "OPENAI_API_KEY", "anthropic": "ANTHROPIC_API_KEY",
+           "openrouter": "OPENROUTER_API_KEY", "together": "TOGETHER_API_KEY"}
+
+def default_api_key(provider: str) -> str:
+    """ATS_API_KEY, else the provider's usual env var. For Ollama the 'key' is the server URL."""
+    return (os.getenv("ATS_API_KEY") or os.getenv(KEY_ENV.get(provider, ""), "")
+            or ("http://localhost:11434/v1" if provider == "ollama" else ""))
+
+def base_url_for(api_key: str, provider: str) -> str | None:
+    if provider == "ollama":
+        return api_key if api_key.startswith("http") else "http://localhost:11434/v1"
+    return BASE_URLS.get(provider)
+
+def build_client(api_key: str, provider: str):
+    """Construct a fresh SDK client (no pooling). SDK retries are off — src.core.resilience
+    owns retry/backoff so attempts don't multiply."""
+    if provider == "anthropic":
+        import anthropic; return anthropic.Anthropic(api_key=api_key, max_retries=0)
+    from openai import OpenAI
+    key = "ollama" if provider == "ollama" else api_key
+    return OpenAI(api_key=key, base_url=base_url_for(api_key, provider), max_retries=0)
+
+def build_async_client(api_key: str, provider: str):
+    """Construct a fresh asyncio SDK client (no pooling)."""
+    if provider == "anthropic":
+        import anthropic; return anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
+    from openai import AsyncOpenAI
+    key = "ollama" if provider == "ollama" else api_key
+    return AsyncOpenAI(api_key=key, base_url=base_url_for(api_key, provider), max_retries=0)
+
+def _close_quietly(client) -> None:
+    try:
+        client.close()
+    except Exception:
+        pass
+
+class ClientPool:
+    """Thread-safe LRU of SDK clients keyed by (provider, key fingerprint, base URL)."""
+
+    def __init__(self, max_size: int = _POOL_SIZE, idle_seconds: float = _IDLE_SECONDS,
+                 factory=build_client, closer=None):
+        self.max_size, self.idle_seconds, self.factory = max_size, idle_seconds, factory
+        self.closer = closer or _close_quietly
+        self._entries: OrderedDict[tuple, list] = OrderedDict()   # key -> [client, last_used]
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def _key(api_key: str, provider: str) -> tuple:
+        fp = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        return provider, fp, base_url_for(api_key, provider)
+
+    def get(self, api_key: str, provider: str):
+        key, now, stale = self._key(api_key, provider), time.monotonic(), []
+        with self._lock:
+            stale += self._evict_idle_locked(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[1] = now
+                self._entries.move_to_end(key)
+                self.hits += 1
+                client = entry[0]
+            else:
+                self.misses += 1
+                client = self.factory(api_key, provider)
+                self._entries[key] = [client, now]
+                while len(self._entries) > self.max_size:
+                    stale.append(self._entries.popitem(last=False)[1][0])
+                    self.evictions += 1
+        for c in stale:
+            self.closer(c)
+        return client
+
+    def _evict_idle_locked(self, now: float) -> list:
+        idle = [k for k, (_, used) in self._entries.items() if now - used > self.idle_seconds]
+        self.evictions += len(idle)
+        return [self._entries.pop(k)[0] for k in idle]
+
+    def evict_idle(self) -> int:
+        with self._lock:
+            stale = self._evict_idle_locked(time.monotonic())
+        for c in stale:
+            self.closer(c)
+        return len(stale)
+
+    def close_all(self) -> None:
+        with self._lock:
+            clients = [c for c, _ in self._entries.values()]
+            self._entries.clear()
+        for c in clients:
+            self.closer(c)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "max_size": self.max_size,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+def _close_async_quietly(client) -> None:
+    try:
+        asyncio.get_running_loop().create_task(client.close())
+    except RuntimeError:
+        pass                                   # loop gone — sockets die with it
+
+_POOL = ClientPool()
+_ASYNC_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ClientPool]" = \
+    weakref.WeakKeyDictionary()
+_ASYNC_POOLS_LOCK = threading.Lock()           # API, job loop and run_async callers race here
+atexit.register(_POOL.close_all)
+
+def get_pooled_client(api_key: str, provider: str):
+    return _POOL.get(api_key, provider)
+
+def get_pooled_async_client(api_key: str, provider: str):
+    """Async client from the running loop's pool. Must be called inside a coroutine."""
+    loop = asyncio.get_running_loop()
+    with _ASYNC_POOLS_LOCK:
+        pool = _ASYNC_POOLS.get(loop)
+        if pool is None:
+            pool = _ASYNC_POOLS[loop] = ClientPool(factory=build_async_client,
+                                                   closer=_close_async_quietly)
+    return pool.get(api_key, provider)
+
+def close_all_clients() -> None:
+    """Shutdown hook: close every pooled client and its connection pool."""
+    _POOL.close_all()
+
+def client_pool_stats() -> dict:
+    return _POOL.stats()
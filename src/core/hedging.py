@@ -0,0 +1,121 @@
+"""
+ATS Resume Studio v3 - Hedged Requests & Provider Failover
+Opt-in: if the primary provider hasn't answered within the feature's observed p90
+latency, the same prompt is sent to a secondary provider/model and the first valid
+reply wins; the other request is cancelled. If the primary fails outright (circuit
+open, retries exhausted) the secondary is used immediately.
+
+Only primary latencies set the hedge threshold: backup replies are recorded under
+backup_feature(feature), so hedging doesn't lower its own trigger.
+"""
+from __future__ import annotations
+import asyncio, threading
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    provider: str
+    model: str
+    api_key: str = ""
+    percentile: float = 0.9
+    min_delay: float = 1.5          # never hedge sooner than this (seconds)
+    cold_delay: float = 8.0         # threshold until enough samples are seen
+    min_samples: int = 8
+
+    def __repr__(self) -> str:       # keep the key out of logs / st.write
+        return f"HedgePolicy({self.provider}/{self.model}, p{self.percentile * 100:.0f})"
+
+
+# ── Latency tracking ─────────────────────────────────────────────
+class LatencyTracker:
+    """Rolling window of uncached completion latencies per feature."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, feature: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(feature or "default", deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, feature: str, q: float) -> float | None:
+        with self._lock:
+            data = sorted(self._samples.get(feature or "default", ()))
+        if not data:
+            return None
+        return data[min(len(data) - 1, int(q * len(data)))]
+
+    def threshold(self, feature: str, policy: HedgePolicy) -> float:
+        with self._lock:
+            n = len(self._samples.get(feature or "default", ()))
+        if n < policy.min_samples:
+            return policy.cold_delay
+        return max(policy.min_delay, self.percentile(feature, policy.percentile))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            features = list(self._samples)
+        return {f: {"n": len(self._samples[f]), "p50": self.percentile(f, 0.5),
+                    "p90": self.percentile(f, 0.9)} for f in features}
+
+LATENCY = LatencyTracker()
+
+
+def backup_feature(feature: str) -> str:
+    """Latency label for replies from the backup provider."""
+    return f"{feature or 'default'}@backup"
+
+
+def usable_hedge(hedge: HedgePolicy | None, provider: str, model: str) -> HedgePolicy | None:
+    """The hedge policy, or None when its backup is the primary provider/model itself."""
+    if hedge is None or (hedge.provider == provider and hedge.model == model):
+        return None
+    return hedge
+
+
+# ── Hedged execution ─────────────────────────────────────────────
+async def _cancel(task: asyncio.Task) -> None:
+    if not task.done():
+        task.cancel()
+        try:
+            await task
+        except BaseException:
+            pass
+
+async def hedged(primary, secondary, delay: float, validate=None):
+    """primary/secondary: zero-arg coroutine factories returning text.
+    Returns (text, winner) with winner in {"primary", "secondary"}."""
+    def usable(task) -> bool:
+        if task.cancelled() or task.exception() is not None:
+            return False
+        if validate is not None:
+            try:
+                validate(task.result())
+            except ValueError:
+                return False
+        return True
+
+    first = asyncio.ensure_future(primary())
+    done, _ = await asyncio.wait({first}, timeout=delay)
+    if done and usable(first):
+        return first.result(), "primary"
+    second = asyncio.ensure_future(secondary())
+    pending, names = {first, second} - done, {first: "primary", second: "secondary"}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if usable(task):
+                    return task.result(), names[task]
+    finally:
+        for task in pending:
+            await _cancel(task)
+    # Neither produced a usable reply: surface the primary's result/error.
+    return first.result(), "primary"
@@ -0,0 +1,182 @@
+"""
+ATS Resume Studio v3 - Saved Job Description Library
+JDs are stored locally in SQLite together with their hashed term vector and taxonomy
+skills, both computed once on save. Ranking the current resume against the whole
+library is then one sparse matrix–vector product plus set intersections — instant
+and free — so the paid LLM assessment only runs on the few JDs the user picks.
+
+Every row belongs to an owner — a signed-in user, or one browser session — and
+all reads and writes are scoped to it, so users of a shared deployment never see
+each other's saved JDs. Session-owned rows are pruned once they go stale. Set
+ATS_JD_LIBRARY_SHARED=1 on a single-user install to keep one library across sessions.
+
+The stacked matrix is kept in memory per owner and rebuilt only when the library
+changes (including changes made by another process).
+"""
+from __future__ import annotations
+import hashlib, json, os, sqlite3, threading, time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.core.cache import CACHE_DIR
+from src.core.skills import find_skills
+from src.core.vectors import fit_score, hashed_tf, idf_weights, normalise, stack
+
+LIBRARY_PATH   = Path(os.getenv("ATS_JD_LIBRARY", CACHE_DIR / "jd_library.sqlite3"))
+SHARED_LIBRARY = os.getenv("ATS_JD_LIBRARY_SHARED", "") in ("1", "true", "yes")
+SHARED_OWNER   = "local"                       # the one owner when SHARED_LIBRARY is set
+SESSION_PREFIX = "session:"                    # owners that only live as long as a session
+_SESSION_TTL   = float(os.getenv("ATS_JD_LIBRARY_SESSION_TTL", str(24 * 3600)))
+_INDEXES       = 32                            # owners whose matrix stays in memory
+
+
+@dataclass(frozen=True)
+class SavedJD:
+    id: int
+    title: str
+    company: str
+    text: str
+    added: float
+    skills: tuple = ()
+
+
+@dataclass(frozen=True)
+class JDFit:
+    jd: SavedJD
+    score: int                                     # 0-100 blend, see vectors.fit_score
+    similarity: float                              # cosine, 0-1
+    matched: list = field(default_factory=list)    # JD skills the resume has
+    missing: list = field(default_factory=list)
+
+
+def _title_from(text: str) -> str:
+    first = next((l.strip() for l in text.splitlines() if l.strip()), "Untitled role")
+    return first[:80]
+
+
+class JDLibrary:
+    def __init__(self, path: Path = LIBRARY_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._index: OrderedDict[str, tuple] = OrderedDict()   # owner → (signature, jds, matrix, idf)
+        self._generation = 0                        # bumped on every local write
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            cols = {r[1] for r in conn.execute("PRAGMA table_info(jds)")}
+            if cols and "owner" not in cols:        # pre-owner library: rows become the shared owner's
+                conn.execute("ALTER TABLE jds RENAME TO jds_unowned")
+            conn.execute("CREATE TABLE IF NOT EXISTS jds ("
+                         "id INTEGER PRIMARY KEY, owner TEXT NOT NULL, digest TEXT NOT NULL, "
+                         "title TEXT NOT NULL, company TEXT NOT NULL, text TEXT NOT NULL, "
+                         "added REAL NOT NULL, skills TEXT NOT NULL, vec_idx BLOB NOT NULL, "
+                         "vec_w BLOB NOT NULL, UNIQUE (owner, digest))")
+            if cols and "owner" not in cols:
+                conn.execute("INSERT INTO jds SELECT id, ?, digest, title, company, text, added, "
+                             "skills, vec_idx, vec_w FROM jds_unowned", (SHARED_OWNER,))
+                conn.execute("DROP TABLE jds_unowned")
+                conn.commit()
+            self._conn = conn
+        return self._conn
+
+    # ── CRUD ─────────────────────────────────────────────────────
+    def add(self, owner: str, text: str, title: str = "", company: str = "") -> SavedJD:
+        """Save a JD for `owner` (vector + skills computed here, once). Re-saving the same
+        text updates its title/company instead of adding a duplicate."""
+        text = text.strip()
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        idx, w = hashed_tf(text)
+        skills = list(find_skills(text))
+        title, company = title.strip() or _title_from(text), company.strip()
+        with self._lock:
+            db = self._db()
+            now = time.time()
+            db.execute("INSERT INTO jds (owner, digest, title, company, text, added, skills, vec_idx, "
+                       "vec_w) VALUES (?,?,?,?,?,?,?,?,?) ON CONFLICT(owner, digest) DO UPDATE SET "
+                       "title=excluded.title, company=excluded.company",
+                       (owner, digest, title, company, text, now, json.dumps(skills),
+                        idx.tobytes(), w.tobytes()))
+            # A session library with nothing added for _SESSION_TTL outlived its session.
+            db.execute("DELETE FROM jds WHERE owner LIKE ? AND owner IN (SELECT owner FROM jds "
+                       "GROUP BY owner HAVING MAX(added) < ?)", (SESSION_PREFIX + "%", now - _SESSION_TTL))
+            db.commit()
+            self._generation += 1
+            row = db.execute("SELECT id, added FROM jds WHERE owner=? AND digest=?",
+                             (owner, digest)).fetchone()
+        return SavedJD(row[0], title, company, text, row[1], tuple(skills))
+
+    def remove(self, owner: str, jd_id: int) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM jds WHERE id=? AND owner=?", (jd_id, owner)); db.commit()
+            self._generation += 1
+
+    def entries(self, owner: str) -> list[SavedJD]:
+        with self._lock:
+            rows = self._db().execute("SELECT id, title, company, text, added, skills FROM jds "
+                                      "WHERE owner=? ORDER BY added DESC", (owner,)).fetchall()
+        return [SavedJD(r[0], r[1], r[2], r[3], r[4], tuple(json.loads(r[5]))) for r in rows]
+
+    def count(self, owner: str) -> int:
+        with self._lock:
+            return self._db().execute("SELECT COUNT(*) FROM jds WHERE owner=?", (owner,)).fetchone()[0]
+
+    # ── Ranking ──────────────────────────────────────────────────
+    def _matrix(self, owner: str):
+        """(jds, row-normalised TF-IDF matrix, idf) for one owner's JDs, rebuilt only when
+        the table changed."""
+        import numpy as np
+        with self._lock:
+            db = self._db()
+            # data_version moves when another connection commits; _generation covers ours.
+            sig = (db.execute("PRAGMA data_version").fetchone()[0], self._generation)
+            cached = self._index.get(owner)
+            if cached is not None and cached[0] == sig:
+                self._index.move_to_end(owner)
+                return cached[1:]
+            rows = db.execute("SELECT id, title, company, text, added, skills, vec_idx, vec_w "
+                              "FROM jds WHERE owner=? ORDER BY id", (owner,)).fetchall()
+        jds = [SavedJD(r[0], r[1], r[2], r[3], r[4], tuple(json.loads(r[5]))) for r in rows]
+        X = stack([(np.frombuffer(r[6], dtype=np.int32), np.frombuffer(r[7], dtype=np.float32))
+                   for r in rows])
+        idf = idf_weights(X)
+        index = (sig, jds, normalise(X, idf), idf)
+        with self._lock:
+            self._index[owner] = index
+            while len(self._index) > _INDEXES:
+                self._index.popitem(last=False)
+        return index[1:]
+
+    def rank(self, owner: str, resume_text: str, limit: int = 10) -> list[JDFit]:
+        """Best-fitting JDs from `owner`'s library for this resume, best first."""
+        if not resume_text.strip():
+            return []
+        jds, M, idf = self._matrix(owner)
+        if not jds:
+            return []
+        q = normalise(stack([hashed_tf(resume_text)]), idf)
+        sims = (M @ q.T).toarray().ravel()              # one sparse mat-vec for the library
+        have = set(find_skills(resume_text))
+        best = float(sims.max())
+        fits = []
+        for jd, sim in zip(jds, sims):
+            matched = [s for s in jd.skills if s in have]
+            cov = len(matched) / len(jd.skills) if jd.skills else None
+            fits.append(JDFit(jd, fit_score(float(sim), best, cov), float(sim), matched,
+                              [s for s in jd.skills if s not in have]))
+        fits.sort(key=lambda f: (-f.score, -f.similarity, f.jd.id))
+        return fits[:limit]
+
+
+_LIBRARY: JDLibrary | None = None
+
+def get_jd_library() -> JDLibrary:
+    global _LIBRARY
+    if _LIBRARY is None:
+        _LIBRARY = JDLibrary()
+    return _LIBRARY
@@ -0,0 +1,85 @@
+"""
+ATS Resume Studio v3 - Background Jobs
+Long generations (optimise, build, interview Q&A) run as jobs on the shared async
+loop instead of blocking the Streamlit script thread, so the page stays usable and
+the work survives navigation. A Job is just a handle — status, streamed text so far,
+result — and is owned by whoever started it (the UI keeps its jobs in session state),
+so jobs are scoped per session without a global registry.
+"""
+from __future__ import annotations
+import concurrent.futures, time, uuid
+from dataclasses import dataclass, field
+
+MAX_JOBS_KEPT = 12             # finished jobs remembered per owner
+
+
+@dataclass
+class Job:
+    kind: str
+    label: str
+    future: concurrent.futures.Future
+    meta: dict = field(default_factory=dict)       # owner's bookkeeping (target key, page, …)
+    chunks: list = field(default_factory=list)     # text streamed so far
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    started: float = field(default_factory=time.time)
+    finished: float | None = None
+    collected: bool = False                        # result already handed to the owner
+
+    @property
+    def status(self) -> str:
+        if not self.future.done():
+            return "running"
+        if self.future.cancelled():
+            return "cancelled"
+        return "failed" if self.future.exception() is not None else "done"
+
+    @property
+    def running(self) -> bool:
+        return not self.future.done()
+
+    @property
+    def partial(self) -> str:
+        return "".join(self.chunks)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.time()) - self.started
+
+    @property
+    def error(self) -> BaseException | None:
+        if not self.future.done() or self.future.cancelled():
+            return None
+        return self.future.exception()
+
+    def result(self):
+        return self.future.result(timeout=0)
+
+    def cancel(self) -> bool:
+        """Cancels the coroutine on the loop (closing any open stream)."""
+        return self.future.cancel()
+
+
+def start_job(kind: str, label: str, work, **meta) -> Job:
+    """Run `work` in the background. `work` is either a coroutine (the job's result is
+    its value) or an async iterator of text chunks (progress is visible as job.partial
+    and the result is the joined text)."""
+    from src.core.async_llm import submit_async    # not needed until the first job
+    chunks: list[str] = []
+    if hasattr(work, "__aiter__"):
+        stream = work
+
+        async def drain() -> str:
+            async for chunk in stream:
+                chunks.append(chunk)
+            return "".join(chunks)
+        work = drain()
+    job = Job(kind, label, submit_async(work), meta, chunks)
+    job.future.add_done_callback(lambda _f: setattr(job, "finished", time.time()))
+    return job
+
+
+def prune(jobs: dict, keep: int = MAX_JOBS_KEPT) -> None:
+    """Drop the oldest collected jobs from an id -> Job dict, in place."""
+    old = sorted((j for j in jobs.values() if j.collected), key=lambda j: j.started)
+    for job in old[:max(0, len(old) - keep)]:
+        jobs.pop(job.id, None)
@@ -0,0 +1,170 @@
+"""
+ATS Resume Studio v3 - Local Lexical ATS Scoring
+Deterministic keyword match between a resume and a JD — no LLM call, a few ms.
+
+1. JD terms: unigrams plus 2–3-word phrases that don't start/end on a stopword,
+   kept when they repeat, sit on a requirement line, or also appear in the resume.
+   Company blurb / benefits / EEO lines are ignored.
+2. Weights: BM25 idf over the lines of both documents (so words that are everywhere
+   score low) × BM25 tf saturation on the JD side, boosted for requirement lines
+   and for phrases.
+3. Coverage: weighted share of the top JD terms found in the resume → keyword_match.
+
+Same inputs always give the same score, so it doesn't drift between reruns.
+"""
+from __future__ import annotations
+import math, re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from src.core.budget import JD_DROP, JD_KEEP
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./\-][a-z0-9+#]+)*")
+_CHUNK_BREAK = re.compile(r"[,;:()\[\]|•·!?]|\.\s|\s-\s|\s–\s")
+
+STOPWORDS = frozenset("""
+a about above across after again all also am an and any are as at be because been being
+both but by can could did do does doing during each etc few for from further had has have
+having he her here hers him his how i if in into is it its itself just more most my no nor
+not of off on once only or other our ours out over own per same she should so some such
+than that the their them then there these they this those through to too under until up
+us very was we were what when where which while who whom why will with within would you
+your yours ability able across candidate candidates company day days desired ensure
+environment excellent experience experienced familiarity field good great ideal including
+join knowledge looking must new opportunity plus preferred proven related required
+requirements responsibilities role skills strong team teams understanding using work
+working year years highly well within across based like make makes making need needs
+nice offer offers senior junior mid level e.g i.e apply benefits perks salary
+""".split())
+
+_REQUIREMENT_LINE = re.compile(r"requir|qualif|must|skill|experience with|proficien|knowledge of|"
+                               r"familiar|degree|nice to have|preferred|bonus", re.I)
+
+TOP_TERMS = 25
+_K1 = 1.2
+
+
+@dataclass(frozen=True)
+class LexicalScore:
+    score: int                                         # 0-100 weighted keyword coverage
+    matched: list = field(default_factory=list)        # [(term, resume context)]
+    missing: list = field(default_factory=list)        # [(term, why)]
+    terms: int = 0                                     # JD terms considered
+
+
+def tokenize(text: str) -> list[str]:
+    return [t.rstrip(".") for t in _TOKEN.findall(text.lower())]
+
+def _stem(tok: str) -> str:
+    """Light suffix folding: 'deployments'/'deployed'/'deploying' → 'deploy',
+    'services'/'service' → 'servic', 'technologies' → 'technology'."""
+    if len(tok) <= 4 or not tok.isalpha():
+        return tok
+    if tok.endswith("ies"):
+        return tok[:-3] + "y"
+    for suf in ("ing", "ed", "es", "s"):
+        if tok.endswith(suf) and not tok.endswith("ss") and len(tok) - len(suf) >= 3:
+            tok = tok[: -len(suf)] if suf != "es" or tok[-3] in "sxz" or tok[-4:-2] in ("ch", "sh") \
+                else tok[:-1]
+            break
+    return tok[:-1] if tok.endswith("e") and len(tok) > 4 else tok
+
+def _line_grams(line: str, max_n: int = 3, surfaces: dict | None = None) -> list[str]:
+    """Stemmed n-grams that don't cross punctuation and don't start/end on a stopword.
+    `surfaces` (optional) collects the first original spelling of each gram."""
+    grams = []
+    for chunk in _CHUNK_BREAK.split(line.lower()):
+        toks = tokenize(chunk)
+        for n in range(1, max_n + 1):
+            for i in range(len(toks) - n + 1):
+                window = toks[i:i + n]
+                if window[0] in STOPWORDS or window[-1] in STOPWORDS:
+                    continue
+                if n == 1 and (len(window[0]) < 2 or not any(c.isalpha() for c in window[0])):
+                    continue
+                if n > 1 and any(t in STOPWORDS for t in window):
+                    continue
+                gram = " ".join(_stem(t) for t in window)
+                grams.append(gram)
+                if surfaces is not None:
+                    surfaces.setdefault(gram, " ".join(window))
+    return grams
+
+def _index(text: str, surfaces: dict | None = None) -> tuple[list[Counter], list[str]]:
+    lines = [l for l in text.splitlines() if l.strip()]
+    return [Counter(_line_grams(l, surfaces=surfaces)) for l in lines], lines
+
+def _jd_line_kinds(lines: list[str]) -> list[int]:
+    """+1 requirement line, 0 neutral, -1 company blurb/benefits (same heading logic as fit_jd)."""
+    kinds, mode = [], 0
+    for line in lines:
+        s = line.strip()
+        if len(s) < 60 and (JD_KEEP.search(s) or JD_DROP.search(s)):
+            mode = -1 if JD_DROP.search(s) else 1
+        if JD_DROP.search(s) or mode < 0:                 # bullets under "Benefits" too
+            kinds.append(-1)
+        elif mode == 1 or _REQUIREMENT_LINE.search(s) or s[:1] in "-•*":
+            kinds.append(1)
+        else:
+            kinds.append(mode)
+    return kinds
+
+
+@lru_cache(maxsize=128)
+def lexical_score(resume_text: str, job_description: str) -> LexicalScore:
+    surfaces: dict[str, str] = {}
+    jd_docs, jd_lines = _index(job_description, surfaces)
+    cv_docs, cv_lines = _index(resume_text)
+    if not jd_docs or not cv_docs:
+        return LexicalScore(0)
+
+    # BM25 idf over every line of both documents.
+    docs = jd_docs + cv_docs
+    n_docs = len(docs)
+    df = Counter(g for d in docs for g in d)
+    idf = {g: math.log(1 + (n_docs - c + 0.5) / (c + 0.5)) for g, c in df.items()}
+
+    jd_tf, req_hits = Counter(), Counter()
+    for d, kind in zip(jd_docs, _jd_line_kinds(jd_lines)):
+        if kind < 0:
+            continue                                   # about-us / benefits / EEO text
+        jd_tf.update(d)
+        if kind > 0:
+            req_hits.update(d.keys())
+    cv_tf = Counter()
+    for d in cv_docs:
+        cv_tf.update(d)
+
+    weights = {}
+    for g, tf in jd_tf.items():
+        n = g.count(" ") + 1
+        if n > 1 and tf < 2 and g not in cv_tf and not (n == 2 and req_hits[g]):
+            continue                                   # one-off phrase, likely noise
+        sat = tf * (_K1 + 1) / (tf + _K1)
+        weights[g] = idf[g] * sat * (1.3 if req_hits[g] else 0.7) * (1.0 + 0.25 * (n - 1))
+    # A unigram that only ever appears inside a kept phrase is redundant with it.
+    for g in [g for g in weights if " " in g]:
+        for part in g.split():
+            if part in weights and jd_tf[part] <= jd_tf[g]:
+                weights[part] *= 0.3
+
+    top = sorted(weights, key=lambda g: (-weights[g], g))[:TOP_TERMS]
+    # Don't list 'machine' and 'learning' next to 'machine learning' when they agree.
+    phrases = [g for g in top if " " in g]
+    top = [g for g in top if " " in g or not any(
+        g in p.split() and bool(cv_tf[p]) == bool(cv_tf[g]) for p in phrases)]
+    if not top:
+        return LexicalScore(0)
+    total = got = 0.0
+    matched, missing = [], []
+    for g in top:
+        total += weights[g]
+        if cv_tf[g]:
+            got += weights[g]
+            ctx = next((l.strip() for d, l in zip(cv_docs, cv_lines) if g in d), "")
+            matched.append((surfaces[g], ctx[:90]))
+        else:
+            why = f"{jd_tf[g]}× in JD" + (" · listed as a requirement" if req_hits[g] else "")
+            missing.append((surfaces[g], why))
+    return LexicalScore(round(100 * got / total), matched, missing, len(top))
@@ -2,16 +2,16 @@
 ATS Resume Studio v3 - Multi-Provider LLM Core
 Providers: Groq (FREE), OpenAI, Anthropic, OpenRouter, Together AI, Ollama (LOCAL/FREE)
 
-Token-Efficiency: All prompts lean, max_tokens capped per feature, text truncated before sending.
+Token-Efficiency: All prompts lean, max_tokens capped per feature, resume/JD packed into
+per-feature token budgets (src.core.budget) before sending.
 """
 from __future__ import annotations
-import json, re
-
-_RESUME_LIMIT = 3000
-_JD_LIMIT     = 2000
-
-def _trim(text: str, limit: int) -> str:
-    return text[:limit] + "\n[...truncated]" if len(text) > limit else text
+import json, re, threading, time
+from src.core.budget import fit_jd, fit_resume
+from src.core.cache import cache_key, get_response_cache
+from src.core.clients import get_pooled_client
+from src.core.hedging import LATENCY, backup_feature, usable_hedge
+from src.core.resilience import call_with_retries, policy_for, stream_with_retries
 
 def _extract_json_object(text: str) -> str:
     fence = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
@@ -45,17 +45,8 @@ def _safe_json_loads(text: str):
 
 # ── Client factory ────────────────────────────────────────────────
 def get_client(api_key: str, provider: str):
-    from openai import OpenAI
-    urls = {
-        "groq": "https://api.groq.com/openai/v1",
-        "openrouter": "https://openrouter.ai/api/v1",
-        "together": "https://api.together.xyz/v1",
-        "ollama": api_key if api_key.startswith("http") else "http://localhost:11434/v1",
-    }
-    if provider == "anthropic":
-        import anthropic; return anthropic.Anthropic(api_key=api_key)
-    key = "ollama" if provider == "ollama" else api_key
-    return OpenAI(api_key=key, base_url=urls.get(provider))
+    """Pooled client for this provider/key — reuses keep-alive connections across calls."""
+    return get_pooled_client(api_key, provider)
 
 def verify_api_key(api_key: str, provider: str) -> tuple[bool, str]:
     try:
@@ -63,8 +54,7 @@ def verify_api_key(api_key: str, provider: str) -> tuple[bool, str]:
             c = get_client(api_key, provider); c.models.list()
             return True, "Ollama connected — running locally, zero cost!"
         elif provider == "anthropic":
-            import anthropic
-            c = anthropic.Anthropic(api_key=api_key)
+            c = get_client(api_key, provider)
             c.messages.create(model="claude-3-haiku-20240307", max_tokens=5,
                               messages=[{"role":"user","content":"hi"}])
         else:
@@ -79,92 +69,313 @@ def verify_api_key(api_key: str, provider: str) -> tuple[bool, str]:
         return False, f"Error: {str(e)[:120]}"
 
 # ── Universal call ────────────────────────────────────────────────
-def call_llm(api_key, provider, model, prompt,
-             system_prompt="", temperature=0.3, max_tokens=1200) -> str:
-    if provider == "anthropic":
-        import anthropic
-        c = anthropic.Anthropic(api_key=api_key)
-        r = c.messages.create(model=model, max_tokens=max_tokens, temperature=temperature,
-            system=system_prompt or "You are a helpful assistant.",
-            messages=[{"role":"user","content":prompt}])
-        return r.content[0].text
-    c = get_client(api_key, provider)
+def _messages(prompt: str, system_prompt: str) -> list:
     msgs = ([{"role":"system","content":system_prompt}] if system_prompt else [])
     msgs.append({"role":"user","content":prompt})
-    r = c.chat.completions.create(model=model, messages=msgs,
-                                  temperature=temperature, max_tokens=max_tokens)
-    return r.choices[0].message.content.strip()
+    return msgs
+
+# ── Native JSON mode ──────────────────────────────────────────────
+# OpenAI-compatible APIs (incl. Groq, Together, OpenRouter and Ollama's /v1) take
+# response_format=json_object; Anthropic is forced through a single tool call whose
+# input is the object. Models that reject either are remembered and sent plain.
+_JSON_TOOL = {"name": "emit_json", "description": "Return the requested JSON object.",
+              "input_schema": {"type": "object", "additionalProperties": True}}
+_NO_JSON_MODE: set[tuple[str, str]] = set()
+
+def _json_mode_kwargs(provider: str, model: str, json_mode: bool) -> dict:
+    if not json_mode or (provider, model) in _NO_JSON_MODE:
+        return {}
+    if provider == "anthropic":
+        return {"tools": [_JSON_TOOL], "tool_choice": {"type": "tool", "name": "emit_json"}}
+    return {"response_format": {"type": "json_object"}}
+
+def _rejected_json_mode(exc: Exception) -> bool:
+    msg = str(exc).lower()
+    return getattr(exc, "status_code", None) in (400, 404, 422) and any(
+        w in msg for w in ("response_format", "json", "tool"))
+
+def _anthropic_text(r) -> str:
+    for block in r.content:
+        if block.type == "tool_use":
+            return json.dumps(block.input, ensure_ascii=False)
+    return next((b.text for b in r.content if b.type == "text"), "")
+
+_PARSE_STATS: dict[tuple[str, str], list[int]] = {}       # (provider, model) -> [parsed, failed]
+_PARSE_LOCK = threading.Lock()       # worker threads and the async loop both record
+
+def _record_parse(provider: str, model: str, ok: bool) -> None:
+    with _PARSE_LOCK:
+        counts = _PARSE_STATS.setdefault((provider, model), [0, 0])
+        counts[0 if ok else 1] += 1
+
+def json_parse_stats() -> dict:
+    """Parse outcomes per model, for spotting models that need a different strategy."""
+    with _PARSE_LOCK:
+        stats = [(key, tuple(counts)) for key, counts in _PARSE_STATS.items()]
+    return {f"{p}/{m}": {"parsed": ok, "failed": bad, "failure_rate": bad / (ok + bad),
+                         "json_mode": (p, m) not in _NO_JSON_MODE}
+            for (p, m), (ok, bad) in stats if ok + bad}
+
+def _complete(c, provider, model, prompt, system_prompt, temperature, max_tokens,
+              timeout=None, json_mode=False) -> str:
+    extra = _json_mode_kwargs(provider, model, json_mode)
+    try:
+        if provider == "anthropic":
+            r = c.messages.create(model=model, max_tokens=max_tokens, temperature=temperature,
+                system=system_prompt or "You are a helpful assistant.",
+                messages=[{"role":"user","content":prompt}], timeout=timeout, **extra)
+            return _anthropic_text(r)
+        r = c.chat.completions.create(model=model, messages=_messages(prompt, system_prompt),
+                                      temperature=temperature, max_tokens=max_tokens,
+                                      timeout=timeout, **extra)
+        return r.choices[0].message.content.strip()
+    except Exception as exc:
+        if not extra or not _rejected_json_mode(exc):
+            raise
+        _NO_JSON_MODE.add((provider, model))
+        return _complete(c, provider, model, prompt, system_prompt, temperature, max_tokens, timeout)
+
+def _stream_chunks(c, provider, model, prompt, system_prompt, temperature, max_tokens, timeout):
+    if provider == "anthropic":
+        with c.messages.stream(model=model, max_tokens=max_tokens, temperature=temperature,
+                system=system_prompt or "You are a helpful assistant.",
+                messages=[{"role":"user","content":prompt}], timeout=timeout) as s:
+            yield from s.text_stream
+    else:
+        with c.chat.completions.create(model=model, messages=_messages(prompt, system_prompt),
+                                       temperature=temperature, max_tokens=max_tokens,
+                                       stream=True, timeout=timeout) as s:
+            for chunk in s:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+def call_llm(api_key, provider, model, prompt, system_prompt="", temperature=0.3,
+             max_tokens=1200, use_cache=True, deadline=None, feature="", hedge=None,
+             validate=None, json_mode=False) -> str:
+    """Single completion. Identical requests are served from the response cache
+    unless use_cache=False (e.g. an explicit "regenerate"). 429s and transient
+    5xx/connection errors are retried with backoff until `deadline` seconds.
+
+    hedge: optional HedgePolicy — past the feature's p90 latency (or on outright
+    failure) the same prompt also goes to hedge.provider/model; the first reply that
+    passes `validate` (a callable raising ValueError) wins.
+    json_mode: ask for provider-native JSON output where the model supports it."""
+    if usable_hedge(hedge, provider, model) is not None:
+        from src.core.async_llm import acall_llm, run_async
+        return run_async(acall_llm(api_key, provider, model, prompt, system_prompt, temperature,
+                                   max_tokens, use_cache, deadline, feature, hedge, validate,
+                                   json_mode))
+    cache = get_response_cache() if use_cache else None
+    key = cache_key(provider, model, system_prompt, prompt, temperature, max_tokens)
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+    c, started = get_client(api_key, provider), time.monotonic()
+    text = call_with_retries(lambda timeout: _complete(c, provider, model, prompt, system_prompt,
+                                                       temperature, max_tokens, timeout, json_mode),
+                             provider, policy_for(deadline))
+    LATENCY.record(feature, time.monotonic() - started)
+    if cache is not None:
+        cache.set(key, text)
+    return text
+
+def stream_llm(api_key, provider, model, prompt, system_prompt="", temperature=0.3,
+               max_tokens=1200, use_cache=True, deadline=None, feature="", hedge=None):
+    """Same contract as call_llm, but yields text chunks as the provider emits them.
+    A cached response is replayed as a single chunk; a fully streamed one is cached.
+    Only failures before the first chunk are retried — or, with a hedge, failed over."""
+    cache = get_response_cache() if use_cache else None
+    key = cache_key(provider, model, system_prompt, prompt, temperature, max_tokens)
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            yield hit
+            return
+    c, parts, started = get_client(api_key, provider), [], time.monotonic()
+    try:
+        for text in stream_with_retries(lambda timeout: _stream_chunks(c, provider, model, prompt,
+                                            system_prompt, temperature, max_tokens, timeout),
+                                        provider, policy_for(deadline)):
+            parts.append(text)
+            yield text
+    except Exception:
+        hedge = usable_hedge(hedge, provider, model)
+        if hedge is None or parts:
+            raise
+        yield from stream_llm(hedge.api_key, hedge.provider, hedge.model, prompt, system_prompt,
+                              temperature, max_tokens, use_cache, deadline, backup_feature(feature))
+        return
+    LATENCY.record(feature, time.monotonic() - started)
+    if cache is not None:
+        cache.set(key, "".join(parts).strip())
+
+def _call_json(api_key, provider, model, spec: dict, llm_opts: dict):
+    """call_llm in JSON mode + parse. An unparseable reply is evicted from the cache so a
+    retry refetches."""
+    raw = call_llm(api_key, provider, model, **llm_opts, **spec, validate=_safe_json_loads,
+                   json_mode=True)
+    try:
+        data = _safe_json_loads(raw)
+        _record_parse(provider, model, True)
+        return data
+    except ValueError:
+        _record_parse(provider, model, False)
+        cache = get_response_cache()
+        if cache is not None:
+            cache.invalidate(cache_key(provider, model, spec.get("system_prompt", ""), spec["prompt"],
+                                       spec["temperature"], spec["max_tokens"]))
+        raise
 
 # ══════════════════════════════════════════════════════════════════
-# 1. ATS ANALYSIS  (max 1800 output tokens)
+# 1. ATS ASSESSMENT  (max 2200 output tokens)
+#    One call feeds the Analyzer, Match % and Shortlist views, so the
+#    resume/JD are sent once and all three pages agree on the score.
 # ══════════════════════════════════════════════════════════════════
-_ANA_SYS = "You are a senior recruiter. Return ONLY valid JSON. No markdown, no preamble."
-_ANA_PROMPT = """\
-Analyze resume vs job description. Return ONLY this JSON:
-{"ats_score":<0-100>,
+_ASSESS_SYS = "You are a senior recruiter and hiring strategist. Return ONLY valid JSON. No markdown, no preamble."
+_ASSESS_PROMPT = """\
+Assess resume vs job description. Return ONLY this JSON:
+{"ats_score":<0-100 overall match>,
 "score_breakdown":{"keyword_match":<0-100>,"format_compatibility":<0-100>,"skills_alignment":<0-100>,"experience_relevance":<0-100>,"education_match":<0-100>},
-"matched_keywords":["<up to 10>"],
-"missing_keywords":["<up to 10 critical JD keywords absent from resume>"],
+"shortlist_probability":<0-100, consistent with ats_score>,
+"tier":"Top 10|Top 25|Reachable|Longshot|Not Competitive",
+"executive_summary":"<3 sentences>",
+"matched_keywords":[{"keyword":"<kw>","context":"<where the resume shows it>"}],
+"missing_keywords":[{"keyword":"<critical JD kw absent from resume>","why":"<why it matters>"}],
 "strengths":["<3-5 specific strengths with resume evidence>"],
 "weaknesses":["<3-5 specific weaknesses with before/after fix>"],
 "recommendations":["<5 ranked actionable rewrites>"],
+"critical_gaps":[{"gap":"<gap>","severity":"Knockout|Major|Minor","fix":"<exact change>","time":"Today|This Week|Longer"}],
+"accelerators":[{"action":"<action>","impact":"<why it helps>","priority":<1-5>}],
 "section_feedback":{"summary":"<2-3 sentences>","experience":"<2-3 sentences>","skills":"<2 sentences>","education":"<1-2 sentences>","formatting":"<2 sentences>"},
+"quick_win":"<one action>",
+"differentiator":"<1-2 sentences what makes them stand out>",
+"if_i_were_you":"<2 sentences direct advice>",
 "coffee_chat":"<3-4 sentences honest coaching to candidate>",
 "overall_verdict":"<2 sentences Yes/Yes with revisions/Not yet/No + reason>"}
+Up to 10 matched and 10 missing keywords.
 RESUME:
 """
 
-def analyze_resume(api_key, provider, model, resume_text, job_description) -> dict:
-    prompt = (_ANA_PROMPT + _trim(resume_text, _RESUME_LIMIT)
-              + "\n\nJOB DESCRIPTION:\n" + _trim(job_description, _JD_LIMIT) + "\n\nJSON:")
-    raw = call_llm(api_key, provider, model, prompt, system_prompt=_ANA_SYS,
-                   temperature=0.3, max_tokens=1800)
-    return _safe_json_loads(raw)
+def _assess_spec(resume_text, job_description) -> dict:
+    prompt = (_ASSESS_PROMPT + fit_resume(resume_text, "assess")
+              + "\n\nJOB DESCRIPTION:\n" + fit_jd(job_description, "assess") + "\n\nJSON:")
+    return dict(prompt=prompt, system_prompt=_ASSESS_SYS, temperature=0.3, max_tokens=2200,
+                feature="assess")
+
+def _kw(item, field: str) -> tuple[str, str]:
+    """Keyword entries may come back as plain strings from weaker models."""
+    if isinstance(item, dict):
+        return str(item.get("keyword", "")), str(item.get(field, ""))
+    return str(item), ""
+
+def assess_resume(api_key, provider, model, resume_text, job_description, **llm_opts) -> dict:
+    return _call_json(api_key, provider, model,
+                      _assess_spec(resume_text, job_description), llm_opts)
+
+def analysis_view(a: dict) -> dict:
+    """Analyzer page shape (the original analyze_resume schema)."""
+    keys = ("ats_score", "score_breakdown", "strengths", "weaknesses", "recommendations",
+            "section_feedback", "coffee_chat", "overall_verdict")
+    view = {k: a[k] for k in keys if k in a}
+    view["matched_keywords"] = [_kw(k, "context")[0] for k in a.get("matched_keywords", [])]
+    view["missing_keywords"] = [_kw(k, "why")[0] for k in a.get("missing_keywords", [])]
+    return view
+
+def match_view(a: dict) -> dict:
+    """Match % page shape: one score, top-5 matched/missing with reasons, a quick win."""
+    return {"score": a.get("ats_score", 0),
+            "matched": [_kw(k, "context") for k in a.get("matched_keywords", [])[:5]],
+            "missing": [_kw(k, "why") for k in a.get("missing_keywords", [])[:5]],
+            "quick_win": a.get("quick_win", "")}
+
+def shortlist_view(a: dict) -> dict:
+    """Shortlist Accelerator page shape (the original get_shortlist_accelerator schema)."""
+    keys = ("shortlist_probability", "tier", "executive_summary", "critical_gaps",
+            "accelerators", "differentiator", "if_i_were_you")
+    view = {k: a[k] for k in keys if k in a}
+    view["keyword_adds"] = [_kw(k, "why")[0] for k in a.get("missing_keywords", [])]
+    return view
+
+def format_match_text(m: dict) -> str:
+    lines = [f"ATS Match Score: {m['score']}%", "Top 5 Matched:"]
+    lines += [f"  {k} — {ctx}" if ctx else f"  {k}" for k, ctx in m["matched"]]
+    lines.append("Top 5 Missing:")
+    lines += [f"  {k} — {why}" if why else f"  {k}" for k, why in m["missing"]]
+    lines.append(f"Quick Win: {m['quick_win']}")
+    return "\n".join(lines)
+
+def analyze_resume(api_key, provider, model, resume_text, job_description, **llm_opts) -> dict:
+    return analysis_view(assess_resume(api_key, provider, model, resume_text, job_description,
+                                       **llm_opts))
 
 # ══════════════════════════════════════════════════════════════════
 # 2. RESUME OPTIMIZER  (max 2000 tokens)
 # ══════════════════════════════════════════════════════════════════
-def optimize_resume(api_key, provider, model, resume_text, job_description) -> str:
+def _optimize_spec(resume_text, job_description) -> dict:
     prompt = ("Rewrite this resume for maximum ATS score vs the job below.\n"
               "Rules: integrate JD keywords naturally, action verbs, quantify achievements, "
               "no tables/columns/graphics, keep all sections. Plain text only.\n\n"
-              "RESUME:\n" + _trim(resume_text, _RESUME_LIMIT)
-              + "\n\nJOB:\n" + _trim(job_description, _JD_LIMIT) + "\n\nOptimized resume:")
-    return call_llm(api_key, provider, model, prompt, temperature=0.4, max_tokens=2000)
+              "RESUME:\n" + fit_resume(resume_text, "optimize")
+              + "\n\nJOB:\n" + fit_jd(job_description, "optimize") + "\n\nOptimized resume:")
+    return dict(prompt=prompt, temperature=0.4, max_tokens=2000, feature="optimize")
+
+def optimize_resume(api_key, provider, model, resume_text, job_description, **llm_opts) -> str:
+    return call_llm(api_key, provider, model, **llm_opts,
+                    **_optimize_spec(resume_text, job_description))
+
+def stream_optimize_resume(api_key, provider, model, resume_text, job_description, **llm_opts):
+    return stream_llm(api_key, provider, model, **llm_opts,
+                      **_optimize_spec(resume_text, job_description))
 
 # ══════════════════════════════════════════════════════════════════
 # 3. COVER LETTER  (max 800 tokens)
 # ══════════════════════════════════════════════════════════════════
-def generate_cover_letter(api_key, provider, model, resume_text,
-                          job_description, tone="Professional", extra_notes="") -> str:
+def _cover_letter_spec(resume_text, job_description, tone, extra_notes) -> dict:
     prompt = (f"Write a compelling cover letter (250-320 words). Tone: {tone}.\n"
               f"Notes: {extra_notes or 'None'}.\n"
               "Strong hook, 2 body paragraphs referencing specific achievements, confident close. "
-              "No generic filler.\n\nRESUME:\n" + _trim(resume_text, 2000)
-              + "\n\nJOB:\n" + _trim(job_description, 1500) + "\n\nCover letter:")
-    return call_llm(api_key, provider, model, prompt, temperature=0.6, max_tokens=800)
+              "No generic filler.\n\nRESUME:\n" + fit_resume(resume_text, "cover_letter")
+              + "\n\nJOB:\n" + fit_jd(job_description, "cover_letter") + "\n\nCover letter:")
+    return dict(prompt=prompt, temperature=0.6, max_tokens=800, feature="cover_letter")
+
+def generate_cover_letter(api_key, provider, model, resume_text, job_description,
+                          tone="Professional", extra_notes="", **llm_opts) -> str:
+    return call_llm(api_key, provider, model, **llm_opts,
+                    **_cover_letter_spec(resume_text, job_description, tone, extra_notes))
+
+def stream_cover_letter(api_key, provider, model, resume_text, job_description,
+                        tone="Professional", extra_notes="", **llm_opts):
+    return stream_llm(api_key, provider, model, **llm_opts,
+                      **_cover_letter_spec(resume_text, job_description, tone, extra_notes))
 
 # ══════════════════════════════════════════════════════════════════
 # 4. INTERVIEW QUESTIONS  (max 1500 tokens)
 # ══════════════════════════════════════════════════════════════════
-_IQ_SYS = "You are a senior hiring manager. Return ONLY a valid JSON array. No markdown."
+_IQ_SYS = "You are a senior hiring manager. Return ONLY a valid JSON object. No markdown."
+
+def _questions_spec(resume_text, job_description, num_questions) -> dict:
+    prompt = (f"Generate {num_questions} interview questions. Return ONLY JSON:\n"
+              '{"questions":[{"category":"Behavioral|Technical|Situational|Culture Fit",'
+              '"question":"<question>","model_answer":"<STAR 3-4 sentences>","tip":"<one tip>"}]}\n\n'
+              "RESUME:\n" + fit_resume(resume_text, "questions")
+              + "\n\nJOB:\n" + fit_jd(job_description, "questions") + "\n\nJSON:")
+    return dict(prompt=prompt, system_prompt=_IQ_SYS, temperature=0.5, max_tokens=1500,
+                feature="questions")
+
+def _question_list(data) -> list:
+    """JSON mode returns {"questions": [...]}; a bare array is still accepted."""
+    return data.get("questions", []) if isinstance(data, dict) else data
 
 def generate_interview_questions(api_key, provider, model, resume_text,
-                                  job_description, num_questions=8) -> list:
-    prompt = (f"Generate {num_questions} interview questions. Return ONLY JSON array:\n"
-              '[{"category":"Behavioral|Technical|Situational|Culture Fit",'
-              '"question":"<question>","model_answer":"<STAR 3-4 sentences>","tip":"<one tip>"}]\n\n'
-              "RESUME:\n" + _trim(resume_text, 2000)
-              + "\n\nJOB:\n" + _trim(job_description, 1500) + "\n\nJSON array:")
-    raw = call_llm(api_key, provider, model, prompt, system_prompt=_IQ_SYS,
-                   temperature=0.5, max_tokens=1500)
-    return _safe_json_loads(raw)
+                                  job_description, num_questions=8, **llm_opts) -> list:
+    return _question_list(_call_json(api_key, provider, model,
+                          _questions_spec(resume_text, job_description, num_questions), llm_opts))
 
 # ══════════════════════════════════════════════════════════════════
 # 5. COACH CHATBOT  (max 600 tokens per turn)
 # ══════════════════════════════════════════════════════════════════
-def get_interview_chatbot_response(api_key, provider, model, resume_text,
-                                    job_description, chat_history) -> str:
+def _chatbot_spec(resume_text, job_description, chat_history) -> dict:
     history_str = ""
     for msg in chat_history[:-1]:
         role = "User" if msg["role"] == "user" else "Coach"
@@ -172,19 +383,27 @@ def get_interview_chatbot_response(api_key, provider, model, resume_text,
     user_q = chat_history[-1]["content"]
     sys = ("You are an expert interview coach who knows this candidate's resume and the job. "
            "Give specific, direct advice in 2-3 short paragraphs. Reference their actual experience.")
-    prompt = ("RESUME:\n" + _trim(resume_text, 1200)
-              + "\n\nJOB:\n" + _trim(job_description, 800)
+    prompt = ("RESUME:\n" + fit_resume(resume_text, "chat")
+              + "\n\nJOB:\n" + fit_jd(job_description, "chat")
               + "\n\nHISTORY:\n" + history_str
               + "\nUser: " + user_q + "\n\nCoach:")
-    return call_llm(api_key, provider, model, prompt, system_prompt=sys,
-                    temperature=0.6, max_tokens=600)
+    return dict(prompt=prompt, system_prompt=sys, temperature=0.6, max_tokens=600,
+                feature="chat")
+
+def get_interview_chatbot_response(api_key, provider, model, resume_text,
+                                    job_description, chat_history, **llm_opts) -> str:
+    return call_llm(api_key, provider, model, **llm_opts,
+                    **_chatbot_spec(resume_text, job_description, chat_history))
+
+def stream_interview_chatbot_response(api_key, provider, model, resume_text,
+                                      job_description, chat_history, **llm_opts):
+    return stream_llm(api_key, provider, model, **llm_opts,
+                      **_chatbot_spec(resume_text, job_description, chat_history))
 
 # ══════════════════════════════════════════════════════════════════
 # 6. PRACTICE MODE — generate question  (max 250 tokens)
 # ══════════════════════════════════════════════════════════════════
-def generate_practice_question(api_key, provider, model, resume_text,
-                                job_description, asked_questions: list,
-                                category: str = "Any") -> dict:
+def _practice_spec(resume_text, job_description, asked_questions, category) -> dict:
     asked_str = "\n".join(f"- {q}" for q in asked_questions[-8:]) or "None yet"
     cat_filter = f"Category: {category}." if category != "Any" else "Mix categories."
     prompt = ("Generate ONE interview question. " + cat_filter
@@ -192,19 +411,21 @@ def generate_practice_question(api_key, provider, model, resume_text,
               + "\n\nReturn ONLY JSON:\n"
               '{"question":"<text>","category":"Behavioral|Technical|Situational|Culture Fit",'
               '"what_they_look_for":"<1-2 sentences>"}'
-              + "\n\nRESUME:\n" + _trim(resume_text, 1200)
-              + "\n\nJOB:\n" + _trim(job_description, 800) + "\n\nJSON:")
-    raw = call_llm(api_key, provider, model, prompt,
-                   system_prompt="Return ONLY valid JSON. No markdown.",
-                   temperature=0.7, max_tokens=250)
-    return _safe_json_loads(raw)
+              + "\n\nRESUME:\n" + fit_resume(resume_text, "practice")
+              + "\n\nJOB:\n" + fit_jd(job_description, "practice") + "\n\nJSON:")
+    return dict(prompt=prompt, system_prompt="Return ONLY valid JSON. No markdown.",
+                temperature=0.7, max_tokens=250, feature="practice")
+
+def generate_practice_question(api_key, provider, model, resume_text,
+                                job_description, asked_questions: list,
+                                category: str = "Any", **llm_opts) -> dict:
+    return _call_json(api_key, provider, model,
+                      _practice_spec(resume_text, job_description, asked_questions, category), llm_opts)
 
 # ══════════════════════════════════════════════════════════════════
 # 7. GRADE ANSWER  (max 500 tokens)
 # ══════════════════════════════════════════════════════════════════
-def grade_interview_answer(api_key, provider, model, question: str,
-                            user_answer: str, resume_text: str,
-                            job_description: str) -> dict:
+def _grade_spec(question, user_answer, resume_text, job_description) -> dict:
     prompt = ('Grade this interview answer. Return ONLY JSON:\n'
               '{"score":<0-100>,"grade":"A|B|C|D|F",'
               '"star_breakdown":{"situation":<0-25>,"task":<0-25>,"action":<0-25>,"result":<0-25>},'
@@ -214,48 +435,45 @@ def grade_interview_answer(api_key, provider, model, question: str,
               '"verdict":"<2 sentences honest assessment>"}'
               + "\n\nQUESTION: " + question
               + "\n\nCANDIDATE ANSWER: " + user_answer[:1200]
-              + "\n\nRESUME CONTEXT:\n" + _trim(resume_text, 800)
-              + "\n\nJOB CONTEXT:\n" + _trim(job_description, 500) + "\n\nJSON:")
-    raw = call_llm(api_key, provider, model, prompt,
-                   system_prompt="You are a strict but fair interview assessor. Return ONLY valid JSON.",
-                   temperature=0.3, max_tokens=500)
-    return _safe_json_loads(raw)
+              + "\n\nRESUME CONTEXT:\n" + fit_resume(resume_text, "grade")
+              + "\n\nJOB CONTEXT:\n" + fit_jd(job_description, "grade") + "\n\nJSON:")
+    return dict(prompt=prompt,
+                system_prompt="You are a strict but fair interview assessor. Return ONLY valid JSON.",
+                temperature=0.3, max_tokens=500, feature="grade")
+
+def grade_interview_answer(api_key, provider, model, question: str,
+                            user_answer: str, resume_text: str,
+                            job_description: str, **llm_opts) -> dict:
+    return _call_json(api_key, provider, model,
+                      _grade_spec(question, user_answer, resume_text, job_description), llm_opts)
 
 # ══════════════════════════════════════════════════════════════════
-# 8. SHORTLIST ACCELERATOR  (max 1200 tokens)
+# 8. SHORTLIST ACCELERATOR  — view of the assessment
 # ══════════════════════════════════════════════════════════════════
-def get_shortlist_accelerator(api_key, provider, model, resume_text, job_description) -> dict:
-    prompt = ('Analyze resume vs JD. Return ONLY JSON:\n'
-              '{"shortlist_probability":<0-100>,"tier":"Top 10|Top 25|Reachable|Longshot|Not Competitive",'
-              '"executive_summary":"<3 sentences>",'
-              '"critical_gaps":[{"gap":"<gap>","severity":"Knockout|Major|Minor","fix":"<exact change>","time":"Today|This Week|Longer"}],'
-              '"accelerators":[{"action":"<action>","impact":"<why it helps>","priority":<1-5>}],'
-              '"keyword_adds":["<missing keyword>"],'
-              '"differentiator":"<1-2 sentences what makes them stand out>",'
-              '"if_i_were_you":"<2 sentences direct advice>"}'
-              + "\n\nRESUME:\n" + _trim(resume_text, 2500)
-              + "\n\nJOB:\n" + _trim(job_description, 1500) + "\n\nJSON:")
-    raw = call_llm(api_key, provider, model, prompt,
-                   system_prompt="You are a hiring strategy expert. Return ONLY valid JSON.",
-                   temperature=0.4, max_tokens=1200)
-    return _safe_json_loads(raw)
+def get_shortlist_accelerator(api_key, provider, model, resume_text, job_description,
+                              **llm_opts) -> dict:
+    return shortlist_view(assess_resume(api_key, provider, model, resume_text, job_description,
+                                        **llm_opts))
 
 # ══════════════════════════════════════════════════════════════════
-# 9. PERCENTAGE MATCH  (max 600 tokens)
+# 9. PERCENTAGE MATCH  — view of the assessment
 # ══════════════════════════════════════════════════════════════════
-def get_percentage_match(api_key, provider, model, resume_text, job_description) -> str:
-    prompt = ("Score resume vs JD (0-100): Hard Skills 35%, Experience 25%, "
-              "Achievements 20%, Qualifications 15%, Keywords 5%.\n\n"
-              "Output:\nATS Match Score: X%\nTop 5 Matched: keyword — context\n"
-              "Top 5 Missing: keyword — why\nQuick Win: [one action]\n\n"
-              "RESUME:\n" + _trim(resume_text, 2000) + "\n\nJOB:\n" + _trim(job_description, 1500))
-    return call_llm(api_key, provider, model, prompt, temperature=0.3, max_tokens=600)
+def get_percentage_match(api_key, provider, model, resume_text, job_description,
+                         **llm_opts) -> str:
+    return format_match_text(match_view(assess_resume(api_key, provider, model, resume_text,
+                                                      job_description, **llm_opts)))
 
 # ══════════════════════════════════════════════════════════════════
 # 10. RESUME BUILDER  (max 2000 tokens)
 # ══════════════════════════════════════════════════════════════════
-def build_resume_from_info(api_key, provider, model, user_info: dict) -> str:
+def _builder_spec(user_info: dict) -> dict:
     prompt = ("Build an ATS-optimized resume. Sections: Professional Summary, "
               "Work Experience, Skills, Education. Action verbs, quantify achievements, plain text.\n\n"
               "INFO:\n" + json.dumps(user_info, indent=2) + "\n\nResume:")
-    return call_llm(api_key, provider, model, prompt, temperature=0.4, max_tokens=2000)
+    return dict(prompt=prompt, temperature=0.4, max_tokens=2000, feature="builder")
+
+def build_resume_from_info(api_key, provider, model, user_info: dict, **llm_opts) -> str:
+    return call_llm(api_key, provider, model, **llm_opts, **_builder_spec(user_info))
+
+def stream_resume_from_info(api_key, provider, model, user_info: dict, **llm_opts):
+    return stream_llm(api_key, provider, model, **llm_opts, **_builder_spec(user_info))
@@ -0,0 +1,57 @@
+"""
+ATS Resume Studio v3 - Full Report
+Dispatches the assessment (which feeds the analysis, match % and shortlist views)
+and the interview questions concurrently, so wall time is roughly the slower of
+the two calls instead of the sum.
+"""
+from __future__ import annotations
+import asyncio, concurrent.futures, time
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.async_llm import aassess_resume, agenerate_interview_questions, submit_async
+
+REPORT_PARTS = ("assessment", "questions")
+
+
+@dataclass
+class ReportPart:
+    name: str
+    result: Any = None
+    error: str = ""
+    seconds: float = 0.0
+
+
+async def _timed(name: str, coro) -> ReportPart:
+    t0 = time.perf_counter()
+    try:
+        return ReportPart(name, result=await coro, seconds=time.perf_counter() - t0)
+    except Exception as e:
+        return ReportPart(name, error=str(e), seconds=time.perf_counter() - t0)
+
+
+def _report_coros(api_key, provider, model, resume_text, job_description,
+                  num_questions, llm_opts) -> dict:
+    args = (api_key, provider, model, resume_text, job_description)
+    return {
+        "assessment": aassess_resume(*args, **llm_opts),
+        "questions":  agenerate_interview_questions(*args, num_questions, **llm_opts),
+    }
+
+
+def iter_full_report(api_key, provider, model, resume_text, job_description,
+                     num_questions: int = 8, **llm_opts):
+    """Yield a ReportPart per call in completion order. Failures are reported, not raised."""
+    coros = _report_coros(api_key, provider, model, resume_text, job_description,
+                          num_questions, llm_opts)
+    futures = [submit_async(_timed(name, c)) for name, c in coros.items()]
+    for fut in concurrent.futures.as_completed(futures):
+        yield fut.result()
+
+
+async def afull_report(api_key, provider, model, resume_text, job_description,
+                       num_questions: int = 8, **llm_opts) -> dict[str, ReportPart]:
+    coros = _report_coros(api_key, provider, model, resume_text, job_description,
+                          num_questions, llm_opts)
+    parts = await asyncio.gather(*(_timed(n, c) for n, c in coros.items()))
+    return {p.name: p for p in parts}
@@ -0,0 +1,271 @@
+"""
+ATS Resume Studio v3 - Retries, Backoff & Circuit Breaking
+Wraps provider calls so 429s and transient 5xx/connection errors are retried with
+jittered exponential backoff (honouring Retry-After) inside a per-request deadline,
+and a provider that keeps failing is short-circuited instead of hammered.
+
+The SDK clients are built with max_retries=0 so this layer is the single retry authority.
+"""
+from __future__ import annotations
+import asyncio, email.utils, os, random, threading, time
+from dataclasses import dataclass, replace
+
+_RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504, 520, 522, 524, 529}
+# Rate limits are per API key, but breakers are per provider: one user exhausting their
+# own key must not pause the provider for every other key. 429s are retried, not counted.
+_PER_KEY_STATUS = {429}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling the provider while its breaker is open."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """The request's overall deadline ran out across attempts."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = int(os.getenv("ATS_RETRY_ATTEMPTS", "4"))
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    deadline: float = float(os.getenv("ATS_REQUEST_DEADLINE", "90"))
+
+DEFAULT_POLICY = RetryPolicy()
+
+
+# ── Error classification ─────────────────────────────────────────
+def _status(exc) -> int | None:
+    code = getattr(exc, "status_code", None)
+    if code is None:
+        code = getattr(getattr(exc, "response", None), "status_code", None)
+    return code if isinstance(code, int) else None
+
+def _retry_after(exc) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    ms = headers.get("retry-after-ms")
+    if ms:
+        try:
+            return float(ms) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        parsed = email.utils.parsedate_to_datetime(value) if value else None
+        return max(0.0, parsed.timestamp() - time.time()) if parsed else None
+
+def classify_error(exc: BaseException) -> tuple[bool, float | None]:
+    """(retryable, retry_after_seconds) for an exception raised by a provider SDK."""
+    if isinstance(exc, (CircuitOpenError, DeadlineExceeded)):
+        return False, None
+    status = _status(exc)
+    if status is not None:
+        return status in _RETRYABLE_STATUS, _retry_after(exc)
+    name = type(exc).__name__
+    if isinstance(exc, (ConnectionError, TimeoutError)) or "Connection" in name or "Timeout" in name:
+        return True, None
+    return False, None
+
+def backoff_delay(attempt: int, policy: RetryPolicy, retry_after: float | None) -> float:
+    """Full-jitter exponential backoff; a server-supplied Retry-After is a floor."""
+    delay = random.uniform(0, min(policy.max_delay, policy.base_delay * 2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, retry_after + random.uniform(0, 0.25))
+    return delay
+
+
+# ── Circuit breaker ──────────────────────────────────────────────
+class CircuitBreaker:
+    """closed → open after N consecutive transient failures → half-open after cooldown
+    (one trial request) → closed on success, open again on failure.
+
+    A trial that ends without a verdict (cancelled, stream closed by the consumer) is
+    released by its caller; one that is never released expires after trial_timeout,
+    so a lost trial cannot keep the breaker open."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 trial_timeout: float = DEFAULT_POLICY.deadline + 30.0):
+        self.name, self.failure_threshold, self.reset_timeout = name, failure_threshold, reset_timeout
+        self.trial_timeout = trial_timeout
+        self.failures, self.opened_at, self.trial_in_flight = 0, None, False
+        self._trial, self._trial_started = 0, 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+
+    def before_call(self) -> int | None:
+        """Raise CircuitOpenError, or admit the call. Returns the trial id when this call
+        is the half-open trial (pass it to release_trial), else None."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return None
+            now = time.monotonic()
+            if state == "half-open" and (not self.trial_in_flight
+                                         or now - self._trial_started >= self.trial_timeout):
+                self.trial_in_flight, self._trial_started = True, now
+                self._trial += 1
+                return self._trial
+            wait = self.reset_timeout - (now - self.opened_at)
+        raise CircuitOpenError(f"{self.name} is failing repeatedly — pausing requests for "
+                               f"{max(wait, 1):.0f}s. Try again shortly or switch provider.")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures, self.opened_at, self.trial_in_flight = 0, None, False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.trial_in_flight = False
+
+    def release_trial(self, trial: int | None) -> None:
+        """Free the trial slot if `trial` still holds it and no verdict was recorded."""
+        if trial is None:
+            return
+        with self._lock:
+            if self.trial_in_flight and self._trial == trial:
+                self.trial_in_flight = False
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+def breaker_for(provider: str) -> CircuitBreaker:
+    with _BREAKERS_LOCK:
+        if provider not in _BREAKERS:
+            _BREAKERS[provider] = CircuitBreaker(provider)
+        return _BREAKERS[provider]
+
+
+# ── Retry loops ──────────────────────────────────────────────────
+def _after_failure(exc, breaker, attempt, policy, started) -> float:
+    """Record the failure and return the sleep before the next attempt, or re-raise."""
+    retryable, retry_after = classify_error(exc)
+    if not retryable:
+        if _status(exc) is None or _status(exc) >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()          # 4xx: provider is up, the request is wrong
+        raise exc
+    if _status(exc) not in _PER_KEY_STATUS:   # a 429 gets no verdict; its trial is just released
+        breaker.record_failure()
+    if attempt + 1 >= policy.max_attempts:
+        raise exc
+    delay = backoff_delay(attempt, policy, retry_after)
+    if time.monotonic() - started + delay >= policy.deadline:
+        raise DeadlineExceeded(f"Gave up after {attempt + 1} attempts: {exc}") from exc
+    return delay
+
+# Each attempt releases its half-open trial in `finally`: cancellation (a losing hedge,
+# a disconnected SSE client, a cancelled job) and GeneratorExit are BaseExceptions, so
+# they skip the `except Exception` verdicts below.
+def call_with_retries(fn, provider: str, policy: RetryPolicy = DEFAULT_POLICY):
+    """fn(timeout_seconds) -> result. Retries transient errors within policy.deadline."""
+    breaker, started = breaker_for(provider), time.monotonic()
+    for attempt in range(policy.max_attempts):
+        trial = breaker.before_call()
+        try:
+            remaining = policy.deadline - (time.monotonic() - started)
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Request deadline of {policy.deadline:.0f}s exceeded.")
+            try:
+                result = fn(remaining)
+            except Exception as exc:
+                delay = _after_failure(exc, breaker, attempt, policy, started)
+            else:
+                breaker.record_success()
+                return result
+        finally:
+            breaker.release_trial(trial)
+        time.sleep(delay)
+
+async def acall_with_retries(coro_fn, provider: str, policy: RetryPolicy = DEFAULT_POLICY):
+    """Async twin of call_with_retries: coro_fn(timeout_seconds) -> awaitable."""
+    breaker, started = breaker_for(provider), time.monotonic()
+    for attempt in range(policy.max_attempts):
+        trial = breaker.before_call()
+        try:
+            remaining = policy.deadline - (time.monotonic() - started)
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Request deadline of {policy.deadline:.0f}s exceeded.")
+            try:
+                result = await coro_fn(remaining)
+            except Exception as exc:
+                delay = _after_failure(exc, breaker, attempt, policy, started)
+            else:
+                breaker.record_success()
+                return result
+        finally:
+            breaker.release_trial(trial)
+        await asyncio.sleep(delay)
+
+def stream_with_retries(open_stream, provider: str, policy: RetryPolicy = DEFAULT_POLICY):
+    """open_stream(timeout_seconds) -> iterator of chunks. A failure before the first
+    chunk is retried like call_with_retries; once text has reached the caller it is not."""
+    breaker, started = breaker_for(provider), time.monotonic()
+    for attempt in range(policy.max_attempts):
+        trial = breaker.before_call()
+        try:
+            remaining = policy.deadline - (time.monotonic() - started)
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Request deadline of {policy.deadline:.0f}s exceeded.")
+            emitted = False
+            try:
+                for chunk in open_stream(remaining):
+                    emitted = True
+                    yield chunk
+            except Exception as exc:
+                if emitted:
+                    if classify_error(exc)[0] and _status(exc) not in _PER_KEY_STATUS:
+                        breaker.record_failure()
+                    raise
+                delay = _after_failure(exc, breaker, attempt, policy, started)
+            else:
+                breaker.record_success()
+                return
+        finally:
+            breaker.release_trial(trial)
+        time.sleep(delay)
+
+async def astream_with_retries(open_stream, provider: str, policy: RetryPolicy = DEFAULT_POLICY):
+    """Async twin of stream_with_retries: open_stream(timeout_seconds) -> async iterator."""
+    breaker, started = breaker_for(provider), time.monotonic()
+    for attempt in range(policy.max_attempts):
+        trial = breaker.before_call()
+        try:
+            remaining = policy.deadline - (time.monotonic() - started)
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Request deadline of {policy.deadline:.0f}s exceeded.")
+            emitted = False
+            try:
+                async for chunk in open_stream(remaining):
+                    emitted = True
+                    yield chunk
+            except Exception as exc:
+                if emitted:
+                    if classify_error(exc)[0] and _status(exc) not in _PER_KEY_STATUS:
+                        breaker.record_failure()
+                    raise
+                delay = _after_failure(exc, breaker, attempt, policy, started)
+            else:
+                breaker.record_success()
+                return
+        finally:
+            breaker.release_trial(trial)
+        await asyncio.sleep(delay)
+
+def policy_for(deadline: float | None) -> RetryPolicy:
+    """DEFAULT_POLICY, or a copy with a caller-supplied deadline (seconds)."""
+    return DEFAULT_POLICY if deadline is None else replace(DEFAULT_POLICY, deadline=deadline)
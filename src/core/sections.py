@@ -0,0 +1,143 @@
+"""
+ATS Resume Studio v3 - Resume Segmentation
+Local, deterministic split of resume text into Contact, Summary, Experience (one
+entry per role), Skills, Education, Projects and the rest. Runs once per distinct
+text (keyed by SHA-256) and is cached, so every feature and rerun reuses it.
+
+Features then send only the sections they need (FEATURE_SECTIONS) — grading a STAR
+answer needs Experience, not Education.
+"""
+from __future__ import annotations
+import hashlib, re, threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+# ── Headings ──────────────────────────────────────────────────────
+_SECTION_ALIASES = {
+    "summary":        ("summary", "professional summary", "profile", "objective", "about me",
+                       "career summary", "career objective"),
+    "experience":     ("experience", "work experience", "professional experience", "employment",
+                       "employment history", "work history", "career history", "relevant experience"),
+    "skills":         ("skills", "technical skills", "core competencies", "competencies",
+                       "technologies", "tech stack", "key skills", "tools"),
+    "education":      ("education", "academic background", "qualifications", "education and training"),
+    "projects":       ("projects", "personal projects", "key projects", "selected projects"),
+    "certifications": ("certifications", "certificates", "licenses", "licenses and certifications"),
+    "awards":         ("awards", "honors", "achievements", "awards and achievements"),
+    "other":          ("publications", "volunteer", "volunteering", "languages", "interests",
+                       "references", "activities", "leadership"),
+}
+_HEADING_LOOKUP = {alias: name for name, aliases in _SECTION_ALIASES.items() for alias in aliases}
+
+def _heading_name(line: str) -> str | None:
+    s = line.strip().strip(":").strip()
+    if not s or len(s) > 40:
+        return None
+    key = re.sub(r"[^a-z& ]", "", s.lower()).replace("&", "and").strip()
+    return _HEADING_LOOKUP.get(key)
+
+def split_sections(text: str) -> list[tuple[str, str]]:
+    """[(section_name, body)] in document order. Text before the first heading is 'contact'."""
+    sections, name, buf = [], "contact", []
+    for line in text.splitlines():
+        heading = _heading_name(line)
+        if heading:
+            if any(l.strip() for l in buf):
+                sections.append((name, "\n".join(buf).strip()))
+            name, buf = heading, [line.strip()]
+        else:
+            buf.append(line)
+    if any(l.strip() for l in buf):
+        sections.append((name, "\n".join(buf).strip()))
+    return sections
+
+# ── Roles inside Experience ───────────────────────────────────────
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_WHEN  = rf"(?:{_MONTH}\s+\d{{4}}|\d{{1,2}}/\d{{4}}|\d{{4}})"
+_DATE_RANGE = re.compile(rf"{_WHEN}\s*(?:-|–|—|to)\s*(?:{_WHEN}|present|current|now|today)", re.I)
+_BULLET = re.compile(r"^\s*(?:[-•*▪◦●‣–]|\d+[.)])\s+")
+
+@dataclass(frozen=True)
+class Role:
+    header: str          # title / company / dates line(s)
+    body: str            # header + bullets, as it appears in the resume
+
+def split_roles(experience: str) -> list[Role]:
+    """Split an Experience section into roles at header lines carrying a date range
+    (or the title line directly above one)."""
+    lines = experience.splitlines()
+    if lines and _heading_name(lines[0]):
+        lines = lines[1:]
+    starts = []
+    for i, line in enumerate(lines):
+        if _BULLET.match(line) or not _DATE_RANGE.search(line):
+            continue
+        start = i
+        prev = lines[i - 1].strip() if i else ""
+        if (i and prev and not _BULLET.match(lines[i - 1]) and len(prev) < 90
+                and not _DATE_RANGE.search(prev) and (not starts or i - 1 > starts[-1])):
+            start = i - 1
+        if not starts or start > starts[-1]:
+            starts.append(start)
+    if not starts:
+        return [Role("", experience.strip())] if experience.strip() else []
+    if starts[0] > 0 and any(l.strip() for l in lines[:starts[0]]):
+        starts.insert(0, 0)
+    roles = []
+    for a, b in zip(starts, starts[1:] + [len(lines)]):
+        chunk = lines[a:b]
+        body = "\n".join(chunk).strip()
+        if body:
+            header = " · ".join(l.strip() for l in chunk[:2] if l.strip() and not _BULLET.match(l))
+            roles.append(Role(header, body))
+    return roles
+
+# ── Segmented resume ──────────────────────────────────────────────
+@dataclass(frozen=True)
+class ResumeSections:
+    sections: tuple = ()                       # ((name, body), ...) in document order
+    roles: tuple = ()                          # Role entries from Experience, in order
+    names: frozenset = field(default_factory=frozenset)
+
+    @property
+    def recognised(self) -> bool:
+        """False when no headings were found — callers should treat the text as one blob."""
+        return bool(self.names - {"contact"})
+
+    def get(self, name: str) -> str:
+        return "\n\n".join(body for n, body in self.sections if n == name)
+
+_CACHE: OrderedDict[str, ResumeSections] = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_SIZE = 512
+
+def segment_resume(text: str, digest: str = "") -> ResumeSections:
+    """Segment once per distinct text; `digest` may be passed if already known."""
+    key = digest or hashlib.sha256(text.encode("utf-8")).hexdigest()
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None:
+            _CACHE.move_to_end(key)
+            return hit
+    sections = split_sections(text)
+    roles = tuple(r for n, body in sections if n == "experience" for r in split_roles(body))
+    seg = ResumeSections(tuple(sections), roles, frozenset(n for n, _ in sections))
+    with _CACHE_LOCK:
+        _CACHE[key] = seg
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return seg
+
+# ── What each feature needs (in packing priority order) ───────────
+ALL_SECTIONS = ("skills", "experience", "summary", "projects", "certifications",
+                "education", "awards", "contact", "other")
+FEATURE_SECTIONS = {
+    "assess":       ALL_SECTIONS,
+    "optimize":     ALL_SECTIONS,
+    "custom":       ALL_SECTIONS,
+    "cover_letter": ("experience", "summary", "skills", "contact"),
+    "questions":    ("experience", "skills", "projects", "summary"),
+    "chat":         ("experience", "skills", "summary", "projects"),
+    "practice":     ("experience", "skills", "projects"),
+    "grade":        ("experience",),
+}
@@ -0,0 +1,196 @@
+"""
+ATS Resume Studio v3 - Skill Taxonomy Matcher
+Bundled dictionary of skills, tools and certifications with aliases ("k8s" →
+Kubernetes), compiled once into an Aho-Corasick automaton so a resume or JD is
+scanned in a single linear pass — no LLM call.
+
+The compiled automaton is pickled next to the response cache, keyed by the hash of
+the dictionary files, so later processes skip the build. Extra dictionaries in the
+same format (src/data/skills.txt) can be listed in ATS_SKILLS_FILES.
+"""
+from __future__ import annotations
+import hashlib, os, pickle, re, threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from src.core.cache import CACHE_DIR
+
+_SEED = Path(__file__).resolve().parent.parent / "data" / "skills.txt"
+_FORMAT = 1                                      # bump when the pickled layout changes
+_SPACES = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class Skill:
+    name: str
+    category: str
+
+
+@dataclass(frozen=True)
+class SkillGap:
+    matched: list = field(default_factory=list)      # canonical names in both, JD order
+    missing: list = field(default_factory=list)      # in the JD only, most-mentioned first
+    jd_skills: int = 0
+
+
+# ── Dictionary ───────────────────────────────────────────────────
+def dictionary_paths() -> list[Path]:
+    extra = [Path(p) for p in os.getenv("ATS_SKILLS_FILES", "").split(os.pathsep) if p.strip()]
+    return [_SEED] + [p for p in extra if p.is_file()]
+
+def parse_dictionary(text: str) -> list[tuple[Skill, list[tuple[str, bool]]]]:
+    """[(Skill, [(alias, exact_case), ...])] from 'Canonical | category | alias, alias' lines."""
+    entries = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, category, aliases = (line.split("|") + ["", ""])[:3]
+        name, exact = name.strip(), name.strip().startswith("~")
+        name = name.lstrip("~").strip()
+        if not name:
+            continue
+        forms = [(name, exact)] + [(a.strip(), False) for a in aliases.split(",") if a.strip()]
+        entries.append((Skill(name, category.strip() or "other"), forms))
+    return entries
+
+
+# ── Automaton ────────────────────────────────────────────────────
+class SkillAutomaton:
+    """Aho-Corasick over lower-cased characters. Matches are whole words only and
+    resolved leftmost-longest, so 'spring boot' wins over 'spring'."""
+
+    def __init__(self, entries):
+        self.skills: list[Skill] = []
+        self.patterns: list[tuple[str, int, bool]] = []      # (surface, skill index, exact case)
+        self.lookup: dict[str, int] = {}                     # lower-cased alias → skill index
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.out: list[tuple[int, ...]] = [()]
+        for skill, forms in entries:
+            self.skills.append(skill)
+            for surface, exact in forms:
+                key = _SPACES.sub(" ", surface.lower())
+                if key in self.lookup and not exact:
+                    continue                                 # first entry owns an alias
+                self.lookup.setdefault(key, len(self.skills) - 1)
+                self._insert(key, len(self.patterns))
+                self.patterns.append((_SPACES.sub(" ", surface), len(self.skills) - 1, exact))
+        self._link()
+
+    def _insert(self, key: str, pid: int) -> None:
+        state = 0
+        for ch in key:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][ch] = nxt
+                self.goto.append({}); self.fail.append(0); self.out.append(())
+            state = nxt
+        self.out[state] += (pid,)
+
+    def _link(self) -> None:
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] += self.out[self.fail[nxt]]
+
+    def scan(self, text: str) -> list[tuple[int, int, int]]:
+        """[(start, end, skill index)] in the whitespace-normalised text, non-overlapping."""
+        norm = _SPACES.sub(" ", text)
+        low = norm.lower()
+        same_len = len(low) == len(norm)                     # lower() can grow some code points
+        goto, fail, out, patterns = self.goto, self.fail, self.out, self.patterns
+        hits, state = [], 0
+        for i, ch in enumerate(low):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pid in out[state]:
+                surface, skill, exact = patterns[pid]
+                start = i - len(surface) + 1
+                if start > 0 and low[start - 1].isalnum() or i + 1 < len(low) and low[i + 1].isalnum():
+                    continue
+                if exact and (not same_len or norm[start:i + 1] != surface):
+                    continue
+                hits.append((start, i + 1, skill))
+        hits.sort(key=lambda h: (h[0], h[0] - h[1]))
+        chosen, end = [], -1
+        for start, stop, skill in hits:
+            if start >= end:
+                chosen.append((start, stop, skill))
+                end = stop
+        return chosen
+
+    def canonical(self, term: str) -> str | None:
+        idx = self.lookup.get(_SPACES.sub(" ", term.strip().lower()))
+        return None if idx is None else self.skills[idx].name
+
+
+_AUTOMATON: SkillAutomaton | None = None
+_LOCK = threading.Lock()
+
+def _compile() -> SkillAutomaton:
+    sources = [p.read_text(encoding="utf-8") for p in dictionary_paths()]
+    digest = hashlib.sha256("\0".join([str(_FORMAT)] + sources).encode("utf-8")).hexdigest()[:16]
+    path = CACHE_DIR / f"skills-{digest}.pkl"
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+    automaton = SkillAutomaton([e for text in sources for e in parse_dictionary(text)])
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(automaton, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        pass                                             # read-only disk: rebuild next start
+    return automaton
+
+def get_automaton() -> SkillAutomaton:
+    global _AUTOMATON
+    if _AUTOMATON is None:
+        with _LOCK:
+            if _AUTOMATON is None:
+                _AUTOMATON = _compile()
+    return _AUTOMATON
+
+
+# ── Public helpers ───────────────────────────────────────────────
+@lru_cache(maxsize=256)
+def find_skills(text: str) -> dict[str, int]:
+    """Canonical skill → mentions, in order of first appearance."""
+    ac = get_automaton()
+    return dict(Counter(ac.skills[s].name for _, _, s in ac.scan(text)))
+
+@lru_cache(maxsize=128)
+def skill_gap(resume_text: str, job_description: str) -> SkillGap:
+    jd, cv = find_skills(job_description), find_skills(resume_text)
+    order = {name: i for i, name in enumerate(jd)}
+    missing = sorted((s for s in jd if s not in cv), key=lambda s: (-jd[s], order[s]))
+    return SkillGap([s for s in jd if s in cv], missing, len(jd))
+
+def merge_keywords(*groups, exclude=(), limit: int | None = None) -> list[str]:
+    """Concatenate keyword lists, dropping repeats and anything in `exclude` —
+    'k8s' and 'Kubernetes' count as one."""
+    ac, merged = get_automaton(), []
+    seen = {(ac.canonical(kw) or kw).strip().lower() for kw in exclude}
+    for group in groups:
+        for kw in group:
+            key = (ac.canonical(kw) or kw).strip().lower()
+            if kw and key not in seen:
+                seen.add(key)
+                merged.append(kw)
+    return merged[:limit] if limit else merged
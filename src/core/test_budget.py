@@ -0,0 +1,73 @@
+"""Tests for token budgets and section packing (src/core/budget.py)."""
+from src.core.budget import FEATURE_BUDGETS, count_tokens, fit_jd, fit_resume, truncate_tokens
+
+MARKER_SLACK = 12          # "[...]" / "[...truncated]" markers added after packing
+
+
+def _resume(n_roles: int, bullets: int = 12) -> str:
+    lines = ["Jane Doe", "jane@example.com", "", "SUMMARY", "Backend engineer.", "", "EXPERIENCE"]
+    for r in range(n_roles):
+        lines.append(f"Role {r} title, Company {r} | {2023 - 2 * r} - {2024 - 2 * r}")
+        lines += [f"- Led project {r}.{b} shipping services to production for many teams"
+                  for b in range(bullets)]
+    lines += ["", "SKILLS", "Python, SQL", "", "EDUCATION", "B.Sc. Computer Science, Some University"]
+    return "\n".join(lines)
+
+
+def test_truncate_tokens_keeps_whole_lines_within_budget():
+    text = "\n".join(f"line number {i} with a few words" for i in range(50))
+    out = truncate_tokens(text, 40)
+    assert count_tokens(out) <= 40
+    assert out and all(line in text.splitlines() for line in out.splitlines())
+    assert truncate_tokens(text, 0) == ""
+    assert truncate_tokens("short", 40) == "short"
+
+
+def test_truncate_tokens_cuts_one_huge_line_by_words():
+    out = truncate_tokens(" ".join(["word"] * 500), 20)
+    assert 0 < count_tokens(out) <= 20
+    assert set(out.split()) == {"word"}
+
+
+def test_fit_resume_returns_small_text_unchanged():
+    text = _resume(1, bullets=2)
+    assert fit_resume(text, "assess") == text
+
+
+def test_fit_resume_sends_only_the_sections_a_feature_needs():
+    out = fit_resume(_resume(1, bullets=2), "grade")
+    assert "EXPERIENCE" in out
+    assert "EDUCATION" not in out and "SKILLS" not in out and "jane@example.com" not in out
+
+
+def test_fit_resume_keeps_latest_role_whole_and_older_role_headers():
+    text = _resume(6)
+    budget = FEATURE_BUDGETS["assess"][0]
+    assert count_tokens(text) > budget
+    out = fit_resume(text, "assess")
+    assert count_tokens(out) <= budget + MARKER_SLACK
+    assert all(f"- Led project 0.{b} " in out for b in range(12))     # most recent role intact
+    assert "Role 3 title" in out and "- Led project 3." not in out    # older role: header only
+    assert "- Led project 5." not in out
+    roles = [line.split()[1] for line in out.splitlines() if line.startswith("Role ")]
+    assert roles == sorted(roles)                                      # resume order kept
+    assert "SKILLS" in out                                            # highest-priority section
+
+
+def test_unsegmentable_resume_is_truncated_as_one_block():
+    text = "\n".join(f"free text line {i} without any headings at all" for i in range(400))
+    out = fit_resume(text, "chat")
+    assert out.endswith("[...truncated]")
+    assert count_tokens(out) <= FEATURE_BUDGETS["chat"][0] + MARKER_SLACK
+
+
+def test_fit_jd_prefers_requirements_over_boilerplate():
+    jd = "\n".join(
+        ["About us", *[f"We are a great company with a long history, fact {i}." for i in range(60)],
+         "Requirements", *[f"- Must have skill {i} with Python and Kubernetes" for i in range(10)],
+         "Benefits", *[f"- Perk {i}: free snacks and a gym membership" for i in range(60)]])
+    budget = FEATURE_BUDGETS["chat"][1]
+    out = fit_jd(jd, "chat")
+    assert count_tokens(out) <= budget + MARKER_SLACK
+    assert all(f"- Must have skill {i} " in out for i in range(10))
+    assert "Perk 59" not in out
@@ -0,0 +1,105 @@
+"""Tests for the two-tier response cache (src/core/cache.py)."""
+import sqlite3
+import threading
+
+from src.core.cache import MemoryLRU, ResponseCache, SQLiteTier, cache_key
+
+
+def test_cache_key_covers_every_argument():
+    base = cache_key("groq", "m", "sys", "prompt", 0.3, 100)
+    assert base == cache_key("groq", "m", "sys", "prompt", 0.3, 100)
+    for changed in (("openai", "m", "sys", "prompt", 0.3, 100), ("groq", "m", "sys", "prompt", 0.4, 100),
+                    ("groq", "m", "sys", "prompt", 0.3, 200), ("groq", "m", "other", "prompt", 0.3, 100)):
+        assert cache_key(*changed) != base
+
+
+def test_memory_lru_evicts_by_bytes_oldest_first():
+    lru = MemoryLRU(max_bytes=10)
+    lru.set("a", "1234")
+    lru.set("b", "1234")
+    lru.get("a")                       # a is now most recent
+    lru.set("c", "1234")
+    assert lru.get("b") is None
+    assert lru.get("a") == "1234" and lru.get("c") == "1234"
+    assert lru.bytes == 8
+    lru.set("huge", "x" * 11)          # larger than the whole budget: ignored
+    assert lru.get("huge") is None and lru.bytes == 8
+
+
+def test_disk_hit_is_promoted_to_memory(tmp_path):
+    disk = SQLiteTier(tmp_path / "c.sqlite3")
+    ResponseCache(MemoryLRU(), disk).set("k", "v")
+    cache = ResponseCache(MemoryLRU(), disk)          # fresh process: empty memory tier
+    assert cache.get("k") == "v"
+    assert cache.get("k") == "v"
+    assert (cache.disk_hits, cache.memory_hits, cache.misses) == (1, 1, 0)
+
+
+def test_disk_entries_expire(tmp_path):
+    disk = SQLiteTier(tmp_path / "c.sqlite3", ttl_seconds=-1)
+    disk.set("k", "v")
+    assert disk.get("k") is None
+    assert disk.purge_expired() == 1
+
+
+def _rows(path) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+
+def test_writes_sweep_expired_rows(tmp_path):
+    path = tmp_path / "c.sqlite3"
+    disk = SQLiteTier(path, ttl_seconds=-1, purge_every=10)
+    for i in range(9):
+        disk.set(f"k{i}", "v")
+    assert _rows(path) == 9
+    disk.set("k9", "v")                               # 10th write sweeps the expired rows
+    assert _rows(path) == 0
+
+
+def test_opening_the_table_sweeps_expired_rows(tmp_path):
+    path = tmp_path / "c.sqlite3"
+    SQLiteTier(path, ttl_seconds=-1).set("old", "v")
+    SQLiteTier(path).set("new", "v")                  # next process: opened, swept, then written
+    assert _rows(path) == 1
+
+
+def test_unwritable_cache_dir_falls_back_to_memory(tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    cache = ResponseCache(MemoryLRU(), SQLiteTier(blocker / "sub" / "c.sqlite3"))
+    assert cache.get("k") is None                     # mkdir raised OSError: no exception here
+    assert cache.disk is None
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+    assert cache.stats()["disk"] is False
+
+
+def test_transient_disk_error_keeps_disk_tier(tmp_path, monkeypatch):
+    disk = SQLiteTier(tmp_path / "c.sqlite3")
+    cache = ResponseCache(MemoryLRU(), disk)
+    cache.set("k", "v")                               # opens the database
+
+    def locked(key):
+        raise sqlite3.OperationalError("database is locked")
+    monkeypatch.setattr(disk, "get", locked)
+    assert cache.get("other") is None
+    assert cache.disk is disk
+
+
+def test_counters_are_exact_under_threads():
+    cache = ResponseCache(MemoryLRU(), None)
+    cache.set("hit", "v")
+
+    def worker():
+        for _ in range(2000):
+            cache.get("hit")
+            cache.get("miss")
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = cache.stats()
+    assert stats["memory_hits"] == 16000 and stats["misses"] == 16000
+    assert stats["hit_rate"] == 0.5
@@ -0,0 +1,128 @@
+"""Tests for hedged requests and the latency tracker (src/core/hedging.py)."""
+import asyncio
+
+import pytest
+
+from src.core import async_llm
+from src.core.hedging import (
+    LATENCY, HedgePolicy, LatencyTracker, backup_feature, hedged, usable_hedge,
+)
+
+
+def _reply(text, delay=0.0, error=None, log=None, name=""):
+    async def run():
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(f"{name} cancelled")
+            raise
+        if error is not None:
+            raise error
+        return text
+    return run
+
+
+def test_fast_primary_wins_without_starting_secondary():
+    started = []
+
+    async def secondary():
+        started.append(True)
+        return "backup"
+    assert asyncio.run(hedged(_reply("main"), secondary, delay=0.5)) == ("main", "primary")
+    assert not started
+
+
+def test_slow_primary_is_hedged_and_cancelled():
+    log = []
+    result = asyncio.run(hedged(_reply("main", 5, log=log, name="primary"),
+                                _reply("backup", 0.01), delay=0.02))
+    assert result == ("backup", "secondary")
+    assert log == ["primary cancelled"]
+
+
+def test_slow_secondary_is_cancelled_when_primary_answers_first():
+    log = []
+    result = asyncio.run(hedged(_reply("main", 0.05), _reply("backup", 5, log=log, name="secondary"),
+                                delay=0.01))
+    assert result == ("main", "primary")
+    assert log == ["secondary cancelled"]
+
+
+def test_failed_primary_fails_over_immediately():
+    result = asyncio.run(hedged(_reply("", error=ConnectionError("down")), _reply("backup"), delay=5))
+    assert result == ("backup", "secondary")
+
+
+def test_invalid_primary_reply_is_not_accepted():
+    def validate(text):
+        if not text.startswith("{"):
+            raise ValueError("not json")
+    result = asyncio.run(hedged(_reply("oops"), _reply("{}"), delay=5, validate=validate))
+    assert result == ("{}", "secondary")
+
+
+def test_both_failing_surfaces_the_primary_error():
+    with pytest.raises(ConnectionError, match="primary"):
+        asyncio.run(hedged(_reply("", error=ConnectionError("primary")),
+                           _reply("", error=ConnectionError("secondary")), delay=5))
+
+
+def test_threshold_uses_cold_delay_then_percentile_with_floor():
+    tracker, policy = LatencyTracker(), HedgePolicy("groq", "m", min_samples=4, min_delay=1.5,
+                                                     cold_delay=8.0, percentile=0.9)
+    for s in (2.0, 3.0, 4.0):
+        tracker.record("f", s)
+    assert tracker.threshold("f", policy) == 8.0
+    tracker.record("f", 10.0)
+    assert tracker.threshold("f", policy) == 10.0
+    fast = LatencyTracker()
+    for _ in range(4):
+        fast.record("f", 0.1)
+    assert fast.threshold("f", policy) == 1.5
+
+
+def test_identical_backup_is_not_a_hedge():
+    hedge = HedgePolicy("groq", "llama", "key")
+    assert usable_hedge(hedge, "groq", "llama") is None
+    assert usable_hedge(hedge, "groq", "other") is hedge
+    assert usable_hedge(None, "groq", "llama") is None
+
+
+@pytest.fixture
+def fake_providers(monkeypatch):
+    """acall_llm against fake providers: 'slow' takes 0.3 s, 'fast' 0.01 s."""
+    async def complete(c, provider, model, *args, **kwargs):
+        await asyncio.sleep(0.3 if provider == "slow" else 0.01)
+        return f"{provider} reply"
+    monkeypatch.setattr(async_llm, "_acomplete", complete)
+    monkeypatch.setattr(async_llm, "get_pooled_async_client", lambda key, provider: None)
+    monkeypatch.setitem(async_llm.PROVIDER_CONCURRENCY, "slow", 4)
+    monkeypatch.setitem(async_llm.PROVIDER_CONCURRENCY, "fast", 4)
+
+
+def test_backup_latency_does_not_feed_the_primary_threshold(fake_providers):
+    feature = "test-hedge-latency"
+    hedge = HedgePolicy("fast", "m", "key", cold_delay=0.05, min_samples=100)
+    text = asyncio.run(async_llm.acall_llm("key", "slow", "m", "prompt", feature=feature,
+                                           hedge=hedge, use_cache=False))
+    assert text == "fast reply"
+    stats = LATENCY.stats()
+    assert stats[backup_feature(feature)]["n"] == 1
+    assert stats[backup_feature(feature)]["p50"] < 0.05
+    # the cancelled primary is counted at its elapsed time, not at the backup's speed
+    assert stats[feature]["n"] == 1 and stats[feature]["p50"] >= 0.05
+
+
+def test_identical_backup_sends_one_request(fake_providers, monkeypatch):
+    calls = []
+
+    async def complete(c, provider, model, *args, **kwargs):
+        calls.append(provider)
+        await asyncio.sleep(0.05)
+        return "reply"
+    monkeypatch.setattr(async_llm, "_acomplete", complete)
+    hedge = HedgePolicy("slow", "m", "key", cold_delay=0.0, min_delay=0.0)
+    asyncio.run(async_llm.acall_llm("key", "slow", "m", "prompt", feature="test-same",
+                                    hedge=hedge, use_cache=False))
+    assert calls == ["slow"]
@@ -0,0 +1,65 @@
+"""Tests for the saved JD library (src/core/jd_library.py)."""
+import json
+import sqlite3
+
+import pytest
+
+from src.core.jd_library import SESSION_PREFIX, SHARED_OWNER, JDLibrary
+
+pytest.importorskip("scipy")
+
+BACKEND = "Backend Engineer\nRequirements\n- Python, PostgreSQL and Kubernetes\n- REST APIs"
+FRONTEND = "Frontend Engineer\nRequirements\n- React, TypeScript and CSS\n- Accessibility"
+RESUME = "Backend developer: Python services on Kubernetes, PostgreSQL tuning, REST APIs."
+
+
+def test_owners_only_see_their_own_jds(tmp_path):
+    lib = JDLibrary(tmp_path / "lib.sqlite3")
+    mine = lib.add("user:a@example.com", BACKEND)
+    lib.add("user:b@example.com", FRONTEND)
+    assert [j.title for j in lib.entries("user:a@example.com")] == ["Backend Engineer"]
+    assert [f.jd.title for f in lib.rank("user:b@example.com", RESUME)] == ["Frontend Engineer"]
+    lib.remove("user:b@example.com", mine.id)                  # not theirs: no-op
+    assert lib.count("user:a@example.com") == 1
+
+
+def test_same_jd_saved_by_two_owners_is_two_rows(tmp_path):
+    lib = JDLibrary(tmp_path / "lib.sqlite3")
+    a, b = lib.add("user:a", BACKEND, "Mine"), lib.add("user:b", BACKEND)
+    assert a.id != b.id
+    assert lib.add("user:a", BACKEND, "Renamed").id == a.id       # re-save updates in place
+    assert [j.title for j in lib.entries("user:a")] == ["Renamed"]
+
+
+def test_rank_uses_a_per_owner_index(tmp_path):
+    lib = JDLibrary(tmp_path / "lib.sqlite3")
+    lib.add("user:a", BACKEND); lib.add("user:a", FRONTEND)
+    fits = lib.rank("user:a", RESUME)
+    assert fits[0].jd.title == "Backend Engineer" and "Python" in fits[0].matched
+    assert lib.rank("user:c", RESUME) == []
+    lib.add("user:c", FRONTEND)
+    assert [f.jd.title for f in lib.rank("user:c", RESUME)] == ["Frontend Engineer"]
+
+
+def test_stale_session_libraries_are_pruned(tmp_path):
+    lib = JDLibrary(tmp_path / "lib.sqlite3")
+    old = SESSION_PREFIX + "old"
+    lib.add(old, BACKEND); lib.add("user:a", BACKEND)
+    lib._db().execute("UPDATE jds SET added = ?", (1.0,))          # both saved long ago
+    lib.add(SESSION_PREFIX + "new", FRONTEND)
+    assert lib.count(old) == 0 and lib.count(SESSION_PREFIX + "new") == 1
+    assert lib.count("user:a") == 1                                # signed-in users keep theirs
+
+
+def test_pre_owner_library_is_migrated_to_the_shared_owner(tmp_path):
+    path = tmp_path / "lib.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE jds (id INTEGER PRIMARY KEY, digest TEXT UNIQUE NOT NULL, title TEXT NOT NULL, "
+                 "company TEXT NOT NULL, text TEXT NOT NULL, added REAL NOT NULL, skills TEXT NOT NULL, "
+                 "vec_idx BLOB NOT NULL, vec_w BLOB NOT NULL)")
+    conn.execute("INSERT INTO jds VALUES (7, 'd', 'Old role', '', 'text', 1.0, ?, x'', x'')",
+                 (json.dumps(["Python"]),))
+    conn.commit(); conn.close()
+    lib = JDLibrary(path)
+    assert [(j.id, j.title) for j in lib.entries(SHARED_OWNER)] == [(7, "Old role")]
+    assert lib.entries("user:a") == []
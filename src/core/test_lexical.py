@@ -0,0 +1,58 @@
+"""Tests for the local BM25 keyword scan (src/core/lexical.py)."""
+from src.core.lexical import _jd_line_kinds, _stem, lexical_score, tokenize
+
+JD = """About us
+We are a friendly company with free snacks and a long history.
+Requirements
+- 5+ years of Python and Kubernetes in production
+- Experience with PostgreSQL and Terraform
+- Machine learning pipelines on AWS
+Benefits
+- Free snacks, gym membership, unlimited snacks
+"""
+
+RESUME = """EXPERIENCE
+Backend engineer, Acme | 2019 - 2024
+- Built Python services deployed on Kubernetes
+- Ran PostgreSQL clusters on AWS
+"""
+
+
+def test_tokenize_and_stem():
+    assert tokenize("C++, Node.js and CI/CD.") == ["c++", "node.js", "and", "ci/cd"]
+    assert _stem("deployed") == _stem("deploying") == _stem("deploys") == "deploy"
+    assert _stem("technologies") == "technology"
+    assert _stem("aws") == "aws"
+
+
+def test_jd_line_kinds_follow_headings():
+    lines = [l for l in JD.splitlines() if l.strip()]
+    kinds = dict(zip(lines, _jd_line_kinds(lines)))
+    assert kinds["About us"] == -1 and kinds["Benefits"] == -1
+    assert kinds["- Experience with PostgreSQL and Terraform"] == 1
+    assert kinds["- Free snacks, gym membership, unlimited snacks"] == -1
+
+
+def test_score_matches_requirements_and_ignores_boilerplate():
+    lx = lexical_score(RESUME, JD)
+    matched = {t for t, _ in lx.matched}
+    missing = {t for t, _ in lx.missing}
+    assert {"python", "kubernetes", "postgresql", "aws"} <= matched
+    assert "terraform" in missing
+    assert not any("snack" in t or "gym" in t for t in matched | missing)
+    assert 0 < lx.score < 100 and lx.terms == len(lx.matched) + len(lx.missing)
+    context = dict(lx.matched)["kubernetes"]
+    assert "Kubernetes" in context
+
+
+def test_score_is_deterministic_and_bounded():
+    assert lexical_score(RESUME, JD) == lexical_score(RESUME, JD)
+    assert lexical_score(JD, JD).score == 100
+    assert lexical_score("", JD).score == 0
+    assert lexical_score(RESUME, "").score == 0
+
+
+def test_repeated_terms_outweigh_one_offs():
+    jd = "Requirements\n- Go\n- Go services\n- Go tooling\n- Rust\n"
+    lx = lexical_score("Wrote Rust", jd)
+    assert lx.score < 50                     # only the rare term is covered
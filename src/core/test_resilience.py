@@ -0,0 +1,215 @@
+"""Tests for retries and the circuit breaker (src/core/resilience.py)."""
+import asyncio
+import uuid
+
+import pytest
+
+from src.core import resilience
+from src.core.resilience import (
+    CircuitBreaker, CircuitOpenError, DeadlineExceeded, RetryPolicy, acall_with_retries,
+    astream_with_retries, call_with_retries, classify_error, stream_with_retries,
+)
+
+FAST = RetryPolicy(max_attempts=4, base_delay=0.0, max_delay=0.0, deadline=5.0)
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """A provider name with its own breaker (threshold 2, half-open immediately)."""
+    name = f"test-{uuid.uuid4().hex[:6]}"
+    monkeypatch.setitem(resilience._BREAKERS, name,
+                        CircuitBreaker(name, failure_threshold=2, reset_timeout=0.0))
+    return name
+
+
+def _open(name: str) -> CircuitBreaker:
+    breaker = resilience.breaker_for(name)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    return breaker
+
+
+# ── Classification ───────────────────────────────────────────────
+def test_classify_error():
+    assert classify_error(HTTPError(429, {"retry-after": "3"})) == (True, 3.0)
+    assert classify_error(HTTPError(503, {"retry-after-ms": "250"})) == (True, 0.25)
+    assert classify_error(HTTPError(400)) == (False, None)
+    assert classify_error(ConnectionError("reset")) == (True, None)
+    assert classify_error(ValueError("bad json")) == (False, None)
+    assert classify_error(CircuitOpenError("x")) == (False, None)
+
+
+# ── Breaker state machine ────────────────────────────────────────
+def test_breaker_opens_after_threshold_and_rejects_calls():
+    breaker = CircuitBreaker("b", failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == "closed" and breaker.before_call() is None
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_admits_one_trial_and_success_closes():
+    breaker = CircuitBreaker("b", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == "half-open"
+    trial = breaker.before_call()
+    assert trial is not None
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()                       # second caller while the trial runs
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.before_call() is None
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker("b", failure_threshold=5, reset_timeout=60)
+    breaker.opened_at = resilience.time.monotonic() - 61      # cooled down: half-open
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_release_trial_frees_the_slot_only_for_its_own_trial():
+    breaker = CircuitBreaker("b", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    first = breaker.before_call()
+    breaker.release_trial(first)
+    second = breaker.before_call()                  # slot was free again
+    breaker.release_trial(first)                    # stale id: must not free the new trial
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.release_trial(second)
+    assert breaker.before_call() is not None
+
+
+def test_lost_trial_expires():
+    breaker = CircuitBreaker("b", failure_threshold=1, reset_timeout=0, trial_timeout=0)
+    breaker.record_failure()
+    assert breaker.before_call() is not None        # never released
+    assert breaker.before_call() is not None        # expired: a new trial is admitted
+
+
+# ── Retry loops ──────────────────────────────────────────────────
+def test_transient_errors_are_retried(provider):
+    calls = []
+
+    def fn(timeout):
+        calls.append(timeout)
+        if len(calls) == 1:
+            raise HTTPError(503)
+        return "ok"
+    assert call_with_retries(fn, provider, FAST) == "ok"
+    assert len(calls) == 2 and all(0 < t <= FAST.deadline for t in calls)
+
+
+def test_client_errors_are_not_retried_and_do_not_trip_the_breaker(provider):
+    calls = []
+
+    def fn(timeout):
+        calls.append(timeout)
+        raise HTTPError(400)
+    for _ in range(3):
+        with pytest.raises(HTTPError):
+            call_with_retries(fn, provider, FAST)
+    assert len(calls) == 3
+    assert resilience.breaker_for(provider).state == "closed"
+
+
+def test_deadline_stops_retrying(provider):
+    policy = RetryPolicy(max_attempts=10, base_delay=0.0, max_delay=0.0, deadline=0.0)
+    with pytest.raises(DeadlineExceeded):
+        call_with_retries(lambda t: "never", provider, policy)
+
+
+def test_open_breaker_short_circuits_without_calling(provider):
+    breaker = resilience.breaker_for(provider)
+    breaker.reset_timeout = 60
+    _open(provider)
+    with pytest.raises(CircuitOpenError):
+        call_with_retries(lambda t: pytest.fail("provider called"), provider, FAST)
+
+
+def test_cancelled_async_trial_releases_the_breaker(provider):
+    breaker = _open(provider)
+
+    async def hang(timeout):
+        await asyncio.sleep(60)
+
+    async def scenario():
+        task = asyncio.create_task(acall_with_retries(hang, provider, FAST))
+        await asyncio.sleep(0.01)
+        assert breaker.trial_in_flight
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    asyncio.run(scenario())
+    assert not breaker.trial_in_flight
+    assert call_with_retries(lambda t: "ok", provider, FAST) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_closed_sync_stream_releases_the_breaker(provider):
+    breaker = _open(provider)
+    stream = stream_with_retries(lambda t: iter(["a", "b", "c"]), provider, FAST)
+    assert next(stream) == "a"
+    assert breaker.trial_in_flight
+    stream.close()                                  # GeneratorExit at the yield
+    assert not breaker.trial_in_flight
+    assert list(stream_with_retries(lambda t: iter(["x"]), provider, FAST)) == ["x"]
+    assert breaker.state == "closed"
+
+
+def test_async_stream_retries_before_first_chunk_only(provider):
+    attempts = []
+
+    def open_stream(timeout):
+        attempts.append(timeout)
+
+        async def gen():
+            if len(attempts) == 1:
+                raise HTTPError(502)
+            yield "one"
+            raise HTTPError(502)                    # after text reached the caller: no retry
+        return gen()
+
+    async def consume():
+        out = []
+        with pytest.raises(HTTPError):
+            async for chunk in astream_with_retries(open_stream, provider, FAST):
+                out.append(chunk)
+        return out
+    assert asyncio.run(consume()) == ["one"]
+    assert len(attempts) == 2
+
+
+def test_rate_limits_on_one_key_do_not_open_the_breaker_for_others(provider):
+    calls = []
+
+    def key_a(timeout):
+        calls.append(timeout)
+        raise HTTPError(429)
+    for _ in range(3):                              # a 429 storm on one user's key
+        with pytest.raises(HTTPError):
+            call_with_retries(key_a, provider, FAST)
+    assert len(calls) == 3 * FAST.max_attempts       # still retried
+    assert resilience.breaker_for(provider).state == "closed"
+    assert call_with_retries(lambda t: "key B ok", provider, FAST) == "key B ok"
+
+
+def test_rate_limited_trial_frees_the_slot(provider):
+    breaker = _open(provider)
+
+    def limited(timeout):
+        raise HTTPError(429)
+    with pytest.raises(HTTPError):
+        call_with_retries(limited, provider, RetryPolicy(max_attempts=1, deadline=5.0))
+    assert not breaker.trial_in_flight and breaker.state == "half-open"
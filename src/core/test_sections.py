@@ -0,0 +1,68 @@
+"""Tests for resume segmentation (src/core/sections.py)."""
+from src.core.sections import FEATURE_SECTIONS, segment_resume, split_roles, split_sections
+
+RESUME = """Jane Doe
+jane@example.com | +1 555 0100
+
+PROFESSIONAL SUMMARY
+Backend engineer with 8 years of Python.
+
+Work Experience:
+Senior Engineer
+Acme Corp | Jan 2021 - Present
+- Led migration of 40 services to AWS
+- Cut p95 latency 35%
+Engineer, Beta Ltd | 2017 - 2020
+- Built the billing pipeline
+
+Technical Skills
+Python, SQL, Kubernetes
+
+EDUCATION
+B.Sc. Computer Science, 2016
+"""
+
+
+def test_split_sections_maps_heading_aliases_in_document_order():
+    names = [name for name, _ in split_sections(RESUME)]
+    assert names == ["contact", "summary", "experience", "skills", "education"]
+    sections = dict(split_sections(RESUME))
+    assert sections["contact"].startswith("Jane Doe")
+    assert sections["skills"] == "Technical Skills\nPython, SQL, Kubernetes"
+
+
+def test_split_roles_starts_at_title_line_above_the_dates():
+    experience = dict(split_sections(RESUME))["experience"]
+    roles = split_roles(experience)
+    assert len(roles) == 2
+    assert roles[0].header == "Senior Engineer · Acme Corp | Jan 2021 - Present"
+    assert roles[0].body.endswith("- Cut p95 latency 35%")
+    assert roles[1].header == "Engineer, Beta Ltd | 2017 - 2020"
+    assert "billing" in roles[1].body
+
+
+def test_experience_without_dates_is_one_role():
+    roles = split_roles("Experience\n- did a thing\n- did another")
+    assert len(roles) == 1 and roles[0].header == ""
+
+
+def test_segment_resume_is_cached_per_text():
+    seg = segment_resume(RESUME)
+    assert segment_resume(RESUME) is seg
+    assert seg.recognised
+    assert seg.names == {"contact", "summary", "experience", "skills", "education"}
+    assert len(seg.roles) == 2
+    assert "B.Sc." in seg.get("education")
+
+
+def test_text_without_headings_is_not_recognised():
+    seg = segment_resume("just a paragraph about me\nand another line")
+    assert not seg.recognised
+    assert [n for n, _ in seg.sections] == ["contact"]
+
+
+def test_feature_sections_only_name_known_sections():
+    known = {"contact", "summary", "experience", "skills", "education", "projects",
+             "certifications", "awards", "other"}
+    for feature, wanted in FEATURE_SECTIONS.items():
+        assert set(wanted) <= known, feature
@@ -0,0 +1,69 @@
+"""Tests for the skill taxonomy automaton (src/core/skills.py)."""
+from src.core import skills
+from src.core.skills import SkillAutomaton, find_skills, merge_keywords, parse_dictionary, skill_gap
+
+DICTIONARY = """
+# comment
+Kubernetes | devops | k8s, kube
+~Go | language | golang
+Spring | framework
+Spring Boot | framework | springboot
+C++ | language | cpp
+Java | language
+JavaScript | language | js
+"""
+
+
+def _names(ac: SkillAutomaton, text: str) -> list[str]:
+    return [ac.skills[s].name for _, _, s in ac.scan(text)]
+
+
+def test_parse_dictionary():
+    entries = parse_dictionary(DICTIONARY)
+    assert [s.name for s, _ in entries][:2] == ["Kubernetes", "Go"]
+    assert entries[0][1] == [("Kubernetes", False), ("k8s", False), ("kube", False)]
+    assert entries[1][1][0] == ("Go", True)
+    assert entries[2][0].category == "framework"
+
+
+def test_scan_whole_words_aliases_and_longest_match():
+    ac = SkillAutomaton(parse_dictionary(DICTIONARY))
+    assert _names(ac, "Deployed on K8s with Spring   Boot and C++.") == ["Kubernetes", "Spring Boot", "C++"]
+    assert _names(ac, "JavaScript, not Java") == ["JavaScript", "Java"]
+    assert _names(ac, "kubernetesx and cppfoo") == []
+
+
+def test_exact_case_entries():
+    ac = SkillAutomaton(parse_dictionary(DICTIONARY))
+    assert _names(ac, "I know Go and golang") == ["Go", "Go"]
+    assert _names(ac, "ready to go") == []
+
+
+def test_canonical():
+    ac = SkillAutomaton(parse_dictionary(DICTIONARY))
+    assert ac.canonical(" K8S ") == "Kubernetes"
+    assert ac.canonical("springboot") == "Spring Boot"
+    assert ac.canonical("cobol") is None
+
+
+def test_compiled_automaton_is_pickled_and_reused(tmp_path, monkeypatch):
+    seed = tmp_path / "skills.txt"
+    seed.write_text(DICTIONARY, encoding="utf-8")
+    monkeypatch.setattr(skills, "_SEED", seed)
+    monkeypatch.setattr(skills, "CACHE_DIR", tmp_path / "cache")
+    first = skills._compile()
+    assert len(list((tmp_path / "cache").glob("skills-*.pkl"))) == 1
+    builds = []
+    monkeypatch.setattr(skills, "parse_dictionary", lambda text: builds.append(1) or parse_dictionary(text))
+    assert skills._compile().lookup == first.lookup and not builds
+    seed.write_text(DICTIONARY + "Rust | language\n", encoding="utf-8")
+    assert skills._compile().canonical("rust") == "Rust" and builds   # new dictionary, new key
+
+
+def test_skill_gap_and_merge_with_bundled_dictionary():
+    gap = skill_gap("Python developer, some k8s", "Python, Kubernetes, Terraform, Terraform")
+    assert gap.matched == ["Python", "Kubernetes"]
+    assert gap.missing == ["Terraform"] and gap.jd_skills == 3
+    assert find_skills("python and Python") == {"Python": 2}
+    assert merge_keywords(["k8s", "Docker"], ["Kubernetes", "docker", "SQL"], exclude=["SQL"]) == ["k8s", "Docker"]
+    assert merge_keywords(["a", "b", "c"], limit=2) == ["a", "b"]
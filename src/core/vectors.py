@@ -0,0 +1,57 @@
+"""
+ATS Resume Studio v3 - Hashed Term Vectors
+Shared by batch ranking and the JD library: stemmed unigrams + bigrams (stopwords
+dropped) hashed into a fixed 2^18-dim space, so vectors can be stored and compared
+without keeping a vocabulary. NumPy/SciPy are imported on first use.
+"""
+from __future__ import annotations
+import zlib
+
+from src.core.lexical import STOPWORDS, _stem, tokenize
+
+HASH_FEATURES = 1 << 18
+_SIM_WEIGHT   = 0.6            # fit = 0.6·relative similarity + 0.4·skill coverage
+
+
+def features(text: str) -> list[str]:
+    toks = [_stem(t) for t in tokenize(text) if t not in STOPWORDS and len(t) > 1]
+    return toks + [f"{a} {b}" for a, b in zip(toks, toks[1:])]
+
+def hashed_tf(text: str):
+    """(indices int32, weights float32): log(1 + count) per hashed feature, sorted by index."""
+    import numpy as np
+    h = np.fromiter((zlib.crc32(f.encode("utf-8")) for f in features(text)), dtype=np.uint32)
+    idx, counts = np.unique(h & (HASH_FEATURES - 1), return_counts=True)
+    return idx.astype(np.int32), np.log1p(counts).astype(np.float32)
+
+def stack(vectors):
+    """CSR matrix with one row per (indices, weights) pair."""
+    import numpy as np
+    from scipy import sparse
+    indptr = np.zeros(len(vectors) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(i) for i, _ in vectors])
+    indices = np.concatenate([i for i, _ in vectors]) if vectors else np.zeros(0, np.int32)
+    data = np.concatenate([w for _, w in vectors]) if vectors else np.zeros(0, np.float32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(vectors), HASH_FEATURES))
+
+def idf_weights(X):
+    """Smoothed idf over the rows of X."""
+    import numpy as np
+    df = np.bincount(X.indices, minlength=HASH_FEATURES)
+    return (np.log((1 + X.shape[0]) / (1 + df)) + 1).astype(np.float32)
+
+def normalise(X, idf):
+    """Rows of X re-weighted by idf and scaled to unit length (cosine = dot product)."""
+    import numpy as np
+    from scipy import sparse
+    X = X @ sparse.diags(idf)
+    norms = np.sqrt(np.asarray(X.multiply(X).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return (sparse.diags(1 / norms) @ X).tocsr()
+
+def fit_score(similarity: float, best: float, coverage: float | None) -> int:
+    """0-100 blend of similarity (relative to the best in the set) and skill coverage."""
+    rel = similarity / best if best > 0 else 0.0
+    if coverage is None:
+        return round(100 * rel)
+    return round(100 * (_SIM_WEIGHT * rel + (1 - _SIM_WEIGHT) * coverage))
@@ -0,0 +1,99 @@
+"""Tests for request validation and error mapping in the HTTP API (src/api.py)."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("starlette")
+pytest.importorskip("httpx")
+from starlette.testclient import TestClient
+
+from src import api
+from src.core.resilience import CircuitOpenError
+
+BODY = {"resume_text": "Python engineer", "job_description": "Python role", "api_key": "key"}
+
+
+@pytest.fixture
+def client():
+    return TestClient(api.app)
+
+
+@pytest.fixture
+def feature(monkeypatch):
+    """Replace the 'analyze' coroutine; set `outcome[0]` to a result or an exception."""
+    outcome, seen = [{"ats_score": 80}], {}
+
+    async def analyze(api_key, provider, model, resume_text, job_description, deadline=None):
+        seen["deadline"] = deadline
+        if isinstance(outcome[0], BaseException):
+            raise outcome[0]
+        return outcome[0]
+    monkeypatch.setitem(api.ENDPOINTS, "analyze", (analyze, *api.ENDPOINTS["analyze"][1:]))
+    return outcome, seen
+
+
+def test_success(client, feature):
+    r = client.post("/v1/analyze", json=BODY)
+    assert r.status_code == 200 and r.json()["result"] == {"ats_score": 80}
+    assert feature[1]["deadline"] == api.REQUEST_TIMEOUT
+
+
+@pytest.mark.parametrize("body, message", [
+    ({"job_description": "x", "api_key": "k"}, "missing field"),
+    ({**BODY, "resume_text": ["not", "text"]}, "'resume_text' must be a str"),
+    ({**BODY, "timeout": "soon"}, "number of seconds"),
+    ({**BODY, "timeout": 0}, "greater than 0"),
+    ({**BODY, "timeout": -5}, "greater than 0"),
+    ({**BODY, "timeout": True}, "number of seconds"),
+    ({**BODY, "timeout": [1]}, "number of seconds"),
+    ({**BODY, "provider": ["groq"]}, "'provider' must be a str"),
+    ({**BODY, "model": {"name": "m"}}, "'model' must be a str"),
+    ({**BODY, "api_key": 123}, "'api_key' must be a str"),
+])
+def test_invalid_requests_are_422(client, feature, body, message):
+    r = client.post("/v1/analyze", json=body)
+    assert r.status_code == 422 and message in r.json()["error"]
+
+
+def test_invalid_typed_fields_are_422(client):
+    base = {**BODY}
+    for path, extra in [("questions", {"num_questions": "eight"}), ("questions", {"num_questions": 0}),
+                        ("chat", {"chat_history": []}), ("chat", {"chat_history": ["hi"]}),
+                        ("build", {"user_info": "text"})]:
+        r = client.post(f"/v1/{path}", json={**base, **extra})
+        assert r.status_code == 422, (path, extra, r.text)
+
+
+def test_timeout_is_capped(client, feature):
+    assert client.post("/v1/analyze", json={**BODY, "timeout": "5"}).status_code == 200
+    assert feature[1]["deadline"] == 5.0
+    client.post("/v1/analyze", json={**BODY, "timeout": 10 ** 9})
+    assert feature[1]["deadline"] == api.REQUEST_TIMEOUT
+
+
+def test_malformed_json_and_unknown_feature(client):
+    assert client.post("/v1/analyze", content=b"{nope").status_code == 422
+    assert client.post("/v1/analyze", json=["list"]).status_code == 422
+    assert client.post("/v1/nope", json=BODY).status_code == 404
+
+
+@pytest.mark.parametrize("exc, status", [
+    (TypeError("bug inside the feature"), 502),           # not a request problem
+    (ValueError("model reply was not JSON"), 502),
+    (asyncio.TimeoutError(), 504),
+    (CircuitOpenError("groq is failing"), 503),
+    (type("RateLimit", (Exception,), {"status_code": 429})("slow down"), 429),
+])
+def test_feature_errors_map_to_upstream_statuses(client, feature, exc, status):
+    feature[0][0] = exc
+    r = client.post("/v1/analyze", json=BODY)
+    assert r.status_code == status
+    if status == 503:
+        assert r.headers["retry-after"] == "30"
+
+
+def test_service_token(client, feature, monkeypatch):
+    monkeypatch.setattr(api, "_SERVICE_TOKEN", "secret")
+    assert client.post("/v1/analyze", json=BODY).status_code == 401
+    ok = client.post("/v1/analyze", json=BODY, headers={"Authorization": "Bearer secret"})
+    assert ok.status_code == 200
@@ -0,0 +1,101 @@
+"""Tests for the batch CLI's checkpoint / resume behaviour (src/cli.py)."""
+import asyncio
+import json
+
+import pytest
+
+from src import cli
+
+
+@pytest.fixture
+def workdir(tmp_path):
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    for name in ("alice", "bob", "carol"):
+        (resumes / f"{name}.txt").write_text(f"{name} — Python engineer", encoding="utf-8")
+    (tmp_path / "jd.txt").write_text("Python engineer wanted", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    """Fake 'analyze' command; resumes listed in `failing` raise."""
+    calls, failing = [], set()
+
+    async def analyze(conn, resume, jd, opts, args):
+        calls.append(resume.split()[0])
+        if resume.split()[0] in failing:
+            raise ConnectionError("provider down")
+        return {"ats_score": 80}
+    monkeypatch.setitem(cli.COMMANDS, "analyze", (analyze, "test"))
+    return calls, failing
+
+
+def _run(workdir, *extra):
+    args = cli.build_parser().parse_args(
+        ["analyze", str(workdir / "resumes"), "--jd", str(workdir / "jd.txt"),
+         "-o", str(workdir / "out.jsonl"), "--checkpoint", str(workdir / "run.ckpt"), *extra])
+    args.api_key = "key"
+    return asyncio.run(cli.run(args))
+
+
+def _rows(workdir):
+    return [json.loads(l) for l in (workdir / "out.jsonl").read_text(encoding="utf-8").splitlines()]
+
+
+def test_rerun_skips_finished_records_and_retries_failures(workdir, handler):
+    calls, failing = handler
+    failing.add("bob")
+    stats = _run(workdir)
+    assert (stats["ok"], stats["failed"], stats["skipped"]) == (2, 1, 0)
+    assert len((workdir / "run.ckpt").read_text().splitlines()) == 2     # failures not checkpointed
+
+    failing.clear(); calls.clear()
+    stats = _run(workdir)
+    assert (stats["ok"], stats["failed"], stats["skipped"]) == (1, 0, 2)
+    assert calls == ["bob"]
+    rows = _rows(workdir)                                                 # output appended
+    assert len(rows) == 4 and [r["ok"] for r in rows].count(False) == 1
+    assert rows[-1]["id"].endswith("bob.txt") and rows[-1]["result"] == {"ats_score": 80}
+
+    calls.clear()
+    assert _run(workdir)["skipped"] == 3 and not calls
+
+
+def test_changed_job_description_is_not_skipped(workdir, handler):
+    calls, _ = handler
+    _run(workdir)
+    (workdir / "jd.txt").write_text("Go engineer wanted", encoding="utf-8")
+    calls.clear()
+    stats = _run(workdir)
+    assert stats["ok"] == 3 and stats["skipped"] == 0 and len(calls) == 3
+
+
+def test_jsonl_records_bad_lines_and_missing_jd(tmp_path, handler):
+    calls, _ = handler
+    src = tmp_path / "in.jsonl"
+    src.write_text("\n".join([
+        json.dumps({"id": "a", "resume": "alice Python", "jd": "Python role"}),
+        "{not json",
+        json.dumps({"id": "b", "resume": "bob Python"}),
+    ]) + "\n", encoding="utf-8")
+    args = cli.build_parser().parse_args(["analyze", str(src), "-o", str(tmp_path / "out.jsonl")])
+    args.api_key = "key"
+    stats = asyncio.run(cli.run(args))
+    assert (stats["ok"], stats["failed"]) == (1, 2) and calls == ["alice"]
+    errors = [r for r in map(json.loads, (tmp_path / "out.jsonl").read_text().splitlines()) if not r["ok"]]
+    assert any("no job description" in r["error"] for r in errors)
+
+
+def test_inline_job_description_text(workdir, monkeypatch):
+    seen = []
+
+    async def analyze(conn, resume, jd, opts, args):
+        seen.append(jd)
+        return {}
+    monkeypatch.setitem(cli.COMMANDS, "analyze", (analyze, "test"))
+    jd = "Senior Python engineer.\n" + "Must know Kubernetes, PostgreSQL and AWS. " * 12   # > 255 bytes
+    out = workdir / "inline.jsonl"
+    assert cli.main(["analyze", str(workdir / "resumes" / "alice.txt"), "--jd", jd,
+                     "-o", str(out), "--api-key", "x", "--no-cache"]) == 0
+    assert seen == [jd] and json.loads(out.read_text())["ok"]
@@ -2,9 +2,16 @@
 ATS Resume Studio - ATS Analyzer Page
 """
 
+import time
+from html import escape
+
 import streamlit as st
-from src.core.llm import analyze_resume
-from src.utils.file_parser import extract_text_from_file, clean_text
+from src.core.lexical import lexical_score
+from src.core.llm import analysis_view, assess_resume, match_view, shortlist_view
+from src.core.report import iter_full_report
+from src.core.skills import merge_keywords, skill_gap
+from src.utils.doc_store import parse_upload
+from src.utils.perf import timed_fragment
 
 
 def _require_api_key():
@@ -30,18 +37,100 @@ def _score_class(score: int) -> str:
     return "score-low"
 
 
-def render_analyzer():
+_REPORT_LABELS = {
+    "analysis":  "🔍 ATS Analysis",
+    "match":     "🎯 Match %",
+    "shortlist": "🏆 Shortlist",
+    "questions": "📝 Interview Q&A",
+}
+
+
+def _report_card(summary: str, seconds: float) -> str:
+    return (f"<div class='studio-card' style='padding:14px'>{summary}"
+            f"<div style='font-size:12px;color:#64748b;margin-top:6px'>⏱️ {seconds:.1f}s</div></div>")
+
+
+def _render_instant_scan():
+    """Local keyword scan — no LLM call, updates on every edit, shown before any AI result.
+    Known skills (taxonomy) come first, then the JD's other weighted terms."""
+    lx = lexical_score(st.session_state.resume_text, st.session_state.job_description)
+    gap = skill_gap(st.session_state.resume_text, st.session_state.job_description)
+    if not (lx.terms or gap.jd_skills):
+        return
+    notes = {kw: note for kw, note in lx.matched + lx.missing}
+    chip = lambda cls, kw: (f'<span class="{cls}" title="{escape(notes.get(kw, "skill"))}">'
+                            f'{escape(kw)}</span>')
+    found = "".join(chip("tag-found", kw) for kw in
+                    merge_keywords(gap.matched, [kw for kw, _ in lx.matched], limit=16))
+    gaps = "".join(chip("tag-missing", kw) for kw in
+                   merge_keywords(gap.missing, [kw for kw, _ in lx.missing], exclude=gap.matched, limit=16))
     st.markdown(
-        """
-        <div class="section-title">🔍 ATS Resume Analyzer</div>
-        <div class="section-subtitle">Upload your resume and paste the job description to get a detailed ATS compatibility report.</div>
-        """,
+        f"""<div class="studio-card" style="padding:16px 20px;">
+            <div style="display:flex;align-items:baseline;gap:12px;margin-bottom:10px;">
+                <div style="font-size:15px;font-weight:700;color:#0f172a;">⚡ Instant keyword scan</div>
+                <div style="font-size:22px;font-weight:800;color:{_score_color(lx.score)};">{lx.score}%</div>
+                <div style="font-size:12px;color:#64748b;">local · {gap.jd_skills} skills + {lx.terms} JD terms · no AI call</div>
+            </div>
+            <div style="margin-bottom:6px;">{found or '<span style="color:#94a3b8">No JD terms found yet.</span>'}</div>
+            <div>{gaps}</div>
+        </div>""",
         unsafe_allow_html=True,
     )
 
-    if not _require_api_key():
-        return
 
+def _run_full_report():
+    """Fire the assessment and Q&A calls at once and fill each panel as its result lands."""
+    st.markdown("### ⚡ Full Report")
+    cols = st.columns(4)
+    slots = {}
+    for col, (name, label) in zip(cols, _REPORT_LABELS.items()):
+        with col:
+            st.markdown(f"**{label}**")
+            slots[name] = st.empty()
+            slots[name].caption("⏳ Running…")
+
+    t0 = time.perf_counter()
+    timings = {}
+    for part in iter_full_report(
+        st.session_state.api_key,
+        st.session_state.api_provider,
+        st.session_state.model,
+        st.session_state.resume_text,
+        st.session_state.job_description,
+        hedge=st.session_state.hedge,
+    ):
+        timings[part.name] = part.seconds
+        names = ("analysis", "match", "shortlist") if part.name == "assessment" else ("questions",)
+        if part.error:
+            for n in names:
+                slots[n].error(f"Failed: {part.error} ({part.seconds:.1f}s)")
+            continue
+        if part.name == "assessment":
+            a = part.result
+            st.session_state.assessment_result = a
+            sl = shortlist_view(a)
+            slots["analysis"].markdown(_report_card(
+                f"ATS score <b>{a.get('ats_score', 0)}</b>/100", part.seconds), unsafe_allow_html=True)
+            slots["match"].markdown(_report_card(
+                f"<b>{len(match_view(a)['missing'])}</b> top keywords missing", part.seconds),
+                unsafe_allow_html=True)
+            slots["shortlist"].markdown(_report_card(
+                f"<b>{sl.get('shortlist_probability', 0)}%</b> · {sl.get('tier', '')}", part.seconds),
+                unsafe_allow_html=True)
+        else:
+            st.session_state.interview_qa = part.result
+            slots["questions"].markdown(_report_card(
+                f"<b>{len(part.result)}</b> questions ready", part.seconds), unsafe_allow_html=True)
+
+    wall = time.perf_counter() - t0
+    st.caption(f"Wall time {wall:.1f}s vs {sum(timings.values()):.1f}s if run one after another. "
+               "Match %, Shortlist and Q&A details are on the Cool Features and Interview Prep pages.")
+
+
+@timed_fragment("analyzer_inputs")
+def _input_panel():
+    """Uploads, edits and the instant scan rerun only this panel; the buttons hand
+    off to a full run so the results below are redrawn."""
     # ── Input Section ──────────────────────────────────────────────
     with st.container():
         col_left, col_right = st.columns(2, gap="large")
@@ -58,12 +147,14 @@ def render_analyzer():
                     label_visibility="collapsed",
                 )
                 if uploaded:
-                    text, err = extract_text_from_file(uploaded)
-                    if err:
-                        st.error(err)
+                    doc = parse_upload(uploaded)
+                    if doc.error:
+                        st.error(doc.error)
                     else:
-                        st.session_state.resume_text = clean_text(text)
-                        st.success(f"✅ Loaded: {uploaded.name} ({len(text.split())} words)")
+                        st.session_state.resume_text = doc.text
+                        st.success(f"✅ Loaded: {uploaded.name} ({doc.metadata['words']} words)")
+                        for w in doc.warnings:
+                            st.warning(w)
 
             with paste_tab:
                 pasted = st.text_area(
@@ -96,24 +187,55 @@ def render_analyzer():
         j_words = len(st.session_state.job_description.split()) if st.session_state.job_description else 0
         st.caption(f"Job Description: {j_words} words")
 
+    if st.session_state.resume_text and st.session_state.job_description:
+        _render_instant_scan()
+
     st.markdown("<br>", unsafe_allow_html=True)
 
     # ── Analyze Button ─────────────────────────────────────────────
-    col_btn, col_clr, _ = st.columns([2, 1, 3])
+    col_btn, col_rep, col_clr, _ = st.columns([2, 2, 1, 1])
     with col_btn:
-        analyze_clicked = st.button(
+        if st.button(
             "🚀 Analyze My Resume",
             type="primary",
             use_container_width=True,
             disabled=(not st.session_state.resume_text or not st.session_state.job_description),
-        )
+        ):
+            st.session_state.analyzer_action = "analyze"
+            st.rerun()
+    with col_rep:
+        if st.button(
+            "⚡ Full Report",
+            use_container_width=True,
+            help="Analysis, Match %, Shortlist and Interview Q&A in one go — run in parallel.",
+            disabled=(not st.session_state.resume_text or not st.session_state.job_description),
+        ):
+            st.session_state.analyzer_action = "report"
+            st.rerun()
     with col_clr:
         if st.button("🗑️ Clear All", use_container_width=True):
             st.session_state.resume_text = ""
             st.session_state.job_description = ""
-            st.session_state.analysis_result = None
+            st.session_state.assessment_result = None
             st.rerun()
 
+
+def render_analyzer():
+    st.markdown(
+        """
+        <div class="section-title">🔍 ATS Resume Analyzer</div>
+        <div class="section-subtitle">Upload your resume and paste the job description to get a detailed ATS compatibility report.</div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    if not _require_api_key():
+        return
+
+    _input_panel()
+    action = st.session_state.pop("analyzer_action", None)
+    analyze_clicked, report_clicked = action == "analyze", action == "report"
+
     if analyze_clicked:
         if not st.session_state.resume_text:
             st.error("Please provide your resume.")
@@ -124,28 +246,34 @@ def render_analyzer():
 
         with st.spinner("🤖 Analyzing your resume against the job description..."):
             try:
-                result = analyze_resume(
+                st.session_state.assessment_result = assess_resume(
                     st.session_state.api_key,
                     st.session_state.api_provider,
                     st.session_state.model,
                     st.session_state.resume_text,
                     st.session_state.job_description,
+                    hedge=st.session_state.hedge,
                 )
-                st.session_state.analysis_result = result
                 st.success("✅ Analysis complete!")
             except Exception as e:
                 st.error(f"Analysis failed: {str(e)}")
                 return
 
+    if report_clicked:
+        _run_full_report()
+
     # ── Results Section ────────────────────────────────────────────
-    if st.session_state.analysis_result:
-        result = st.session_state.analysis_result
+    if st.session_state.assessment_result:
+        result = analysis_view(st.session_state.assessment_result)
         st.markdown("---")
         st.markdown("### 📊 Analysis Results")
 
         # Top Score Row
         score = result.get("ats_score", 0)
-        breakdown = result.get("score_breakdown", {})
+        breakdown = dict(result.get("score_breakdown", {}))
+        # Keyword match comes from the local engine: deterministic, no drift between runs.
+        breakdown["keyword_match"] = lexical_score(st.session_state.resume_text,
+                                                   st.session_state.job_description).score
 
         col_score, col_breakdown = st.columns([1, 3], gap="large")
 
@@ -193,26 +321,28 @@ def render_analyzer():
         st.markdown("#### 🔤 Keyword Analysis")
         kw_col1, kw_col2 = st.columns(2, gap="large")
 
+        # Taxonomy skills first (deterministic), then whatever else the model picked out.
+        gap = skill_gap(st.session_state.resume_text, st.session_state.job_description)
         with kw_col1:
-            matched = result.get("matched_keywords", [])
+            matched = merge_keywords(gap.matched, result.get("matched_keywords", []))
             st.markdown(
                 f"<div style='font-weight:700; color:#166534; margin-bottom:8px;'>✅ Matched Keywords ({len(matched)})</div>",
                 unsafe_allow_html=True,
             )
             if matched:
-                tags_html = "".join(f'<span class="tag-found">{k}</span>' for k in matched)
+                tags_html = "".join(f'<span class="tag-found">{escape(str(k))}</span>' for k in matched)
                 st.markdown(f"<div>{tags_html}</div>", unsafe_allow_html=True)
             else:
                 st.info("No matched keywords detected.")
 
         with kw_col2:
-            missing = result.get("missing_keywords", [])
+            missing = merge_keywords(gap.missing, result.get("missing_keywords", []), exclude=gap.matched)
             st.markdown(
                 f"<div style='font-weight:700; color:#991b1b; margin-bottom:8px;'>❌ Missing Keywords ({len(missing)})</div>",
                 unsafe_allow_html=True,
             )
             if missing:
-                tags_html = "".join(f'<span class="tag-missing">{k}</span>' for k in missing)
+                tags_html = "".join(f'<span class="tag-missing">{escape(str(k))}</span>' for k in missing)
                 st.markdown(f"<div>{tags_html}</div>", unsafe_allow_html=True)
             else:
                 st.success("Great! No important keywords missing.")
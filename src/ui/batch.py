@@ -0,0 +1,101 @@
+"""
+ATS Resume Studio - Recruiter Batch Page
+Rank a folder (or zip) of resumes against one JD; only the top K are sent to the AI.
+"""
+
+import time
+
+import streamlit as st
+from src.core.batch import expand_uploads, final_order, iter_ai_scores, prescore, to_csv
+from src.utils.doc_store import parse_many
+
+
+def _rows(candidates):
+    return [c.row(i) for i, c in enumerate(final_order(candidates), 1)]
+
+
+def _ai_pass(candidates, job_description, top_k, concurrency, slot):
+    shortlist = [c for c in candidates if c.text][:top_k]
+    bar = st.progress(0.0, text=f"AI-scoring the top {len(shortlist)}…")
+    t0 = time.perf_counter()
+    for n, cand in enumerate(iter_ai_scores(
+            st.session_state.api_key, st.session_state.api_provider, st.session_state.model,
+            shortlist, job_description, concurrency, hedge=st.session_state.hedge), 1):
+        bar.progress(n / len(shortlist), text=f"AI-scored {n}/{len(shortlist)} — {cand.name}")
+        slot.dataframe(_rows(candidates), use_container_width=True, hide_index=True)
+    bar.empty()
+    st.session_state.batch_timing["ai"] = time.perf_counter() - t0
+
+
+def render_batch():
+    st.markdown(
+        """
+        <div class="section-title">👥 Recruiter Batch</div>
+        <div class="section-subtitle">Drop a folder or zip of resumes, rank everyone against one job description,
+        and spend AI calls only on the front-runners.</div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    col_jd, col_files = st.columns(2, gap="large")
+    with col_jd:
+        st.markdown("#### 🏢 Job Description")
+        jd = st.text_area("Job description", value=st.session_state.job_description, height=260,
+                          placeholder="Paste the job description…", label_visibility="collapsed",
+                          key="batch_jd")
+        st.session_state.job_description = jd
+    with col_files:
+        st.markdown("#### 📁 Resumes")
+        files = st.file_uploader(
+            "Resumes", type=["pdf", "docx", "txt", "zip"], accept_multiple_files=True,
+            key="batch_upload", label_visibility="collapsed",
+            help="Select every file in a folder, or upload a .zip of them.",
+        )
+        c1, c2 = st.columns(2)
+        top_k = c1.slider("AI-score the top", 0, 50, 10, help="0 = local ranking only, no AI calls")
+        concurrency = c2.slider("Parallel AI calls", 1, 8, 4)
+        if top_k and not st.session_state.api_key_verified:
+            st.caption("🔑 Connect a provider in the sidebar to AI-score the shortlist.")
+
+    run = st.button("📊 Rank Candidates", type="primary", use_container_width=True,
+                    disabled=not (files and jd.strip()))
+    stats_slot, slot = st.empty(), st.empty()
+
+    if run:
+        items, skipped = expand_uploads((f.name, f.getvalue()) for f in files)
+        if not items:
+            st.error("No PDF, DOCX or TXT resumes found in the upload.")
+            return
+        bar = st.progress(0.0, text=f"Parsing {len(items)} resumes…")
+        t0 = time.perf_counter()
+        docs = parse_many(items, on_parsed=lambda done, total: bar.progress(
+            done / total, text=f"Parsed {done}/{total}"))
+        t1 = time.perf_counter()
+        candidates = prescore(docs, jd)
+        bar.empty()
+        st.session_state.batch_candidates = candidates
+        st.session_state.batch_skipped = skipped
+        st.session_state.batch_timing = {"parse": t1 - t0, "rank": time.perf_counter() - t1}
+        slot.dataframe(_rows(candidates), use_container_width=True, hide_index=True)
+        if top_k and st.session_state.api_key_verified:
+            _ai_pass(candidates, jd, top_k, concurrency, slot)
+
+    candidates = st.session_state.batch_candidates
+    if not candidates:
+        return
+    timing = st.session_state.batch_timing
+    failed = sum(1 for c in candidates if c.error)
+    scored = sum(1 for c in candidates if c.ats_score is not None)
+    cols = stats_slot.columns(4)
+    cols[0].metric("Resumes", len(candidates), f"-{failed} unreadable" if failed else None)
+    cols[1].metric("Parse", f"{timing.get('parse', 0):.1f}s")
+    cols[2].metric("Local ranking", f"{timing.get('rank', 0) * 1000:.0f} ms")
+    cols[3].metric("AI-scored", scored, f"{timing['ai']:.0f}s" if "ai" in timing else None,
+                   delta_color="off")
+    slot.dataframe(_rows(candidates), use_container_width=True, hide_index=True)
+    for note in st.session_state.batch_skipped:
+        st.caption(f"⏭️ Skipped {note}")
+
+    st.download_button("⬇️ Download CSV", to_csv(final_order(candidates)),
+                       file_name="candidate_ranking.csv", mime="text/csv",
+                       use_container_width=True)
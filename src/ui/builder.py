@@ -4,8 +4,9 @@ Build a resume from scratch using an interactive form.
 """
 
 import streamlit as st
-from src.core.llm import build_resume_from_info
-from src.utils.exporters import text_to_docx_bytes, create_download_filename
+from src.core.async_llm import astream_resume_from_info
+from src.ui.jobs import pop_job_error, render_job_progress, running_job, submit_job
+from src.ui.downloads import download_button, template_picker
 
 
 def render_builder():
@@ -195,70 +196,73 @@ def render_builder():
             "🏗️ Build My Resume",
             type="primary",
             use_container_width=True,
-            disabled=not (user_info.get("full_name") and user_info.get("target_role")),
+            disabled=not (user_info.get("full_name") and user_info.get("target_role"))
+                     or running_job("build") is not None,
         )
     with col_clear:
         if st.button("🗑️ Clear Form", use_container_width=True):
             st.session_state.built_resume = {}
-            st.session_state.resume_text = ""
+            st.session_state.built_resume_text = ""
             st.rerun()
 
     if build_clicked:
-        with st.spinner("🤖 Building your professional resume..."):
-            try:
-                built = build_resume_from_info(
-                    st.session_state.api_key,
-                    st.session_state.api_provider,
-                    st.session_state.model,
-                    user_info,
-                )
-                st.session_state.resume_text = built
-                st.success("✅ Resume built successfully!")
-            except Exception as e:
-                st.error(f"Build failed: {str(e)}")
-                return
+        submit_job("build", "Built resume", astream_resume_from_info(
+            st.session_state.api_key,
+            st.session_state.api_provider,
+            st.session_state.model,
+            dict(user_info),
+            hedge=st.session_state.hedge,
+        ), target="built_resume_text", transform=str.strip)
+
+    if render_job_progress("build"):
+        return
+    error = pop_job_error("build")
+    if error:
+        st.error(f"Build failed: {error}")
+        return
 
-    if st.session_state.resume_text and "built" in dir():
+    # The build lands in its own draft; the resume the other pages work on only
+    # changes when the user accepts it here.
+    if st.session_state.built_resume_text:
         st.markdown("### 📄 Your Generated Resume")
-        editable = st.text_area(
+        draft = st.text_area(
             "generated_resume",
-            value=st.session_state.resume_text,
+            value=st.session_state.built_resume_text,
             height=500,
             label_visibility="collapsed",
         )
-        st.session_state.resume_text = editable
+        st.session_state.built_resume_text = draft
+        in_use = draft == st.session_state.resume_text
+
+        if in_use:
+            st.caption("✅ This is your current resume.")
+        elif st.button("✅ Use as My Resume", type="primary"):
+            st.session_state.resume_text = draft
+            st.rerun()
 
         st.markdown("#### ⬇️ Download")
-        dl1, dl2, dl3, dl4 = st.columns(4)
+        dl1, dl2, dl3, dl4, dl5 = st.columns(5)
+
+        with dl5:                                   # first: the buttons below bind its choice
+            template = template_picker("build")
 
         with dl1:
-            st.download_button(
-                "📄 TXT",
-                data=st.session_state.resume_text.encode("utf-8"),
-                file_name=create_download_filename("resume", "txt"),
-                mime="text/plain",
-                use_container_width=True,
-            )
+            download_button("📄 TXT", "txt", draft, "resume")
 
         with dl2:
-            try:
-                docx_bytes = text_to_docx_bytes(st.session_state.resume_text, user_info.get("full_name", "Resume"))
-                st.download_button(
-                    "📝 DOCX",
-                    data=docx_bytes,
-                    file_name=create_download_filename("resume", "docx"),
-                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    use_container_width=True,
-                )
-            except Exception:
-                st.caption("Install python-docx for DOCX.")
+            download_button("📝 DOCX", "docx", draft, "resume",
+                            user_info.get("full_name") or "Resume", template)
+            download_button("📕 PDF", "pdf", draft, "resume",
+                            user_info.get("full_name") or "Resume", template)
 
         with dl3:
             if st.button("🔍 Analyze ATS Score →", use_container_width=True):
+                st.session_state.resume_text = draft
                 st.session_state.current_page = "🔍 ATS Analyzer"
                 st.rerun()
 
         with dl4:
             if st.button("✨ Optimize Further →", use_container_width=True):
+                st.session_state.resume_text = draft
                 st.session_state.current_page = "✨ Resume Optimizer"
                 st.rerun()
@@ -3,10 +3,20 @@ ATS Resume Studio v3 - Cool Features
 Tab 1: Percentage Match
 Tab 2: Shortlist Accelerator (top-10 gap analysis)
 Tab 3: Custom Query
+Tab 4: JD Library (rank the resume against saved JDs locally, AI-assess the picks)
 """
+import concurrent.futures
+import uuid
+from html import escape
+
 import streamlit as st
-from src.core.llm import call_llm, get_percentage_match, get_shortlist_accelerator
-from src.utils.file_parser import extract_text_from_file, clean_text
+from src.core.async_llm import aanalyze_resume, submit_async
+from src.core.budget import fit_jd, fit_resume
+from src.core.jd_library import SESSION_PREFIX, SHARED_LIBRARY, SHARED_OWNER, get_jd_library
+from src.core.llm import assess_resume, call_llm, match_view, shortlist_view
+from src.core.skills import merge_keywords, skill_gap
+from src.utils.doc_store import parse_upload
+from src.utils.perf import timed_fragment
 
 
 def _require_api():
@@ -25,11 +35,13 @@ def _input_row(prefix):
             f = st.file_uploader("Resume", type=["pdf","docx","txt"],
                                  key=f"{prefix}_up", label_visibility="collapsed")
             if f:
-                t, e = extract_text_from_file(f)
-                if e: st.error(e)
+                doc = parse_upload(f)
+                if doc.error: st.error(doc.error)
                 else:
-                    st.session_state.resume_text = clean_text(t)
+                    st.session_state.resume_text = doc.text
                     st.success(f"✅ {f.name}")
+                    for w in doc.warnings:
+                        st.warning(w)
         with p:
             r = st.text_area("Resume", value=st.session_state.resume_text, height=200,
                              placeholder="Paste resume…", label_visibility="collapsed",
@@ -43,6 +55,144 @@ def _input_row(prefix):
         st.session_state.job_description = j
 
 
+def _analyze_saved_jds(jds):
+    """AI-assess the resume against each chosen JD concurrently; results land as they finish."""
+    results = st.session_state.jd_library_results
+    futures = {submit_async(aanalyze_resume(
+        st.session_state.api_key, st.session_state.api_provider, st.session_state.model,
+        st.session_state.resume_text, jd.text, hedge=st.session_state.hedge)): jd for jd in jds}
+    bar = st.progress(0.0, text=f"Analysing {len(jds)} roles…")
+    for n, fut in enumerate(concurrent.futures.as_completed(futures), 1):
+        jd = futures[fut]
+        try:
+            r = fut.result()
+            results[jd.id] = {"score": r.get("ats_score", 0), "verdict": r.get("overall_verdict", "")}
+        except Exception as e:
+            results[jd.id] = {"error": str(e)}
+        bar.progress(n / len(jds), text=f"Analysed {n}/{len(jds)} — {jd.title}")
+    bar.empty()
+
+
+def _library_owner() -> str:
+    """Whose JD library this session sees: everyone's on a single-user install, the
+    signed-in user's, or else one private to this browser session."""
+    if SHARED_LIBRARY:
+        return SHARED_OWNER
+    if st.user.get("is_logged_in") and st.user.get("email"):
+        return f"user:{st.user.get('email').lower()}"
+    if "jd_library_owner" not in st.session_state:
+        st.session_state.jd_library_owner = SESSION_PREFIX + uuid.uuid4().hex
+    return st.session_state.jd_library_owner
+
+
+def _render_jd_library():
+    st.markdown("### 📚 JD Library")
+    st.info("Save job descriptions once. Your resume is ranked against all of them instantly, "
+            "on this machine — then run the full AI analysis only on the best fits.")
+    lib, owner = get_jd_library(), _library_owner()
+    saved = lib.count(owner)
+
+    with st.expander("📄 Resume", expanded=not st.session_state.resume_text):
+        r = st.text_area("Resume", value=st.session_state.resume_text, height=200,
+                         placeholder="Paste resume…", label_visibility="collapsed", key="lib_rp")
+        st.session_state.resume_text = r
+
+    with st.expander("➕ Save a job description", expanded=saved == 0):
+        with st.form("jd_library_add", clear_on_submit=True):
+            c1, c2 = st.columns(2)
+            title = c1.text_input("Title", placeholder="Defaults to the JD's first line")
+            company = c2.text_input("Company")
+            text = st.text_area("Job description", height=180, placeholder="Paste job description…")
+            if st.form_submit_button("💾 Save to library", type="primary") and text.strip():
+                lib.add(owner, text, title, company)
+                st.rerun()
+        if st.session_state.job_description.strip():
+            if st.button("💾 Save the current job description", key="lib_save_current"):
+                lib.add(owner, st.session_state.job_description)
+                st.rerun()
+
+    if owner.startswith(SESSION_PREFIX):
+        st.caption("🔒 Saved JDs are private to this browser session.")
+    fits = lib.rank(owner, st.session_state.resume_text, limit=15)
+    if not fits:
+        st.caption("Save a few job descriptions and add your resume to see your best fits."
+                   if st.session_state.resume_text else "Add your resume to rank the saved roles.")
+        return
+
+    st.markdown(f"#### 🏅 Best fits ({saved} saved)")
+    results = st.session_state.jd_library_results
+    chosen = []
+    for f in fits:
+        jd = f.jd
+        sc = "#10b981" if f.score >= 75 else "#f59e0b" if f.score >= 50 else "#ef4444"
+        c1, c2, c3 = st.columns([1, 6, 2])
+        c1.markdown(f"<div style='font-size:26px;font-weight:800;color:{sc}'>{f.score}</div>",
+                    unsafe_allow_html=True)
+        with c2:
+            ai = results.get(jd.id, {})
+            ai_line = (f" · 🤖 AI score <b>{escape(str(ai['score']))}</b> — {escape(str(ai['verdict']))}"
+                       if "score" in ai else f" · ⚠️ {escape(ai['error'])}" if "error" in ai else "")
+            skills = "".join(f'<span class="tag-found">{escape(k)}</span>' for k in f.matched[:8]) + \
+                     "".join(f'<span class="tag-missing">{escape(k)}</span>' for k in f.missing[:8])
+            st.markdown(f"<b>{escape(jd.title)}</b>{' · ' + escape(jd.company) if jd.company else ''}"
+                        f"<span style='color:#64748b;font-size:12px'> · similarity "
+                        f"{100 * f.similarity:.0f}%{ai_line}</span><div>{skills}</div>",
+                        unsafe_allow_html=True)
+        with c3:
+            if st.checkbox("Analyse", key=f"lib_pick_{jd.id}"):
+                chosen.append(jd)
+            b1, b2 = st.columns(2)
+            if b1.button("Use", key=f"lib_use_{jd.id}", help="Make this the active job description"):
+                st.session_state.job_description = jd.text
+                st.rerun()
+            if b2.button("🗑️", key=f"lib_del_{jd.id}", help="Remove from library"):
+                lib.remove(owner, jd.id)
+                results.pop(jd.id, None)
+                st.rerun()
+
+    if st.button(f"🤖 Analyse selected ({len(chosen)})", type="primary", use_container_width=True,
+                 disabled=not chosen):
+        _analyze_saved_jds(chosen)
+        st.rerun()
+
+
+@timed_fragment("custom_query")
+def _custom_query_panel():
+    """Ask / Clear rerun only this panel, not the other tabs."""
+    query = st.text_area("Your question", height=80,
+                         placeholder="e.g. What specific experience am I missing for the senior requirements?",
+                         label_visibility="collapsed", key="cq_input")
+
+    if st.button("💬 Ask", type="primary", disabled=not (query.strip() and st.session_state.resume_text and st.session_state.job_description)):
+        with st.spinner("Thinking…"):
+            try:
+                prompt = (f"Answer this specific question about the candidate's fit for the role.\n\n"
+                          f"Question: {query}\n\n"
+                          f"RESUME:\n{fit_resume(st.session_state.resume_text, 'custom')}\n\n"
+                          f"JOB:\n{fit_jd(st.session_state.job_description, 'custom')}\n\nAnswer:")
+                reply = call_llm(st.session_state.api_key, st.session_state.api_provider,
+                                 st.session_state.model, prompt, temperature=0.4, max_tokens=600,
+                                 feature="custom", hedge=st.session_state.hedge)
+                st.session_state.custom_qa_history.append({"q": query, "a": reply})
+                st.rerun(scope="fragment")
+            except Exception as e:
+                st.error(f"Failed: {e}")
+
+    for item in reversed(st.session_state.custom_qa_history):
+        st.markdown(f"""
+        <div style='background:#e0e7ff;border-left:3px solid #6366f1;border-radius:0 10px 10px 0;
+                    padding:10px 14px;margin-bottom:8px;font-size:14px;color:#1e293b'>
+            <b>Q:</b> {item['q']}</div>
+        <div style='background:#f0fdf4;border-left:3px solid #10b981;border-radius:0 10px 10px 0;
+                    padding:12px 16px;margin-bottom:16px;font-size:14px;color:#1e293b;line-height:1.7'>
+            <b>A:</b> {item['a']}</div>""", unsafe_allow_html=True)
+
+    if st.session_state.custom_qa_history:
+        if st.button("🗑️ Clear History"):
+            st.session_state.custom_qa_history = []
+            st.rerun(scope="fragment")
+
+
 def render_cool_features():
     st.markdown('<div class="section-title">🚀 Advanced Tools</div>', unsafe_allow_html=True)
     st.markdown('<div class="section-subtitle">Precision tools to maximise your shortlist chances.</div>', unsafe_allow_html=True)
@@ -50,11 +200,11 @@ def render_cool_features():
     if not _require_api():
         return
 
-    for k in ["match_result","shortlist_result","custom_qa"]:
-        if k not in st.session_state:
-            st.session_state[k] = None
+    if "assessment_result" not in st.session_state:
+        st.session_state.assessment_result = None
 
-    tab1, tab2, tab3 = st.tabs(["🎯 Match %", "🏆 Shortlist Accelerator", "💬 Custom Query"])
+    tab1, tab2, tab3, tab4 = st.tabs(["🎯 Match %", "🏆 Shortlist Accelerator", "💬 Custom Query",
+                                      "📚 JD Library"])
 
     # ═══════════════════════════════════════════════════════════════
     # TAB 1 — PERCENTAGE MATCH
@@ -68,21 +218,30 @@ def render_cool_features():
                      disabled=not (st.session_state.resume_text and st.session_state.job_description)):
             with st.spinner("Calculating match…"):
                 try:
-                    result = get_percentage_match(
+                    st.session_state.assessment_result = assess_resume(
                         st.session_state.api_key, st.session_state.api_provider,
                         st.session_state.model, st.session_state.resume_text,
-                        st.session_state.job_description)
-                    st.session_state.match_result = result
+                        st.session_state.job_description, hedge=st.session_state.hedge)
                 except Exception as e:
                     st.error(f"Failed: {e}")
 
-        if st.session_state.match_result:
+        if st.session_state.assessment_result:
+            m = match_view(st.session_state.assessment_result)
+            mc = "#10b981" if m["score"]>=75 else "#f59e0b" if m["score"]>=50 else "#ef4444"
             st.markdown("---")
+            matched = "".join(f"<div style='margin:4px 0'>✅ <b>{k}</b>{' — ' + c if c else ''}</div>"
+                              for k, c in m["matched"])
+            missing = "".join(f"<div style='margin:4px 0'>❌ <b>{k}</b>{' — ' + w if w else ''}</div>"
+                              for k, w in m["missing"])
             st.markdown(f"""
             <div style='background:#f8fafc;border:1px solid #e2e8f0;border-radius:14px;padding:20px'>
-                <pre style='font-size:14px;color:#1e293b;white-space:pre-wrap;margin:0;font-family:Inter,sans-serif'>
-{st.session_state.match_result}
-                </pre>
+                <div style='font-size:44px;font-weight:900;color:{mc}'>{m["score"]}%</div>
+                <div style='font-size:13px;color:#64748b;margin-bottom:12px'>ATS Match Score</div>
+                <div style='display:grid;grid-template-columns:1fr 1fr;gap:16px;font-size:14px;color:#1e293b'>
+                    <div><b>Top 5 Matched</b>{matched}</div>
+                    <div><b>Top 5 Missing</b>{missing}</div>
+                </div>
+                <div style='margin-top:12px;font-size:14px'>⚡ <b>Quick Win:</b> {m["quick_win"]}</div>
             </div>""", unsafe_allow_html=True)
 
     # ═══════════════════════════════════════════════════════════════
@@ -100,16 +259,15 @@ def render_cool_features():
                      disabled=not (st.session_state.resume_text and st.session_state.job_description)):
             with st.spinner("Analysing your shortlist position…"):
                 try:
-                    result = get_shortlist_accelerator(
+                    st.session_state.assessment_result = assess_resume(
                         st.session_state.api_key, st.session_state.api_provider,
                         st.session_state.model, st.session_state.resume_text,
-                        st.session_state.job_description)
-                    st.session_state.shortlist_result = result
+                        st.session_state.job_description, hedge=st.session_state.hedge)
                 except Exception as e:
                     st.error(f"Failed: {e}")
 
-        if st.session_state.shortlist_result:
-            r = st.session_state.shortlist_result
+        if st.session_state.assessment_result:
+            r = shortlist_view(st.session_state.assessment_result)
             prob = r.get("shortlist_probability", 0)
             tier = r.get("tier","")
             pc = "#10b981" if prob>=70 else "#f59e0b" if prob>=45 else "#ef4444"
@@ -157,12 +315,13 @@ def render_cool_features():
                         </div>""", unsafe_allow_html=True)
 
             # Keywords
-            kws = r.get("keyword_adds",[])
+            gap = skill_gap(st.session_state.resume_text, st.session_state.job_description)
+            kws = merge_keywords(gap.missing, r.get("keyword_adds",[]), exclude=gap.matched)
             if kws:
                 st.markdown("#### 🔑 Keywords to Add")
                 pills = " ".join(f"""<span style='display:inline-block;background:#fee2e2;color:#991b1b;
                     border:1px solid #fecaca;border-radius:20px;padding:3px 12px;font-size:13px;margin:3px'>
-                    ✗ {k}</span>""" for k in kws)
+                    ✗ {escape(str(k))}</span>""" for k in kws)
                 st.markdown(pills, unsafe_allow_html=True)
 
             # Differentiator
@@ -190,34 +349,10 @@ def render_cool_features():
         if "custom_qa_history" not in st.session_state:
             st.session_state.custom_qa_history = []
 
-        query = st.text_area("Your question", height=80,
-                             placeholder="e.g. What specific experience am I missing for the senior requirements?",
-                             label_visibility="collapsed", key="cq_input")
+        _custom_query_panel()
 
-        if st.button("💬 Ask", type="primary", disabled=not (query.strip() and st.session_state.resume_text and st.session_state.job_description)):
-            with st.spinner("Thinking…"):
-                try:
-                    prompt = (f"Answer this specific question about the candidate's fit for the role.\n\n"
-                              f"Question: {query}\n\n"
-                              f"RESUME:\n{st.session_state.resume_text[:2500]}\n\n"
-                              f"JOB:\n{st.session_state.job_description[:1500]}\n\nAnswer:")
-                    reply = call_llm(st.session_state.api_key, st.session_state.api_provider,
-                                     st.session_state.model, prompt, temperature=0.4, max_tokens=600)
-                    st.session_state.custom_qa_history.append({"q": query, "a": reply})
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"Failed: {e}")
-
-        for item in reversed(st.session_state.custom_qa_history):
-            st.markdown(f"""
-            <div style='background:#e0e7ff;border-left:3px solid #6366f1;border-radius:0 10px 10px 0;
-                        padding:10px 14px;margin-bottom:8px;font-size:14px;color:#1e293b'>
-                <b>Q:</b> {item['q']}</div>
-            <div style='background:#f0fdf4;border-left:3px solid #10b981;border-radius:0 10px 10px 0;
-                        padding:12px 16px;margin-bottom:16px;font-size:14px;color:#1e293b;line-height:1.7'>
-                <b>A:</b> {item['a']}</div>""", unsafe_allow_html=True)
-
-        if st.session_state.custom_qa_history:
-            if st.button("🗑️ Clear History"):
-                st.session_state.custom_qa_history = []
-                st.rerun()
+    # ═══════════════════════════════════════════════════════════════
+    # TAB 4 — JD LIBRARY
+    # ═══════════════════════════════════════════════════════════════
+    with tab4:
+        _render_jd_library()
@@ -3,9 +3,9 @@ ATS Resume Studio - Cover Letter Generator Page
 """
 
 import streamlit as st
-from src.core.llm import generate_cover_letter
-from src.utils.file_parser import extract_text_from_file, clean_text
-from src.utils.exporters import text_to_docx_bytes, create_download_filename
+from src.core.llm import stream_cover_letter
+from src.utils.doc_store import parse_upload
+from src.ui.downloads import download_button, template_picker
 
 
 def render_cover_letter():
@@ -33,12 +33,14 @@ def render_cover_letter():
                 key="cl_upload", label_visibility="collapsed",
             )
             if uploaded:
-                text, err = extract_text_from_file(uploaded)
-                if err:
-                    st.error(err)
+                doc = parse_upload(uploaded)
+                if doc.error:
+                    st.error(doc.error)
                 else:
-                    st.session_state.resume_text = clean_text(text)
+                    st.session_state.resume_text = doc.text
                     st.success(f"✅ {uploaded.name} loaded.")
+                    for w in doc.warnings:
+                        st.warning(w)
 
         with paste_tab:
             resume_input = st.text_area(
@@ -95,9 +97,11 @@ def render_cover_letter():
         )
 
     if generate_clicked:
-        with st.spinner("✍️ Writing your tailored cover letter..."):
-            try:
-                letter = generate_cover_letter(
+        live = st.empty()
+        try:
+            with live.container():
+                st.caption("✍️ Writing your tailored cover letter...")
+                letter = st.write_stream(stream_cover_letter(
                     st.session_state.api_key,
                     st.session_state.api_provider,
                     st.session_state.model,
@@ -105,12 +109,15 @@ def render_cover_letter():
                     st.session_state.job_description,
                     tone=tone,
                     extra_notes=extra_notes,
-                )
-                st.session_state.cover_letter = letter
-                st.success("✅ Cover letter generated!")
-            except Exception as e:
-                st.error(f"Generation failed: {str(e)}")
-                return
+                    use_cache=not st.session_state.pop("cover_letter_fresh", False),
+                    hedge=st.session_state.hedge,
+                ))
+            live.empty()
+            st.session_state.cover_letter = letter.strip()
+            st.success("✅ Cover letter generated!")
+        except Exception as e:
+            st.error(f"Generation failed: {str(e)}")
+            return
 
     if st.session_state.cover_letter:
         st.markdown("---")
@@ -129,31 +136,22 @@ def render_cover_letter():
         st.caption(f"Word count: {word_count} words")
 
         st.markdown("#### ⬇️ Download Cover Letter")
-        dl1, dl2, dl3 = st.columns(3)
+        dl1, dl2, dl3, dl4 = st.columns(4)
+
+        with dl4:                                   # first: the buttons below bind its choice
+            template = template_picker("cl")
 
         with dl1:
-            st.download_button(
-                "📄 Download TXT",
-                data=st.session_state.cover_letter.encode("utf-8"),
-                file_name=create_download_filename("cover_letter", "txt"),
-                mime="text/plain",
-                use_container_width=True,
-            )
+            download_button("📄 Download TXT", "txt", st.session_state.cover_letter, "cover_letter")
 
         with dl2:
-            try:
-                docx_bytes = text_to_docx_bytes(st.session_state.cover_letter, "Cover Letter")
-                st.download_button(
-                    "📝 Download DOCX",
-                    data=docx_bytes,
-                    file_name=create_download_filename("cover_letter", "docx"),
-                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    use_container_width=True,
-                )
-            except Exception:
-                st.info("Install python-docx for DOCX export.")
+            download_button("📝 Download DOCX", "docx", st.session_state.cover_letter,
+                            "cover_letter", "Cover Letter", template)
+            download_button("📕 Download PDF", "pdf", st.session_state.cover_letter,
+                            "cover_letter", "Cover Letter", template)
 
         with dl3:
             if st.button("🔄 Regenerate", use_container_width=True):
                 st.session_state.cover_letter = ""
+                st.session_state.cover_letter_fresh = True
                 st.rerun()
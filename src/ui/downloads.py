@@ -0,0 +1,54 @@
+"""
+ATS Resume Studio - Download Buttons
+TXT, DOCX and PDF, shared by the optimizer, cover letter and builder pages. Files are
+rendered only when a download is clicked (Streamlit runs the callable on its own
+thread, not the script thread) and cached by content hash, title and template, so
+editing the text no longer rebuilds a document on every rerun. The template is bound
+when the button is drawn, so pages render template_picker first and pass its choice.
+"""
+
+import functools
+
+import streamlit as st
+from src.utils.exporters import (
+    DEFAULT_TEMPLATE, TEMPLATES, create_download_filename, docx_available, export_docx, export_pdf,
+    pdf_available,
+)
+
+MIME_TYPES = {
+    "txt": "text/plain",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "pdf": "application/pdf",
+}
+_RENDERERS = {"docx": export_docx, "pdf": export_pdf}
+_REQUIRES = {"docx": (docx_available, "python-docx"), "pdf": (pdf_available, "fpdf2")}
+
+
+def template_picker(key: str) -> str:
+    """Template for this session's exports; the choice carries across pages."""
+    names = list(TEMPLATES)
+    current = st.session_state.get("export_template", DEFAULT_TEMPLATE)
+    choice = st.selectbox("Template", names, index=names.index(current) if current in names else 0,
+                          format_func=lambda n: TEMPLATES[n].label, key=f"{key}_template")
+    st.session_state.export_template = choice
+    return choice
+
+
+def download_button(label: str, fmt: str, content: str, base_name: str, title: str = "Resume",
+                    template: str | None = None):
+    if fmt in _REQUIRES and not _REQUIRES[fmt][0]():
+        st.caption(f"Install {_REQUIRES[fmt][1]} for {fmt.upper()} export.")
+        return
+    if fmt == "txt":
+        data = content.encode("utf-8")
+    else:
+        data = functools.partial(_RENDERERS[fmt], content, title, template
+                                 or st.session_state.get("export_template", DEFAULT_TEMPLATE))
+    st.download_button(
+        label,
+        data=data,
+        file_name=create_download_filename(base_name, fmt),
+        mime=MIME_TYPES[fmt],
+        use_container_width=True,
+        on_click="ignore",
+    )
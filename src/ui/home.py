@@ -61,7 +61,7 @@ def render_home():
     </div>""", unsafe_allow_html=True)
 
     st.markdown('<div class="section-title">Everything you need to land the job</div>', unsafe_allow_html=True)
-    st.markdown('<div class="section-subtitle">Eight AI tools, one seamless workflow — start with ATS Analyzer.</div>', unsafe_allow_html=True)
+    st.markdown('<div class="section-subtitle">Nine AI tools, one seamless workflow — start with ATS Analyzer.</div>', unsafe_allow_html=True)
 
     features = [
         ("🔍","ATS Analyzer","Get an ATS score, keyword gaps, section feedback, and Marcus Reid's honest coaching.","🔍 ATS Analyzer"),
@@ -72,6 +72,7 @@ def render_home():
         ("🎤","Practice Coach","AI asks questions, you answer, AI grades with STAR scoring.","🎯 Interview Prep"),
         ("🏆","Shortlist Accelerator","Surgical gap analysis to break into the top 10 shortlist.","🚀 Cool Features"),
         ("🎯","Match %","Precise role match percentage with gap breakdown.","🚀 Cool Features"),
+        ("👥","Recruiter Batch","Rank hundreds of resumes against one JD; AI-score the top K.","👥 Recruiter Batch"),
     ]
 
     for row in range(0, len(features), 3):
@@ -0,0 +1,109 @@
+"""
+ATS Resume Studio - Background Job Helpers
+Start jobs for the current session, copy finished results into session state, and
+poll running jobs with auto-refreshing fragments (only while something is running).
+"""
+
+import streamlit as st
+from src.core.jobs import prune, start_job
+
+
+def submit_job(kind: str, label: str, work, target: str, transform=None):
+    """Run `work` in the background; when it finishes its result is stored in
+    st.session_state[target] (after `transform`), whichever page is open by then."""
+    job = start_job(kind, label, work, target=target, transform=transform,
+                    page=st.session_state.current_page)
+    st.session_state.jobs[job.id] = job
+    st.session_state.job_errors.pop(kind, None)
+    return job
+
+
+def latest_job(kind: str):
+    return next((j for j in reversed(st.session_state.jobs.values()) if j.kind == kind), None)
+
+
+def running_job(kind: str):
+    job = latest_job(kind)
+    return job if job is not None and job.running else None
+
+
+def pop_job_error(kind: str) -> str | None:
+    return st.session_state.job_errors.pop(kind, None)
+
+
+def collect_jobs():
+    """Move results of finished jobs into session state. Called once per script run."""
+    jobs = st.session_state.jobs
+    for job in list(jobs.values()):
+        if job.running or job.collected:
+            continue
+        job.collected = True
+        here = job.meta["page"] == st.session_state.current_page
+        if job.status == "done":
+            value = job.result()
+            transform = job.meta.get("transform")
+            st.session_state[job.meta["target"]] = transform(value) if transform else value
+            job.meta["seen"] = here
+            st.toast(f"✅ {job.label} ready" + ("" if here else f" — see {job.meta['page']}"))
+        elif job.status == "failed":
+            st.session_state.job_errors[job.kind] = str(job.error)
+            if not here:
+                st.toast(f"❌ {job.label} failed — see {job.meta['page']}")
+    for job in jobs.values():
+        if job.collected and job.meta["page"] == st.session_state.current_page:
+            job.meta["seen"] = True
+    prune(jobs)
+
+
+@st.fragment(run_every=1.0)
+def _job_progress(job_id: str):
+    job = st.session_state.jobs.get(job_id)
+    if job is None or not job.running:
+        st.rerun()                                  # whole app: collect and show the result
+    col_msg, col_cancel = st.columns([5, 1])
+    col_msg.caption(f"⏳ {job.label}… {job.elapsed:.0f}s — you can switch pages, "
+                    "the result will be waiting here.")
+    if col_cancel.button("✖ Cancel", key=f"cancel_{job.id}", use_container_width=True):
+        job.cancel()
+        st.rerun()
+    if job.partial:
+        with st.container(height=320):
+            st.text(job.partial)
+
+
+def render_job_progress(kind: str) -> bool:
+    """Live progress for this page's running job, if any. Returns True while running."""
+    job = running_job(kind)
+    if job is None:
+        return False
+    _job_progress(job.id)
+    return True
+
+
+@st.fragment(run_every=2.0)
+def _job_tray(running_ids: tuple):
+    jobs = st.session_state.jobs
+    if any(jid not in jobs or not jobs[jid].running for jid in running_ids):
+        st.rerun()
+    for jid in running_ids:
+        job = jobs[jid]
+        st.caption(f"⏳ {job.label} · {job.elapsed:.0f}s")
+
+
+def render_job_tray():
+    """Sidebar list of this session's running jobs and unseen results."""
+    jobs = list(st.session_state.jobs.values())
+    running = tuple(j.id for j in jobs if j.running)
+    unseen = [j for j in jobs if j.collected and j.status == "done" and not j.meta.get("seen")]
+    if not (running or unseen):
+        return
+    st.markdown("<div style='font-size:11px;font-weight:700;color:#94a3b8;text-transform:uppercase;"
+                "letter-spacing:1px;margin-bottom:6px'>Background jobs</div>", unsafe_allow_html=True)
+    if running:
+        _job_tray(running)
+    for job in unseen:
+        if st.button(f"✅ {job.label} — open", key=f"job_open_{job.id}", use_container_width=True):
+            job.meta["seen"] = True
+            st.session_state.current_page = job.meta["page"]
+            st.rerun()
+    st.markdown("---")
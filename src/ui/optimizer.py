@@ -3,9 +3,10 @@ ATS Resume Studio - Resume Optimizer Page
 """
 
 import streamlit as st
-from src.core.llm import optimize_resume
-from src.utils.file_parser import extract_text_from_file, clean_text
-from src.utils.exporters import text_to_docx_bytes, create_download_filename
+from src.core.async_llm import astream_optimize_resume
+from src.ui.jobs import pop_job_error, render_job_progress, running_job, submit_job
+from src.utils.doc_store import parse_upload
+from src.ui.downloads import download_button, template_picker
 
 
 def render_optimizer():
@@ -35,12 +36,14 @@ def render_optimizer():
                 label_visibility="collapsed",
             )
             if uploaded:
-                text, err = extract_text_from_file(uploaded)
-                if err:
-                    st.error(err)
+                doc = parse_upload(uploaded)
+                if doc.error:
+                    st.error(doc.error)
                 else:
-                    st.session_state.resume_text = clean_text(text)
+                    st.session_state.resume_text = doc.text
                     st.success(f"✅ {uploaded.name} loaded.")
+                    for w in doc.warnings:
+                        st.warning(w)
 
         with paste_tab:
             resume_input = st.text_area(
@@ -74,24 +77,25 @@ def render_optimizer():
             "✨ Optimize Resume",
             type="primary",
             use_container_width=True,
-            disabled=(not st.session_state.resume_text or not st.session_state.job_description),
+            disabled=(not st.session_state.resume_text or not st.session_state.job_description
+                      or running_job("optimize") is not None),
         )
 
     if optimize_clicked:
-        with st.spinner("🤖 Rewriting your resume for maximum ATS impact..."):
-            try:
-                optimized = optimize_resume(
-                    st.session_state.api_key,
-                    st.session_state.api_provider,
-                    st.session_state.model,
-                    st.session_state.resume_text,
-                    st.session_state.job_description,
-                )
-                st.session_state.optimized_resume = optimized
-                st.success("✅ Resume optimized!")
-            except Exception as e:
-                st.error(f"Optimization failed: {str(e)}")
-                return
+        submit_job("optimize", "Optimized resume", astream_optimize_resume(
+            st.session_state.api_key,
+            st.session_state.api_provider,
+            st.session_state.model,
+            st.session_state.resume_text,
+            st.session_state.job_description,
+            hedge=st.session_state.hedge,
+        ), target="optimized_resume", transform=str.strip)
+
+    if render_job_progress("optimize"):
+        return
+    error = pop_job_error("optimize")
+    if error:
+        st.error(f"Optimization failed: {error}")
 
     if st.session_state.optimized_resume:
         st.markdown("---")
@@ -121,29 +125,20 @@ def render_optimizer():
 
         # Downloads
         st.markdown("#### ⬇️ Download Your Optimized Resume")
-        dl_col1, dl_col2, dl_col3 = st.columns(3)
+        dl_col1, dl_col2, dl_col3, dl_col4 = st.columns(4)
+
+        with dl_col4:                               # first: the buttons below bind its choice
+            template = template_picker("opt")
 
         with dl_col1:
-            st.download_button(
-                "📄 Download as TXT",
-                data=st.session_state.optimized_resume.encode("utf-8"),
-                file_name=create_download_filename("optimized_resume", "txt"),
-                mime="text/plain",
-                use_container_width=True,
-            )
+            download_button("📄 Download as TXT", "txt", st.session_state.optimized_resume,
+                            "optimized_resume")
 
         with dl_col2:
-            try:
-                docx_bytes = text_to_docx_bytes(st.session_state.optimized_resume, "Optimized Resume")
-                st.download_button(
-                    "📝 Download as DOCX",
-                    data=docx_bytes,
-                    file_name=create_download_filename("optimized_resume", "docx"),
-                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    use_container_width=True,
-                )
-            except Exception:
-                st.info("Install python-docx for DOCX export.")
+            download_button("📝 Download as DOCX", "docx", st.session_state.optimized_resume,
+                            "optimized_resume", "Optimized Resume", template)
+            download_button("📕 Download as PDF", "pdf", st.session_state.optimized_resume,
+                            "optimized_resume", "Optimized Resume", template)
 
         with dl_col3:
             if st.button("🔍 Run ATS Analysis →", use_container_width=True):
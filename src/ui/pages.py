@@ -0,0 +1,40 @@
+"""
+ATS Resume Studio - Page Registry
+Pages are imported on first navigation, so a run only loads the page it renders and
+a cold start paints Home without importing the other tools.
+"""
+
+import sys
+from typing import NamedTuple
+
+from src.utils.perf import timed
+
+
+class Page(NamedTuple):
+    module: str
+    render: str
+    caption: str                    # sidebar hint
+
+
+PAGES = {
+    "🏠 Home":              Page("src.ui.home", "render_home", "Home & Features"),
+    "🔍 ATS Analyzer":      Page("src.ui.analyzer", "render_analyzer", "Score vs job description"),
+    "🏗️ Resume Builder":    Page("src.ui.builder", "render_builder", "Build from scratch"),
+    "✨ Resume Optimizer":  Page("src.ui.optimizer", "render_optimizer", "AI rewrite"),
+    "✉️ Cover Letter":      Page("src.ui.cover_letter", "render_cover_letter", "Tailored letters"),
+    "🎯 Interview Prep":    Page("src.ui.interview_prep", "render_interview_prep", "Q&A + Practice Coach"),
+    "🚀 Cool Features":     Page("src.ui.cool_features", "render_cool_features", "Match % · Shortlist"),
+    "👥 Recruiter Batch":   Page("src.ui.batch", "render_batch", "Rank many resumes"),
+}
+
+
+def render_page(label: str) -> None:
+    page = PAGES.get(label)
+    if page is None:
+        return
+    module = sys.modules.get(page.module)
+    if module is None:
+        with timed(f"import:{page.module}"):
+            # __import__ rather than importlib, so the startup profiler sees it too
+            module = __import__(page.module, fromlist=[page.render])
+    getattr(module, page.render)()
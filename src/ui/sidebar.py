@@ -3,7 +3,12 @@ ATS Resume Studio v3 - Sidebar
 Providers: Groq (FREE), OpenAI, Anthropic, OpenRouter, Together AI, Ollama (LOCAL/FREE)
 """
 import streamlit as st
-from src.core.llm import verify_api_key
+from src.core.llm import json_parse_stats, verify_api_key
+from src.core.cache import get_response_cache
+from src.core.hedging import HedgePolicy
+from src.ui.jobs import render_job_tray
+from src.ui.pages import PAGES
+from src.utils.perf import PERF_ENABLED, perf_summary
 
 PROVIDER_MODELS = {
     "groq": {
@@ -207,23 +212,41 @@ def render_sidebar():
                         f"<a href='{HELP_LINKS[provider]}' target='_blank' style='color:#6366f1'>{link_text} →</a></div>",
                         unsafe_allow_html=True)
 
+        # ── Failover / hedging (opt-in) ───────────────────────────
+        with st.expander("🛟 Backup provider", expanded=st.session_state.hedge is not None):
+            st.caption("Slow or failing replies are re-sent here; the first answer wins.")
+            b_label = st.selectbox("Backup provider", list(provider_labels.keys()), index=1,
+                                   key="hedge_provider")
+            b_provider = provider_labels[b_label]
+            b_models = PROVIDER_MODELS.get(b_provider, {})
+            b_model = st.selectbox("Backup model", list(b_models.keys()), key="hedge_model")
+            b_key = st.text_input("Backup API key" if b_provider != "ollama" else "Ollama URL (optional)",
+                                  type="password" if b_provider != "ollama" else "default",
+                                  placeholder=placeholder_map.get(b_provider, ""), key="hedge_key")
+            if st.toggle("Enable backup", value=st.session_state.hedge is not None, key="hedge_on"):
+                key_val = b_key or ("http://localhost:11434" if b_provider == "ollama" else "")
+                same = (b_provider == st.session_state.get("api_provider")
+                        and b_models[b_model] == st.session_state.get("model"))
+                if same:
+                    st.session_state.hedge = None
+                    st.caption("⚠ The backup is your primary model — pick a different one.")
+                elif key_val:
+                    st.session_state.hedge = HedgePolicy(b_provider, b_models[b_model], key_val)
+                else:
+                    st.session_state.hedge = None
+                    st.caption("⚠ Enter the backup API key to enable.")
+            else:
+                st.session_state.hedge = None
+
         st.markdown("---")
+        render_job_tray()
 
         # ── Navigation ────────────────────────────────────────────
         st.markdown("<div style='font-size:11px;font-weight:700;color:#94a3b8;text-transform:uppercase;letter-spacing:1px;margin-bottom:10px'>Navigation</div>", unsafe_allow_html=True)
 
-        nav_items = [
-            ("🏠 Home", "Home & Features"),
-            ("🔍 ATS Analyzer", "Score vs job description"),
-            ("🏗️ Resume Builder", "Build from scratch"),
-            ("✨ Resume Optimizer", "AI rewrite"),
-            ("✉️ Cover Letter", "Tailored letters"),
-            ("🎯 Interview Prep", "Q&A + Practice Coach"),
-            ("🚀 Cool Features", "Match % · Shortlist"),
-        ]
-        for label, desc in nav_items:
+        for label, page in PAGES.items():
             active = st.session_state.current_page == label
-            if st.button(label, key=f"nav_{label}", use_container_width=True,
+            if st.button(label, key=f"nav_{label}", use_container_width=True, help=page.caption,
                          type="primary" if active else "secondary"):
                 st.session_state.current_page = label
                 st.rerun()
@@ -238,4 +261,18 @@ def render_sidebar():
             • Haiku/8B models are 10x cheaper
         </div>""", unsafe_allow_html=True)
 
+        cache = get_response_cache()
+        if cache is not None:
+            cs = cache.stats()
+            st.caption(f"⚡ Response cache: {cs['memory_hits'] + cs['disk_hits']} hits · "
+                       f"{cs['misses']} misses ({cs['hit_rate']:.0%})")
+
+        failed = sum(v["failed"] for v in json_parse_stats().values())
+        if failed:
+            parsed = sum(v["parsed"] for v in json_parse_stats().values())
+            st.caption(f"🧩 Structured replies: {parsed} parsed · {failed} unparseable")
+
+        if PERF_ENABLED and perf_summary():
+            st.caption("⏱️ Server time per run\n\n" + perf_summary().replace("\n", "  \n"))
+
         st.markdown("<div style='text-align:center;font-size:11px;color:#475569;margin-top:12px'>ATS Resume Studio v3<br>© 2025</div>", unsafe_allow_html=True)
\ No newline at end of file
@@ -0,0 +1,188 @@
+"""
+ATS Resume Studio - Parsed Document Store
+Uploads are parsed once and looked up by SHA-256 of their bytes afterwards, so a
+Streamlit rerun (every keystroke, every click) no longer re-runs pypdf/python-docx.
+
+Process-wide and shared by every page and session; bounded by total text size, LRU.
+Only complete parses are stored by content hash. A failure, or a PDF cut short by the
+time limit, is kept just for the upload that produced it (its reruns), so uploading
+the file again parses it again. Batches (recruiter mode) go through parse_many, which
+farms misses out to the shared parsing process pool.
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+
+from src.core.sections import segment_resume
+from src.utils import file_parser
+from src.utils.file_parser import clean_text, extract_text_from_bytes
+
+_STORE_BYTES = int(float(os.getenv("ATS_DOC_STORE_MB", "64")) * 1024 * 1024)
+_POOL_MIN_DOCS = 8               # smaller batches parse in-process
+_PROVISIONAL_DOCS = 16           # failed / partial parses remembered per upload
+
+
+@dataclass(frozen=True)
+class ParsedDocument:
+    digest: str
+    name: str
+    text: str = ""                                   # cleaned, ready for prompts
+    error: str = ""
+    sections: tuple = ()                             # ((section_name, body), ...)
+    metadata: dict = field(default_factory=dict)     # kind, bytes, words, sections
+    warnings: tuple = ()
+    partial: bool = False                            # cut short by the PDF time limit
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+    @property
+    def cacheable(self) -> bool:
+        """Parsing the same bytes again would give the same result."""
+        return not self.error and not self.partial
+
+    @property
+    def size(self) -> int:
+        return len(self.text.encode("utf-8")) + sum(len(b) for _, b in self.sections) + 256
+
+
+def parse_document(data: bytes, filename: str, digest: str = "") -> ParsedDocument:
+    """Parse bytes into a ParsedDocument (no caching)."""
+    digest = digest or hashlib.sha256(data).hexdigest()
+    info: dict = {}
+    text, err = extract_text_from_bytes(data, filename, info)
+    if err:
+        return ParsedDocument(digest, filename, error=err)
+    text = clean_text(text)
+    sections = segment_resume(text).sections             # warms the segment cache too
+    meta = {"kind": filename.rsplit(".", 1)[-1].lower(), "bytes": len(data),
+            "words": len(text.split()), "sections": [n for n, _ in sections]}
+    if "pdf_stats" in info:
+        meta["pdf"] = info["pdf_stats"]
+    return ParsedDocument(digest, filename, text, "", sections, meta,
+                          tuple(info.get("warnings", ())), bool(info.get("partial")))
+
+
+class DocumentStore:
+    """Thread-safe LRU of ParsedDocument keyed by content hash, bounded by total size."""
+
+    def __init__(self, max_bytes: int = _STORE_BYTES):
+        self.max_bytes, self.bytes = max_bytes, 0
+        self._docs: OrderedDict[str, ParsedDocument] = OrderedDict()
+        self._provisional: OrderedDict[tuple, ParsedDocument] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def lookup(self, data: bytes, filename: str) -> tuple[str, ParsedDocument | None]:
+        """(key, cached document or None). The extension decides the parser, so it is
+        part of the key."""
+        key = f"{hashlib.sha256(data).hexdigest()}:{filename.rsplit('.', 1)[-1].lower()}"
+        with self._lock:
+            doc = self._docs.get(key)
+            if doc is None:
+                self.misses += 1
+                return key, None
+            self._docs.move_to_end(key)
+            self.hits += 1
+        return key, doc if doc.name == filename else replace(doc, name=filename)
+
+    def get_or_parse(self, data: bytes, filename: str, upload_id: str = "") -> ParsedDocument:
+        """upload_id identifies one upload (Streamlit's file_id): a failed or partial parse
+        is reused for that upload's reruns only, never for the same bytes uploaded again."""
+        key, doc = self.lookup(data, filename)
+        if doc is not None:
+            return doc
+        with self._lock:
+            doc = self._provisional.get((key, upload_id)) if upload_id else None
+        if doc is None:
+            doc = parse_document(data, filename, key.split(":")[0])   # parse outside the lock
+            if doc.cacheable:
+                self.put(key, doc)
+            elif upload_id:
+                with self._lock:
+                    self._provisional[(key, upload_id)] = doc
+                    while len(self._provisional) > _PROVISIONAL_DOCS:
+                        self._provisional.popitem(last=False)
+        return doc if doc.name == filename else replace(doc, name=filename)
+
+    def put(self, key: str, doc: ParsedDocument) -> None:
+        if doc.size > self.max_bytes or not doc.cacheable:
+            return
+        with self._lock:
+            old = self._docs.pop(key, None)
+            if old is not None:
+                self.bytes -= old.size
+            self._docs[key] = doc
+            self.bytes += doc.size
+            while self.bytes > self.max_bytes:
+                _, evicted = self._docs.popitem(last=False)
+                self.bytes -= evicted.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs.clear(); self._provisional.clear(); self.bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"documents": len(self._docs), "bytes": self.bytes,
+                    "hits": self.hits, "misses": self.misses}
+
+
+_STORE = DocumentStore()
+
+
+def parse_upload(uploaded_file) -> ParsedDocument:
+    """ParsedDocument for a Streamlit UploadedFile; parsed on first sight only."""
+    return _STORE.get_or_parse(uploaded_file.getvalue(), uploaded_file.name,
+                               getattr(uploaded_file, "file_id", ""))
+
+
+def _parse_in_worker(data: bytes, filename: str, digest: str) -> ParsedDocument:
+    file_parser.PDF_WORKERS = 1          # already in a pool worker: no nested PDF sharding
+    return parse_document(data, filename, digest)
+
+
+def parse_many(items, on_parsed=None) -> list[ParsedDocument]:
+    """ParsedDocuments for [(bytes, filename), ...], in input order. Cached documents are
+    reused; the rest are parsed in the shared process pool when there are enough of
+    them. on_parsed(done, total) is called as documents arrive."""
+    from concurrent.futures import as_completed
+    from concurrent.futures.process import BrokenProcessPool
+    docs: list[ParsedDocument | None] = [None] * len(items)
+    todo = []
+    for i, (data, filename) in enumerate(items):
+        key, docs[i] = _STORE.lookup(data, filename)
+        if docs[i] is None:
+            todo.append((i, key, data, filename))
+    done = len(items) - len(todo)
+
+    def landed(i: int, key: str, doc: ParsedDocument) -> None:
+        nonlocal done
+        docs[i] = doc
+        _STORE.put(key, doc)
+        done += 1
+        if on_parsed:
+            on_parsed(done, len(items))
+
+    if len(todo) >= _POOL_MIN_DOCS and file_parser.PDF_WORKERS > 1:
+        try:
+            pool = file_parser.parser_pool()
+            futures = {pool.submit(_parse_in_worker, data, name, key.split(":")[0]): (i, key)
+                       for i, key, data, name in todo}
+            for fut in as_completed(futures):
+                landed(*futures[fut], fut.result())
+        except (BrokenProcessPool, OSError, RuntimeError):
+            file_parser.discard_parser_pool()                # finish the rest in-process
+    for i, key, data, filename in todo:
+        if docs[i] is None:
+            landed(i, key, parse_document(data, filename, key.split(":")[0]))
+    return docs
+
+
+def doc_store_stats() -> dict:
+    return _STORE.stats()
@@ -1,64 +1,114 @@
 """
 ATS Resume Studio - Export Utilities
-Generate downloadable files from text content.
+Generate downloadable files (DOCX, PDF) from text content, one at a time or in batches.
 """
 
 from __future__ import annotations
+import copy
+import functools
+import hashlib
+import importlib.util
 import io
+import os
+import threading
+import unicodedata
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import repeat
+from typing import NamedTuple
 
+EXPORT_CACHE_ENTRIES = 32      # rendered files kept per process
 
-def text_to_docx_bytes(content: str, title: str = "Resume") -> bytes:
+
+@dataclass(frozen=True)
+class ExportTemplate:
+    label: str
+    accent: tuple = (0x6B, 0x46, 0xC1)    # heading colour (RGB)
+    title_pt: int = 20
+    heading_pt: int = 12
+    margin_in: float = 1.0
+    body_pt: float = 10.5                 # PDF body text (DOCX keeps Word's Normal style)
+
+
+TEMPLATES = {
+    "classic": ExportTemplate("Classic"),
+    "compact": ExportTemplate("Compact (fits more per page)", accent=(0x1E, 0x29, 0x3B),
+                              title_pt=16, heading_pt=11, margin_in=0.7, body_pt=9.5),
+}
+DEFAULT_TEMPLATE = "classic"
+
+
+def classify_lines(content: str) -> list[tuple[str, str]]:
+    """(kind, text) for each line: "blank", "title", "heading", "bullet" or "text".
+    Shared by the DOCX and PDF renderers, so both formats lay a document out alike."""
+    out = []
+    first_line = True
+    for line in content.split("\n"):
+        line = line.strip()
+        if not line:
+            out.append(("blank", ""))
+            continue
+
+        # Heuristic: all-caps short lines are headings
+        is_heading = (
+            line.isupper() and len(line) < 50 and not line.startswith("-")
+        ) or (
+            line.endswith(":") and len(line.split()) <= 4
+        )
+
+        if first_line:
+            out.append(("title", line))
+            first_line = False
+        elif is_heading:
+            out.append(("heading", line))
+        elif line.startswith("•") or line.startswith("-"):
+            out.append(("bullet", line.lstrip("•- ")))
+        else:
+            out.append(("text", line))
+    return out
+
+
+def text_to_docx_bytes(content: str, title: str = "Resume", template: str = DEFAULT_TEMPLATE) -> bytes:
     """Convert text content to a formatted DOCX file in memory."""
+    tpl = TEMPLATES.get(template, TEMPLATES[DEFAULT_TEMPLATE])
     try:
         from docx import Document
         from docx.shared import Pt, Inches, RGBColor
         from docx.enum.text import WD_ALIGN_PARAGRAPH
 
         doc = Document()
+        doc.core_properties.title = title
 
         # Page margins
         for section in doc.sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
-
-        lines = content.split("\n")
-        first_line = True
+            section.top_margin = Inches(tpl.margin_in)
+            section.bottom_margin = Inches(tpl.margin_in)
+            section.left_margin = Inches(tpl.margin_in)
+            section.right_margin = Inches(tpl.margin_in)
 
-        for line in lines:
-            line = line.strip()
-            if not line:
+        for kind, line in classify_lines(content):
+            if kind == "blank":
                 doc.add_paragraph("")
-                continue
-
-            # Heuristic: all-caps short lines are headings
-            is_heading = (
-                line.isupper() and len(line) < 50 and not line.startswith("-")
-            ) or (
-                line.endswith(":") and len(line.split()) <= 4
-            )
-
-            if first_line:
+            elif kind == "title":
                 p = doc.add_paragraph()
                 run = p.add_run(line)
                 run.bold = True
-                run.font.size = Pt(20)
+                run.font.size = Pt(tpl.title_pt)
                 p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                first_line = False
-            elif is_heading:
+            elif kind == "heading":
                 p = doc.add_paragraph()
                 run = p.add_run(line)
                 run.bold = True
-                run.font.size = Pt(12)
-                run.font.color.rgb = RGBColor(0x6B, 0x46, 0xC1)
+                run.font.size = Pt(tpl.heading_pt)
+                run.font.color.rgb = RGBColor(*tpl.accent)
                 # Add bottom border via paragraph format
                 p.paragraph_format.space_before = Pt(10)
                 p.paragraph_format.space_after = Pt(4)
-            elif line.startswith("•") or line.startswith("-"):
+            elif kind == "bullet":
                 p = doc.add_paragraph(style="List Bullet")
-                p.add_run(line.lstrip("•- "))
+                p.add_run(line)
                 p.paragraph_format.space_after = Pt(2)
             else:
                 p = doc.add_paragraph(line)
@@ -73,6 +123,230 @@ def text_to_docx_bytes(content: str, title: str = "Resume") -> bytes:
         return content.encode("utf-8")
 
 
+# ── PDF ───────────────────────────────────────────────────────────
+# Rendered with fpdf2 (optional). Page set-up and fonts for each template are built
+# once per process into a blank prototype that every export clones, so a document only
+# pays for its own text. The built-in Helvetica needs no font files; set ATS_PDF_FONT
+# (and optionally ATS_PDF_FONT_BOLD) to a TTF for text beyond Western European scripts.
+PDF_FONT      = os.getenv("ATS_PDF_FONT", "")
+PDF_FONT_BOLD = os.getenv("ATS_PDF_FONT_BOLD", "")
+
+
+def _winansi_table() -> dict:
+    """Typography the core fonts can draw via WinAnsi: "•" → 0x95, "–" → 0x96, "’" → 0x92 …"""
+    table = {}
+    for b in range(0x80, 0xA0):
+        try:
+            table[ord(bytes([b]).decode("cp1252"))] = b
+        except UnicodeDecodeError:
+            pass
+    return table
+
+
+_WINANSI = _winansi_table()
+
+
+def _winansi_fallback(c: str) -> str:
+    base = unicodedata.normalize("NFKD", c)[:1]        # drop accents: "Ć" → "C"
+    return base if base and ord(base) < 256 else "?"
+
+
+def _to_winansi(text: str) -> str:
+    text = text.translate(_WINANSI)
+    try:
+        text.encode("latin-1")
+        return text
+    except UnicodeEncodeError:
+        return "".join(c if ord(c) < 256 else _winansi_fallback(c) for c in text)
+
+
+class _PdfStyle(NamedTuple):
+    family: str
+    bullet: str
+    clean: object                  # text -> drawable text for the font
+    body_h: float                  # line heights, pt
+    title_h: float
+    heading_h: float
+    indent: float
+
+
+@functools.lru_cache(maxsize=None)
+def pdf_available() -> bool:
+    return importlib.util.find_spec("fpdf") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_prototype(template: str):
+    """Blank document with the template's page set-up and fonts loaded, plus its style."""
+    from fpdf import FPDF
+    tpl = TEMPLATES[template]
+    pdf = FPDF(unit="pt", format="Letter")
+    margin = tpl.margin_in * 72
+    pdf.set_margins(margin, margin, margin)
+    pdf.set_auto_page_break(True, margin)
+    pdf.set_creator("ATS Resume Studio")
+    if PDF_FONT:
+        pdf.add_font("Body", "", PDF_FONT)
+        pdf.add_font("Body", "B", PDF_FONT_BOLD or PDF_FONT)
+    family, bullet, clean = ("Body", "•", str) if PDF_FONT else ("Helvetica", "\x95", _to_winansi)
+    style = _PdfStyle(family, bullet, clean, tpl.body_pt * 1.35, tpl.title_pt * 1.25,
+                      tpl.heading_pt * 1.3, tpl.body_pt * 1.2)
+    pdf.set_font(family, size=tpl.body_pt)
+    return pdf, style
+
+
+@functools.lru_cache(maxsize=None)
+def _font_bytes(path: str) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+def _new_pdf(template: str):
+    proto, style = _pdf_prototype(template)
+    # Glyph widths and ids are read-only once a font is loaded: the prototype's tables
+    # are shared by every copy instead of being re-copied (thousands of entries for a
+    # TTF) per document; fpdf2 already shares the cmap and descriptor the same way.
+    shared = {id(t): t for font in proto.fonts.values()
+              for t in (getattr(font, "cw", None), getattr(font, "glyph_ids", None)) if t is not None}
+    pdf = copy.deepcopy(proto, shared)
+    if PDF_FONT:
+        # fpdf2 copies share each font's fontTools object, but output() subsets it in
+        # place; give the copy its own, re-read from memory (parsed metrics stay shared)
+        from fontTools import ttLib
+        for font in pdf.fonts.values():
+            font.ttfont = ttLib.TTFont(io.BytesIO(_font_bytes(str(font.ttffile))),
+                                       recalcTimestamp=False, lazy=True)
+    return pdf, style
+
+
+def text_to_pdf_bytes(content: str, title: str = "Resume", template: str = DEFAULT_TEMPLATE) -> bytes:
+    """Convert text content to a formatted PDF in memory (needs fpdf2)."""
+    from fpdf.enums import XPos, YPos
+    if template not in TEMPLATES:
+        template = DEFAULT_TEMPLATE
+    tpl = TEMPLATES[template]
+    pdf, st = _new_pdf(template)
+    pdf.set_title(title)
+    pdf.add_page()
+    nl = {"new_x": XPos.LMARGIN, "new_y": YPos.NEXT}
+
+    for kind, line in classify_lines(content):
+        if kind == "blank":
+            pdf.ln(st.body_h / 2)
+        elif kind == "title":
+            pdf.set_font(st.family, "B", tpl.title_pt)
+            pdf.multi_cell(0, st.title_h, st.clean(line), align="C", **nl)
+            pdf.set_font(st.family, "", tpl.body_pt)
+        elif kind == "heading":
+            pdf.ln(10)
+            pdf.set_font(st.family, "B", tpl.heading_pt)
+            pdf.set_text_color(*tpl.accent)
+            pdf.multi_cell(0, st.heading_h, st.clean(line), align="L", **nl)
+            pdf.set_draw_color(*tpl.accent)
+            pdf.line(pdf.l_margin, pdf.get_y(), pdf.w - pdf.r_margin, pdf.get_y())
+            pdf.ln(4)
+            pdf.set_font(st.family, "", tpl.body_pt)
+            pdf.set_text_color(0)
+        elif kind == "bullet":
+            pdf.set_x(pdf.l_margin + st.indent / 3)
+            pdf.cell(st.indent * 2 / 3, st.body_h, st.bullet)
+            pdf.multi_cell(0, st.body_h, st.clean(line), align="L", **nl)    # wraps under the text
+            pdf.ln(2)
+        else:
+            pdf.multi_cell(0, st.body_h, st.clean(line), align="L", **nl)
+            pdf.ln(2)
+
+    return bytes(pdf.output())
+
+
+RENDERERS = {"docx": text_to_docx_bytes, "pdf": text_to_pdf_bytes}
+
+
+# ── Cached, on-demand export ─────────────────────────────────────
+_EXPORTS: OrderedDict = OrderedDict()
+_EXPORTS_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def docx_available() -> bool:
+    return importlib.util.find_spec("docx") is not None
+
+
+def export_file(fmt: str, content: str, title: str = "Resume", template: str = DEFAULT_TEMPLATE) -> bytes:
+    """RENDERERS[fmt], cached by (format, content hash, title, template). Thread-safe: the
+    UI calls it from Streamlit's download thread, only when a download is clicked."""
+    key = (fmt, hashlib.sha256(content.encode("utf-8")).hexdigest(), title, template)
+    with _EXPORTS_LOCK:
+        if key in _EXPORTS:
+            _EXPORTS.move_to_end(key)
+            return _EXPORTS[key]
+    data = RENDERERS[fmt](content, title, template)
+    with _EXPORTS_LOCK:
+        _EXPORTS[key] = data
+        while len(_EXPORTS) > EXPORT_CACHE_ENTRIES:
+            _EXPORTS.popitem(last=False)
+    return data
+
+
+export_docx = functools.partial(export_file, "docx")
+export_pdf = functools.partial(export_file, "pdf")
+
+
+# ── Batch export ─────────────────────────────────────────────────
+# Both renderers are pure Python, so batches go to the shared parsing process pool
+# rather than threads; each worker builds its PDF prototypes once and keeps them.
+_PARALLEL_MIN_DOCS = 4           # below this, pool dispatch costs more than it saves
+
+
+def _render(fmt: str, content: str, title: str, template: str) -> bytes:
+    return RENDERERS[fmt](content, title, template)
+
+
+def export_batch(docs, fmt: str = "pdf", template: str = DEFAULT_TEMPLATE) -> list[bytes]:
+    """Render [(content, title), …] to files of one format, returned in input order."""
+    docs = list(docs)
+    if not docs:
+        return []
+    contents, titles = zip(*docs)
+    from src.utils.file_parser import PDF_WORKERS, discard_parser_pool, parser_pool
+    if len(docs) >= _PARALLEL_MIN_DOCS and PDF_WORKERS > 1:
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            return list(parser_pool().map(_render, repeat(fmt), contents, titles, repeat(template),
+                                          chunksize=max(1, len(docs) // (PDF_WORKERS * 4))))
+        except (BrokenProcessPool, OSError, RuntimeError):
+            discard_parser_pool()
+    return [_render(fmt, c, t, template) for c, t in docs]
+
+
+def unique_filenames(stems, ext: str) -> list[str]:
+    """"<stem>.<ext>" for each stem; repeats become <stem>_2, <stem>_3, … skipping any
+    name already taken, including by another stem ("a", "a", "a_2"). Case-insensitive,
+    for zips unpacked on Windows/macOS."""
+    used, counters, names = set(), {}, []
+    for stem in stems:
+        name, n = f"{stem}.{ext}", counters.get(stem, 1)
+        while name.casefold() in used:
+            n += 1
+            name = f"{stem}_{n}.{ext}"
+        counters[stem] = n
+        used.add(name.casefold())
+        names.append(name)
+    return names
+
+
+def export_zip(docs, fmt: str = "pdf", template: str = DEFAULT_TEMPLATE) -> bytes:
+    """[(file stem, content, title), …] → a zip of rendered files."""
+    docs = list(docs)
+    files = export_batch([(content, title) for _, content, title in docs], fmt, template)
+    buf = io.BytesIO()
+    # PDF and DOCX are compressed already; storing skips a second deflate pass
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        for name, data in zip(unique_filenames([stem for stem, _, _ in docs], fmt), files):
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
 def get_timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -5,6 +5,9 @@ Handles PDF, DOCX, and TXT file extraction.
 
 from __future__ import annotations
 import io
+import os
+import threading
+import time
 from typing import Optional
 
 
@@ -12,18 +15,24 @@ def extract_text_from_file(uploaded_file) -> tuple[str, str]:
     """
     Extract text from an uploaded Streamlit file object.
     Returns (extracted_text, error_message). error_message is empty on success.
+    Pages should prefer src.utils.doc_store.parse_upload, which parses each upload once.
     """
     if uploaded_file is None:
         return "", "No file provided."
+    return extract_text_from_bytes(uploaded_file.getvalue(), uploaded_file.name)
 
-    filename = uploaded_file.name.lower()
-    file_bytes = uploaded_file.read()
 
+def extract_text_from_bytes(file_bytes: bytes, filename: str,
+                            info: Optional[dict] = None) -> tuple[str, str]:
+    """Same as extract_text_from_file, for raw bytes plus the original filename.
+    If `info` is given it receives non-fatal "warnings" and parser stats, and
+    "partial": True when the time limit cut extraction short (not reproducible)."""
+    filename = filename.lower()
     try:
         if filename.endswith(".txt"):
             return _extract_txt(file_bytes), ""
         elif filename.endswith(".pdf"):
-            return _extract_pdf(file_bytes)
+            return _extract_pdf(file_bytes, info)
         elif filename.endswith(".docx"):
             return _extract_docx(file_bytes)
         else:
@@ -42,46 +51,240 @@ def _extract_txt(file_bytes: bytes) -> str:
     return file_bytes.decode("utf-8", errors="replace")
 
 
-def _extract_pdf(file_bytes: bytes) -> tuple[str, str]:
-    """Extract text from PDF using pypdf."""
+# ── PDF ───────────────────────────────────────────────────────────
+# Large PDFs are sharded by page range across a process pool (pypdf is pure Python,
+# so threads would serialise on the GIL). Extraction is bounded by a page cap, a
+# wall-clock budget and a token budget; hitting any of them returns partial text
+# plus a warning instead of stalling the session.
+PDF_MAX_PAGES      = int(os.getenv("ATS_PDF_MAX_PAGES", "30"))
+PDF_MAX_SECONDS    = float(os.getenv("ATS_PDF_MAX_SECONDS", "20"))
+PDF_MAX_TOKENS     = int(os.getenv("ATS_PDF_MAX_TOKENS", "12000"))
+PDF_WORKERS        = int(os.getenv("ATS_PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+_PARALLEL_MIN_PAGES = 8          # below this, pool dispatch costs more than it saves
+_SHARD_PAGES        = 4
+
+_PDF_POOL = None
+_PDF_POOL_LOCK = threading.Lock()
+
+
+def _pdf_pool():
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # Never fork the (multi-threaded) server process.
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _PDF_POOL = ProcessPoolExecutor(PDF_WORKERS, mp_context=multiprocessing.get_context(method))
+        return _PDF_POOL
+
+
+def parser_pool():
+    """The shared parsing process pool (PDF shards, batch uploads)."""
+    return _pdf_pool()
+
+
+def discard_parser_pool() -> None:
+    """Shut down and drop a broken pool; the next parser_pool() call starts a fresh one.
+    Without the shutdown its management thread and any surviving workers would leak."""
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        pool, _PDF_POOL = _PDF_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _pdf_shard(file_bytes: bytes, start: int, end: int, stop_at: float) -> tuple:
+    """Worker: text of pages [start, end). Returns (start, texts, seconds, pid)."""
+    import pypdf
+    t0 = time.perf_counter()
+    reader = pypdf.PdfReader(io.BytesIO(file_bytes))
+    texts = []
+    for i in range(start, end):
+        if time.time() > stop_at:
+            break
+        texts.append(reader.pages[i].extract_text() or "")
+    return start, texts, time.perf_counter() - t0, os.getpid()
+
+
+def _extract_pdf_parallel(file_bytes: bytes, n_pages: int, stop_at: float, add, workers: dict):
+    """Feed pages to add() in order from pool shards. Returns the stop reason ("" when
+    complete), or None if the pool is unusable and the caller should read serially."""
+    from concurrent.futures import TimeoutError as FutureTimeout
+    from concurrent.futures.process import BrokenProcessPool
+    futures = []
+    try:
+        futures = [_pdf_pool().submit(_pdf_shard, file_bytes, s, min(s + _SHARD_PAGES, n_pages), stop_at)
+                   for s in range(0, n_pages, _SHARD_PAGES)]
+        for start, fut in zip(range(0, n_pages, _SHARD_PAGES), futures):   # page order
+            _, texts, secs, pid = fut.result(timeout=max(0.0, stop_at - time.time()))
+            w = workers.setdefault(pid, [0, 0.0]); w[0] += len(texts); w[1] += secs
+            for page_text in texts:
+                if add(page_text):
+                    return "tokens"
+            if len(texts) < min(_SHARD_PAGES, n_pages - start):
+                return "time"
+        return ""
+    except FutureTimeout:
+        return "time"
+    except (BrokenProcessPool, OSError, RuntimeError):
+        discard_parser_pool()
+        return None
+    finally:
+        for fut in futures:
+            fut.cancel()
+
+
+def _extract_pdf(file_bytes: bytes, info: Optional[dict] = None) -> tuple[str, str]:
+    """Extract text from PDF using pypdf. Warnings and throughput land in `info`."""
     try:
         import pypdf
+        from src.core.budget import count_tokens
+    except ImportError:
+        return "", "pypdf not installed. Run: pip install pypdf"
+    info = info if info is not None else {}
+    warnings = info.setdefault("warnings", [])
+    try:
+        t0 = time.perf_counter()
         reader = pypdf.PdfReader(io.BytesIO(file_bytes))
-        text_parts = []
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
-        extracted = "\n".join(text_parts).strip()
+        total = len(reader.pages)
+        n_pages = min(total, PDF_MAX_PAGES)
+        stop_at = time.time() + PDF_MAX_SECONDS
+        pages: list[str] = []
+        tokens, reason, workers = 0, None, {}
+
+        def add(page_text: str) -> bool:
+            nonlocal tokens
+            pages.append(page_text); tokens += count_tokens(page_text)
+            return tokens >= PDF_MAX_TOKENS
+
+        if n_pages >= _PARALLEL_MIN_PAGES and PDF_WORKERS > 1:
+            reason = _extract_pdf_parallel(file_bytes, n_pages, stop_at, add, workers)
+        if reason is None:                      # small file, or the pool broke — read in-process
+            pages.clear(); workers.clear()
+            tokens, reason, t_serial = 0, "", time.perf_counter()
+            for i in range(n_pages):
+                if time.time() > stop_at:
+                    reason = "time"; break
+                if add(reader.pages[i].extract_text() or ""):
+                    reason = "tokens"; break
+            workers[os.getpid()] = [len(pages), time.perf_counter() - t_serial]
+
+        elapsed = time.perf_counter() - t0
+        info["pdf_stats"] = {
+            "pages_total": total, "pages_read": len(pages), "seconds": round(elapsed, 3),
+            "pages_per_sec": round(len(pages) / elapsed, 1) if elapsed else 0.0,
+            "workers": {pid: round(n / secs, 1) if secs else 0.0 for pid, (n, secs) in workers.items()},
+        }
+        if reason == "time":
+            info["partial"] = True
+            warnings.append(f"PDF extraction stopped after {PDF_MAX_SECONDS:g}s — "
+                            f"read {len(pages)} of {total} pages.")
+        elif reason == "tokens":
+            warnings.append(f"Long PDF — kept the first {len(pages)} of {total} pages "
+                            "(enough text for every feature).")
+        elif total > n_pages:
+            warnings.append(f"Only the first {n_pages} of {total} pages were read.")
+
+        extracted = "\n".join(p for p in pages if p).strip()
         if not extracted:
             return "", "Could not extract text from PDF. Try copying the text manually."
         return extracted, ""
-    except ImportError:
-        return "", "pypdf not installed. Run: pip install pypdf"
     except Exception as e:
         return "", f"PDF parse error: {str(e)}"
 
 
+# ── DOCX ──────────────────────────────────────────────────────────
+# Stream-parses word/document.xml straight out of the zip: paragraphs and tables come
+# out in document order, each table row once as "cell | cell", and only the subtree
+# currently being read is held in memory. vMerge continuation cells (which
+# python-docx re-reports with the merged text) are skipped, and text boxes are read
+# once from their DrawingML form, not again from the VML fallback.
+_W  = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+
+def _docx_text(elem) -> str:
+    parts = []
+    for child in elem:
+        tag = child.tag
+        if tag == _W + "t":
+            parts.append(child.text or "")
+        elif tag == _W + "tab":
+            parts.append("\t")
+        elif tag in (_W + "br", _W + "cr"):
+            parts.append("\n")
+        elif tag != _MC + "Fallback":
+            parts.append(_docx_text(child))
+    return "".join(parts)
+
+
+def _iter_docx_blocks(xml_stream):
+    """Yield text lines from a document.xml stream in document order."""
+    from xml.etree.ElementTree import iterparse
+    p_depth, body = 0, None
+    rows: list[list[str]] = []                   # open rows (stack, for nested tables)
+    cell_lines: list[list[str]] = []             # open cells' paragraph text
+    for event, elem in iterparse(xml_stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == _W + "p":
+                p_depth += 1
+            elif tag == _W + "body":
+                body = elem
+            elif tag == _W + "tr":
+                rows.append([])
+            elif tag == _W + "tc":
+                cell_lines.append([])
+            continue
+        if tag == _W + "p":
+            p_depth -= 1
+            if p_depth:                          # paragraph inside a text box — outer p reads it
+                continue
+            text = _docx_text(elem).strip()
+            if cell_lines:
+                if text:
+                    cell_lines[-1].append(text)
+                elem.clear()
+                continue
+            if text:
+                yield text
+            if body is not None:
+                body.clear()                     # finished top-level block — free it
+        elif tag == _W + "tc":
+            lines = cell_lines.pop()
+            merge = elem.find(f"{_W}tcPr/{_W}vMerge")
+            continuation = merge is not None and merge.get(_W + "val") != "restart"
+            if lines and not continuation:
+                rows[-1].append(" ".join(lines))
+            elem.clear()
+        elif tag == _W + "tr":
+            cells = rows.pop()
+            if cells:
+                line = " | ".join(cells)
+                if cell_lines:                   # nested table: the row belongs to the outer cell
+                    cell_lines[-1].append(line)
+                else:
+                    yield line
+            elem.clear()
+        elif tag == _W + "tbl" and not rows and body is not None:
+            body.clear()
+
+
 def _extract_docx(file_bytes: bytes) -> tuple[str, str]:
-    """Extract text from DOCX using python-docx."""
+    """Extract text from DOCX by streaming word/document.xml (no python-docx DOM)."""
+    import zipfile
+    from xml.etree.ElementTree import ParseError
     try:
-        import docx
-        doc = docx.Document(io.BytesIO(file_bytes))
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-        # Also grab table cells
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    if cell.text.strip():
-                        paragraphs.append(cell.text.strip())
-        extracted = "\n".join(paragraphs).strip()
-        if not extracted:
-            return "", "Could not extract text from DOCX file."
-        return extracted, ""
-    except ImportError:
-        return "", "python-docx not installed. Run: pip install python-docx"
-    except Exception as e:
+        with zipfile.ZipFile(io.BytesIO(file_bytes)) as zf, zf.open("word/document.xml") as xml:
+            extracted = "\n".join(_iter_docx_blocks(xml)).strip()
+    except KeyError:
+        return "", "DOCX parse error: word/document.xml not found."
+    except (zipfile.BadZipFile, ParseError) as e:
         return "", f"DOCX parse error: {str(e)}"
+    if not extracted:
+        return "", "Could not extract text from DOCX file."
+    return extracted, ""
 
 
 def clean_text(text: str) -> str:
@@ -0,0 +1,47 @@
+"""
+ATS Resume Studio - Script Run Timing
+Server-side time of full script runs and of fragment reruns, kept in a rolling
+window per name (the same tracker the LLM latency stats use). Set ATS_PERF=1 to
+show p50/p95 in the sidebar; benchmarks/bench_reruns.py reads them directly.
+"""
+from __future__ import annotations
+import functools
+import os
+import time
+from contextlib import contextmanager
+
+from src.core.hedging import LatencyTracker
+
+PERF_ENABLED = os.getenv("ATS_PERF", "") not in ("", "0")
+RUN_TIMES = LatencyTracker(window=500)
+
+
+@contextmanager
+def timed(name: str):
+    """Record the wall time of the block under `name` (also on st.rerun/st.stop)."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        RUN_TIMES.record(name, time.perf_counter() - t0)
+
+
+def timed_fragment(name: str, run_every: float | None = None):
+    """Decorator: st.fragment whose every execution is recorded as 'fragment:<name>'."""
+    import streamlit as st
+
+    def wrap(fn):
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            with timed(f"fragment:{name}"):
+                return fn(*args, **kwargs)
+        return st.fragment(run, run_every=run_every)
+    return wrap
+
+
+def perf_summary() -> str:
+    parts = []
+    for name, s in sorted(RUN_TIMES.stats().items()):
+        p95 = RUN_TIMES.percentile(name, 0.95)
+        parts.append(f"{name} p50 {s['p50'] * 1000:.0f} ms · p95 {p95 * 1000:.0f} ms (n={s['n']})")
+    return "\n".join(parts)
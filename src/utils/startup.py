@@ -0,0 +1,150 @@
+"""
+ATS Resume Studio - Startup & Import Profiler
+Opt-in with ATS_PROFILE_IMPORTS=1 (report to stderr) or ATS_PROFILE_IMPORTS=<file>.
+Every module the app imports is timed and written in `python -X importtime` format
+("import time: self [us] | cumulative | imported package"), followed by a summary
+when the first script run finishes: process age at first paint, time spent in app
+imports, and the slowest imports. Imports made later (a page opened for the first
+time) are appended as they happen.
+
+    python -m src.utils.startup [--top 25]      # import-time report for app + all pages
+"""
+from __future__ import annotations
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+PROFILE_TARGET = os.getenv("ATS_PROFILE_IMPORTS", "")
+
+_records: list[tuple[int, str, int, int]] = []     # (depth, name, self us, cumulative us)
+_written = 0
+_local = threading.local()
+_lock = threading.Lock()
+_installed_at: float | None = None
+_first_paint: float | None = None
+_real_import = builtins.__import__
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level:
+        try:
+            name = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+        except (ImportError, ValueError):
+            pass
+    if name in sys.modules:
+        return _real_import(name, globals, locals, fromlist, level)
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(0)                                  # children's cumulative time
+    t0 = time.perf_counter_ns()
+    try:
+        return _real_import(name, globals, locals, fromlist, level)
+    finally:
+        cum = (time.perf_counter_ns() - t0) // 1000
+        children = stack.pop()
+        if stack:
+            stack[-1] += cum
+        with _lock:
+            _records.append((len(stack), name, cum - children, cum))
+
+
+def install() -> bool:
+    """Start timing imports if ATS_PROFILE_IMPORTS is set. Safe to call every rerun."""
+    global _installed_at
+    if not PROFILE_TARGET or _installed_at is not None:
+        return False
+    _installed_at = time.perf_counter()
+    builtins.__import__ = _timed_import
+    return True
+
+
+def _process_age() -> float | None:
+    """Seconds since this process started (Linux), so interpreter and Streamlit
+    start-up are included, not just our imports."""
+    try:
+        with open("/proc/self/stat") as fh:
+            start_ticks = int(fh.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as fh:
+            uptime = float(fh.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def format_records(records) -> list[str]:
+    return [f"import time: {self_us:>9} | {cum_us:>10} | {'  ' * depth}{name}"
+            for depth, name, self_us, cum_us in records]
+
+
+def summary(records, top: int = 10) -> list[str]:
+    roots = [r for r in records if r[0] == 0]
+    total = sum(r[3] for r in roots)
+    lines = [f"app imports: {total / 1000:.1f} ms across {len(records)} modules"]
+    for depth, name, self_us, cum_us in sorted(records, key=lambda r: -r[3])[:top]:
+        lines.append(f"  {cum_us / 1000:8.1f} ms  {name}")
+    return lines
+
+
+def _emit(lines: list[str]) -> None:
+    if not lines:
+        return
+    if PROFILE_TARGET == "1":
+        print("\n".join(lines), file=sys.stderr, flush=True)
+    else:
+        with open(PROFILE_TARGET, "a", encoding="utf-8") as fh:
+            fh.write("\n".join(lines) + "\n")
+
+
+def run_finished() -> None:
+    """Call at the end of each script run: writes new import records, plus the
+    startup summary after the first run (server-side first paint)."""
+    global _written, _first_paint
+    if _installed_at is None:
+        return
+    with _lock:
+        new, _written = _records[_written:], len(_records)
+    lines = ["import time: self [us] | cumulative | imported package"] if new and not _first_paint else []
+    lines += format_records(new)
+    if _first_paint is None:
+        _first_paint = time.perf_counter()
+        age = _process_age()
+        lines.append(f"first paint: {(_first_paint - _installed_at) * 1000:.0f} ms after app.py started"
+                     + (f", {age:.2f} s after process start" if age is not None else ""))
+        lines += summary(new)
+    _emit(lines)
+
+
+def main(argv=None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(prog="python -m src.utils.startup",
+                                 description="Import-time report for the app and every page")
+    ap.add_argument("--top", type=int, default=25)
+    ap.add_argument("--raw", action="store_true", help="print every import (-X importtime format)")
+    args = ap.parse_args(argv)
+    import streamlit  # noqa: F401  (always loaded before app.py; not ours to count)
+    builtins.__import__ = _timed_import
+    t0 = time.perf_counter()
+    import app  # noqa: F401
+    t1 = time.perf_counter()
+    from src.ui.pages import PAGES
+    per_page = []
+    for label, page in PAGES.items():
+        before = time.perf_counter()
+        _timed_import(page.module)
+        per_page.append((label, time.perf_counter() - before))
+    builtins.__import__ = _real_import
+    if args.raw:
+        print("\n".join(format_records(_records)))
+    print(f"app.py (first paint path): {(t1 - t0) * 1000:.1f} ms")
+    for label, secs in per_page:
+        print(f"  first visit {label:22} +{secs * 1000:6.1f} ms")
+    print("\n".join(summary(_records, args.top)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Tests for the parsed document store (src/utils/doc_store.py)."""
+import pytest
+
+from src.utils import doc_store
+from src.utils.doc_store import DocumentStore, ParsedDocument
+
+RESUME = b"Jane Doe\n\nEXPERIENCE\nEngineer, Acme | 2020 - 2024\n- Built things\n\nSKILLS\nPython\n"
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count parse_document calls; `results` scripts what each call returns."""
+    calls, results = [], []
+    real = doc_store.parse_document
+
+    def parse(data, filename, digest=""):
+        calls.append(filename)
+        return results.pop(0) if results else real(data, filename, digest)
+    monkeypatch.setattr(doc_store, "parse_document", parse)
+    return calls, results
+
+
+def test_good_parse_is_cached_by_content(parses):
+    calls, _ = parses
+    store = DocumentStore()
+    first = store.get_or_parse(RESUME, "a.txt", "u1")
+    again = store.get_or_parse(RESUME, "b.txt", "u2")          # same bytes, another upload
+    assert first.ok and calls == ["a.txt"]
+    assert again.name == "b.txt" and again.text == first.text
+
+
+def test_errors_are_not_cached_across_uploads(parses):
+    calls, results = parses
+    results.append(ParsedDocument("d", "a.txt", error="boom"))
+    store = DocumentStore()
+    assert store.get_or_parse(RESUME, "a.txt", "u1").error == "boom"
+    assert store.get_or_parse(RESUME, "a.txt", "u1").error == "boom"      # rerun: reused
+    assert len(calls) == 1
+    assert store.get_or_parse(RESUME, "a.txt", "u2").ok                   # re-upload: re-parsed
+    assert len(calls) == 2 and store.stats()["documents"] == 1
+
+
+def test_partial_parse_is_not_cached(parses):
+    calls, results = parses
+    results.append(ParsedDocument("d", "a.pdf", "page one", partial=True))
+    store = DocumentStore()
+    assert store.get_or_parse(RESUME, "a.pdf").partial
+    assert store.stats()["documents"] == 0
+    store.put("k", ParsedDocument("d", "a.pdf", "page one", partial=True))
+    assert store.stats()["documents"] == 0
+    store.get_or_parse(RESUME, "a.pdf")                                  # no upload id: parse again
+    assert len(calls) == 2
+
+
+def test_discarding_the_parser_pool_shuts_it_down(monkeypatch):
+    from src.utils import file_parser
+    calls = []
+
+    class Pool:
+        def shutdown(self, wait=True, cancel_futures=False):
+            calls.append((wait, cancel_futures))
+    monkeypatch.setattr(file_parser, "_PDF_POOL", Pool())
+    file_parser.discard_parser_pool()
+    assert calls == [(False, True)] and file_parser._PDF_POOL is None
+    file_parser.discard_parser_pool()                                     # nothing left: no-op
+    assert calls == [(False, True)]
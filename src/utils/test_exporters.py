@@ -0,0 +1,76 @@
+"""Tests for document export (src/utils/exporters.py)."""
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.utils import exporters
+from src.utils.exporters import export_batch, export_zip, text_to_docx_bytes, unique_filenames
+
+def _docx_text(data: bytes) -> str:
+    import docx
+    return "\n".join(p.text for p in docx.Document(io.BytesIO(data)).paragraphs)
+
+
+RESUME = "JANE DOE\njane@example.com\n\nEXPERIENCE\n- Built services – fast\n- Led a team\n\nSKILLS\nPython, SQL"
+
+
+@pytest.mark.parametrize("stems, expected", [
+    (["a", "b"], ["a.pdf", "b.pdf"]),
+    (["a", "a", "a"], ["a.pdf", "a_2.pdf", "a_3.pdf"]),
+    (["a", "a", "a_2"], ["a.pdf", "a_2.pdf", "a_2_2.pdf"]),
+    (["a_2", "a", "a"], ["a_2.pdf", "a.pdf", "a_3.pdf"]),
+    (["CV", "cv"], ["CV.pdf", "cv_2.pdf"]),
+])
+def test_unique_filenames_never_collide(stems, expected):
+    names = unique_filenames(stems, "pdf")
+    assert names == expected
+    assert len({n.casefold() for n in names}) == len(names)
+
+
+def test_batch_matches_single_renders_in_order(monkeypatch):
+    monkeypatch.setattr("src.utils.file_parser.PDF_WORKERS", 1)     # in-process
+    docs = [(f"{RESUME}\n- item {i}", f"Title {i}") for i in range(5)]
+    files = export_batch(docs, "docx")
+    assert [_docx_text(f) for f in files] == \
+        [_docx_text(text_to_docx_bytes(content, title)) for content, title in docs]
+    assert export_batch([], "docx") == []
+
+
+def test_zip_uses_unique_names(monkeypatch):
+    monkeypatch.setattr("src.utils.file_parser.PDF_WORKERS", 1)
+    data = export_zip([("a", RESUME, "R"), ("a", RESUME, "R"), ("a_2", RESUME, "R")], "docx")
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert zf.namelist() == ["a.docx", "a_2.docx", "a_2_2.docx"]
+        assert _docx_text(zf.read("a_2_2.docx")) == _docx_text(text_to_docx_bytes(RESUME, "R"))
+
+
+@pytest.fixture
+def ttf(monkeypatch):
+    """Render with a TTF body font (DejaVu Sans) instead of the core Helvetica."""
+    path = Path("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf")
+    if not path.is_file():
+        pytest.skip("DejaVu Sans not installed")
+    monkeypatch.setattr(exporters, "PDF_FONT", str(path))
+    exporters._pdf_prototype.cache_clear()
+    yield
+    exporters._pdf_prototype.cache_clear()
+
+
+def test_pdf_copies_share_font_tables_but_not_pages(ttf):
+    pytest.importorskip("fpdf")
+    first, style = exporters._new_pdf("classic")
+    second, _ = exporters._new_pdf("classic")
+    proto, _ = exporters._pdf_prototype("classic")
+    first.add_page()
+    assert second.pages == {} and proto.pages == {}
+    for name, font in proto.fonts.items():
+        assert first.fonts[name].cw is font.cw and first.fonts[name].glyph_ids is font.glyph_ids
+        assert first.fonts[name].subset is not font.subset
+        assert first.fonts[name].ttfont is not font.ttfont
+    # each copy subsets its own font: a second document still embeds the glyphs it uses
+    one = exporters.text_to_pdf_bytes(RESUME, "R", "classic")
+    two = exporters.text_to_pdf_bytes("Ωμέγα ünïcödé", "R", "classic")
+    assert one.startswith(b"%PDF") and two.startswith(b"%PDF")
+    assert one == exporters.text_to_pdf_bytes(RESUME, "R", "classic")